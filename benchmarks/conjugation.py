@@ -0,0 +1,53 @@
+"""Cost of conjugating every verb in `verbs.dat`.
+
+    python benchmarks/conjugation.py
+
+The verbs do not fit into the per-verb cache of `get` and `get_all`, so
+these numbers are for conjugating each verb from scratch. `verb table` is
+the full `{form: verb}` table that `Lemmatizer.verbs` is built from.
+"""
+
+import timeit
+from pathlib import Path
+
+from hazm import Conjugation
+from hazm import default_verbs
+from hazm.lemmatizer import _conjugate_verbs
+
+
+def main() -> None:
+    with Path(default_verbs).open(encoding="utf8") as verbs_file:
+        verbs = [line.strip() for line in verbs_file if line.strip()]
+    conjugation = Conjugation()
+    forms = sum(len(conjugation.get_all(verb)) for verb in verbs)
+    print(f"{len(verbs)} verbs, {forms} forms")
+
+    def get_all() -> None:
+        for verb in verbs:
+            conjugation.get_all(verb)
+
+    def get() -> None:
+        for verb in verbs:
+            for negative in (False, True):
+                for passive in (False, True):
+                    conjugation.get(verb, negative, passive)
+
+    def methods() -> None:
+        for verb in verbs:
+            ri, rii = verb.split("#")
+            conjugation.perfective_past(ri)
+            conjugation.negative_passive_subjunctive_imperfective_past_precedent_perfect(ri)
+            conjugation.grammatical_perfective_present(rii)
+
+    for name, function in (("get_all", get_all), ("get", get), ("3 methods", methods)):
+        elapsed = min(timeit.repeat(function, number=1, repeat=5))
+        print(f"{name:<12} {elapsed * 1000:8.1f} ms")
+
+    elapsed = min(
+        timeit.repeat(lambda: _conjugate_verbs(default_verbs, True), number=1, repeat=3),
+    )
+    print(f"{'verb table':<12} {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
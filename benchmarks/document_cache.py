@@ -0,0 +1,61 @@
+"""Effect of a `DocumentCache` on a stream with repeated documents.
+
+A third of the stream repeats earlier documents, as retweets, syndicated
+news and boilerplate footers do in a real ingest:
+
+    python benchmarks/document_cache.py
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from normalizer_throughput import SAMPLE
+
+from hazm import DocumentCache
+from hazm import Normalizer
+
+
+def stream(count: int = 3000) -> list:
+    random.seed(0)
+    sentences = SAMPLE.splitlines()
+    documents = []
+    for i in range(count):
+        if documents and random.random() < 1 / 3:
+            documents.append(random.choice(documents))
+        else:
+            # unique documents: shuffled sentences with a unique number
+            documents.append(" ".join(random.sample(sentences, 2)) + f" {i}")
+    return documents
+
+
+def timed(normalizer: Normalizer, documents: list) -> float:
+    start = time.perf_counter()
+    for document in documents:
+        normalizer.normalize(document)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    documents = stream()
+    print(f"{len(documents)} documents, {len(set(documents))} distinct")
+
+    print(f"{'no cache':<10} {timed(Normalizer(), documents) * 1000:6.0f} ms")
+
+    cache = DocumentCache()
+    print(f"{'memory':<10} {timed(Normalizer(document_cache=cache), documents) * 1000:6.0f} ms, hit rate {cache.info().hit_rate:.1%}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "documents.sqlite")
+        with DocumentCache(path=path) as cache:
+            elapsed = timed(Normalizer(document_cache=cache), documents)
+            print(f"{'sqlite':<10} {elapsed * 1000:6.0f} ms, hit rate {cache.info().hit_rate:.1%}")
+        # a second run starts with an empty memory but a warm store
+        with DocumentCache(path=path) as cache:
+            elapsed = timed(Normalizer(document_cache=cache), documents)
+            print(f"{'rerun':<10} {elapsed * 1000:6.0f} ms, hit rate {cache.info().hit_rate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
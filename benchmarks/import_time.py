@@ -0,0 +1,55 @@
+"""Import time and memory cost of every public name in `hazm`.
+
+Each name is resolved in a fresh interpreter so the measurements do not
+share module caches:
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py Normalizer word_tokenize
+"""
+
+import json
+import subprocess
+import sys
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import hazm
+{access}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([elapsed, rss, len(sys.modules)]))
+"""
+
+
+def measure(name: str = "", repeat: int = 3) -> tuple:
+    access = f"getattr(hazm, {name!r})" if name else ""
+    runs = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, "-c", PROBE.format(access=access)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout,
+        )
+        for _ in range(repeat)
+    ]
+    return min(runs)
+
+
+def main() -> None:
+    import hazm
+
+    names = sys.argv[1:] or sorted(hazm.__all__, key=str.lower)
+    base_time, base_rss, base_modules = measure()
+    print(f"{'import hazm':<24} {base_time * 1000:8.0f} ms {base_rss / 1024:8.1f} MB {base_modules:6d} modules")
+    for name in names:
+        elapsed, rss, modules = measure(name)
+        print(
+            f"{name:<24} {elapsed * 1000:8.0f} ms {rss / 1024:8.1f} MB {modules:6d} modules",
+        )
+
+
+if __name__ == "__main__":
+    main()
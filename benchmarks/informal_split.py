@@ -0,0 +1,35 @@
+"""Speed of `InformalNormalizer.split_token_words` on run-together tokens.
+
+    PYTHONPATH=. python benchmarks/informal_split.py
+
+Words of the lexicon, drawn by their frequency in `words.dat`, are glued
+together in runs of two to five and each run is split; the time grows with
+the number of pieces (letters that do not join the next one end a piece).
+"""
+
+import random
+import time
+
+from hazm import InformalNormalizer
+
+
+def main() -> None:
+    normalizer = InformalNormalizer(seperation_flag=True)
+    words = normalizer.lemmatizer.words
+    rng = random.Random(0)
+    for size in (2, 3, 4, 5):
+        runs = rng.choices(words.keys(), weights=words.counts, k=200 * size)
+        tokens = ["".join(runs[i : i + size]) for i in range(0, len(runs), size)]
+        timings = []
+        for token in tokens:
+            start = time.perf_counter()
+            normalizer.split_token_words(token)
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{size} words  mean {sum(timings) / len(timings) * 1000:8.2f} ms"
+            f"  slowest {max(timings) * 1000:8.2f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Throughput of `WordTokenizer.join_verb_parts` on long token sequences.
+
+    PYTHONPATH=. python benchmarks/join_verb_parts.py
+
+The built-in news sample of `normalizer_throughput.py` is normalized and
+tokenized without joining verbs, and the tokens of all documents are then
+joined as sequences of growing length.
+"""
+
+import time
+
+from normalizer_throughput import SAMPLE
+
+from hazm import Normalizer
+from hazm import WordTokenizer
+
+
+def main() -> None:
+    text = Normalizer().normalize(" ".join(SAMPLE.splitlines() * 200))
+    tokens = WordTokenizer(join_verb_parts=False).tokenize(text)
+    tokenizer = WordTokenizer()
+
+    for length in (100, 10_000, len(tokens)):
+        sequences = [tokens[i:i + length] for i in range(0, len(tokens), length)]
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            for sequence in sequences:
+                tokenizer.join_verb_parts(sequence)
+            best = min(best, time.perf_counter() - start)
+        print(f"{length:>6} tokens per sequence {best * 1000:4.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""`Lemmatizer.lemmatize_sents` against calling `lemmatize` for each token.
+
+    PYTHONPATH=. python benchmarks/lemmatize_sents.py
+    PYTHONPATH=. python benchmarks/lemmatize_sents.py path/to/peykare
+
+Without an argument a tagged corpus the size of Peykare's hand-tagged part
+(10 million tokens) is sampled from the default lexicon: words are drawn by
+their frequency and tagged with their first lexicon tag, a tenth of them
+get a plural ending and a sixth of the tokens are conjugated verbs, drawn
+by Zipf's law. With an
+argument the sentences of the given Peykare corpus are used.
+"""
+
+import random
+import sys
+import time
+
+from hazm import Lemmatizer
+from hazm import PeykareReader
+from hazm import words_list
+
+TOKENS = 10_000_000
+
+TAGS = {"N": "NOUN", "AJ": "ADJ", "ADV": "ADV", "NUM": "NUM", "PRO": "PRON", "P": "ADP"}
+
+
+def sample_corpus(lemmatizer: Lemmatizer) -> list:
+    rng = random.Random(0)
+    words = words_list()
+    tokens = rng.choices(
+        [(word, TAGS.get(tags[0], "NOUN")) for word, _, tags in words],
+        weights=[frequency + 1 for _, frequency, _ in words],
+        k=TOKENS,
+    )
+    # the lexicon has no frequencies of verb forms; they follow Zipf's law
+    verbs = list(lemmatizer.verbs)
+    rng.shuffle(verbs)
+    verbs = rng.choices(verbs, weights=[1 / rank for rank in range(1, len(verbs) + 1)], k=TOKENS // 6 + 1)
+    for i in range(0, TOKENS, 6):
+        tokens[i] = (verbs[i // 6], "VERB")
+    for i in range(1, TOKENS, 10):
+        tokens[i] = (tokens[i][0] + "‌ها", tokens[i][1])
+    return [tokens[i:i + 20] for i in range(0, TOKENS, 20)]
+
+
+def main() -> None:
+    lemmatizer = Lemmatizer()
+    if len(sys.argv) > 1:
+        sentences = list(PeykareReader(sys.argv[1], universal_pos=True).sents())
+    else:
+        sentences = sample_corpus(lemmatizer)
+    size = sum(map(len, sentences))
+    print(f"{len(sentences)} sentences, {size / 1e6:.1f}M tokens")
+
+    for label, function in (
+        ("lemmatize", lambda: [[lemmatizer.lemmatize(word, tag) for word, tag in sentence] for sentence in sentences]),
+        ("lemmatize_sents", lambda: lemmatizer.lemmatize_sents(sentences)),
+    ):
+        start = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - start
+        print(f"{label:<16} {seconds:5.1f} s, {size / seconds / 1e6:4.2f}M tokens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Memory and lookup cost of the word lexicon: plain dict vs `Lexicon`.
+
+Each representation is loaded in a fresh interpreter from the binary cache
+and the growth of its resident set size is reported:
+
+    python benchmarks/lexicon_memory.py
+"""
+
+import json
+import subprocess
+import sys
+
+PROBE = """
+import json, timeit
+from hazm.lexicon import lexicon_path, load_lexicon, read_lexicon
+
+def rss():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * 4096
+
+load_lexicon()  # make sure the binary cache exists
+before = rss()
+if {as_dict}:
+    # the representation used before `Lexicon`
+    keys, counts, tag_indexes, tag_sets, _ = read_lexicon(*lexicon_path())
+    words = dict(zip(keys, zip(counts, map(tag_sets.__getitem__, tag_indexes))))
+    del keys, counts, tag_indexes
+else:
+    words, _ = load_lexicon()
+after = rss()
+contains = min(timeit.repeat("'کتاب' in words", globals=globals(), number=10**6, repeat=5))
+getitem = min(timeit.repeat("words['کتاب']", globals=globals(), number=10**6, repeat=5))
+print(json.dumps([after - before, contains * 1000, getitem * 1000]))
+"""
+
+
+def measure(as_dict: bool) -> list:
+    return json.loads(
+        subprocess.run(
+            [sys.executable, "-c", PROBE.format(as_dict=as_dict)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout,
+    )
+
+
+def main() -> None:
+    print(f"{'':<8} {'RSS':>10} {'in':>10} {'[]':>10}")
+    for label, as_dict in (("dict", True), ("Lexicon", False)):
+        size, contains, getitem = measure(as_dict)
+        print(f"{label:<8} {size / 2**20:7.1f} MB {contains:7.0f} ns {getitem:7.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
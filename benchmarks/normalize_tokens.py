@@ -0,0 +1,43 @@
+"""`Normalizer.normalize_tokens` against normalizing and then tokenizing again.
+
+    PYTHONPATH=. python benchmarks/normalize_tokens.py
+
+Both produce the sentences and tokens of the built-in news sample of
+`normalizer_throughput.py`; the second way is the usual
+`sent_tokenize(normalize(text))` followed by `word_tokenize` on each sentence.
+"""
+
+import time
+
+from normalizer_throughput import SAMPLE
+
+from hazm import Normalizer
+from hazm import SentenceTokenizer
+from hazm import WordTokenizer
+
+
+def main() -> None:
+    documents = SAMPLE.splitlines() * 200
+    normalizer = Normalizer()
+    sentence_tokenizer = SentenceTokenizer()
+    word_tokenizer = WordTokenizer(join_verb_parts=False)
+
+    def retokenize(document: str) -> list:
+        sentences = sentence_tokenizer.tokenize(normalizer.normalize(document))
+        return [word_tokenizer.tokenize(sentence) for sentence in sentences]
+
+    for label, function in (
+        ("normalize + tokenize", retokenize),
+        ("normalize_tokens", normalizer.normalize_tokens),
+    ):
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            for document in documents:
+                function(document)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<21} {best * 1000:4.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
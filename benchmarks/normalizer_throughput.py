@@ -0,0 +1,50 @@
+"""Throughput of `Normalizer.normalize` on news text.
+
+    python benchmarks/normalizer_throughput.py
+    python benchmarks/normalizer_throughput.py news.txt
+
+Without an argument a small built-in sample of unnormalized news text is
+used; otherwise every non-empty line of the given UTF-8 file (e.g. a
+Hamshahri or pn_summary dump) is normalized as one document. The same
+documents are then normalized again, as input that has already been
+through `Normalizer` upstream.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from hazm import Normalizer
+
+SAMPLE = """\
+به گزارش خبرگزاري ها ، رئيس سازمان هواشناسي روز شنبه گفت : « بارش هاي پراکنده در 12 استان کشور تا پايان هفته ادامه خواهد داشت ... »
+وزير اقتصاد در نشست خبري امروز اعلام کرد که نرخ تورم نقطه به نقطه در ماه گذشته به 39.5 درصد رسيده است و دولت براي کنترل آن برنامه دارد.
+زمين لرزه اي به بزرگي 4.6 ريشتر صبح امروز حوالي شهرستان سرپل ذهاب را لرزاند ؛ اين زمين لرزه خسارت جاني نداشته است .
+تيم ملي فوتبال ايران در ديداري دوستانه با نتيجه 2 بر 1 از حريف خود پيروز شد و بازيکنان پس از بازي گفتند که آماده ي مسابقات هستند.
+قيمت هر گرم طلاي 18 عيار در بازار تهران امروز با 3% کاهش نسبت به هفته گذشته معامله مي شود و کارشناسان مي گويند اين روند ادامه دارد.
+"""
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        with Path(sys.argv[1]).open(encoding="utf8") as news:
+            documents = [line.strip() for line in news if line.strip()]
+    else:
+        documents = SAMPLE.splitlines() * 200
+    size = sum(map(len, documents))
+
+    normalizer = Normalizer()
+    print(f"{len(documents)} documents, {size / 1000:.0f}k characters")
+    for label in ("raw", "normalized"):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            for document in documents:
+                normalizer.normalize(document)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<11} {best * 1000:4.0f} ms, {len(documents) / best:5.0f} documents/s, {size / best / 1000:4.0f}k characters/s")
+        documents = list(map(normalizer.normalize, documents))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""`Pipeline` against wiring the components by hand.
+
+    PYTHONPATH=. python benchmarks/pipeline.py
+    PYTHONPATH=. python benchmarks/pipeline.py pos_tagger.model
+
+The built-in news sample of `normalizer_throughput.py` is normalized,
+split into sentences and words and lemmatized; with a POS tagger model the
+sentences are tagged too. By hand, each document goes through
+`sent_tokenize(normalize(text))`, `word_tokenize`, `tag_sents` and
+`lemmatize` on its own.
+"""
+
+import sys
+import time
+
+from normalizer_throughput import SAMPLE
+
+from hazm import Lemmatizer
+from hazm import Normalizer
+from hazm import Pipeline
+from hazm import POSTagger
+from hazm import sent_tokenize
+from hazm import word_tokenize
+
+
+def main() -> None:
+    documents = SAMPLE.splitlines() * 200
+    normalizer = Normalizer()
+    lemmatizer = Lemmatizer()
+    tagger = POSTagger(model=sys.argv[1]) if len(sys.argv) > 1 else None
+
+    def by_hand(texts: list) -> None:
+        for text in texts:
+            sentences = [word_tokenize(sentence) for sentence in sent_tokenize(normalizer.normalize(text))]
+            if tagger is None:
+                [[lemmatizer.lemmatize(word) for word in sentence] for sentence in sentences]
+            else:
+                tagged = tagger.tag_sents(sentences)
+                [[lemmatizer.lemmatize(word, tag) for word, tag in sentence] for sentence in tagged]
+
+    pipelines = {
+        f"pipeline n_jobs={n_jobs}": Pipeline(tagger=tagger, lemmatizer=lemmatizer, n_jobs=n_jobs)
+        for n_jobs in (1, 2)
+    }
+    for label, function in (
+        ("by hand", by_hand),
+        *((label, lambda texts, p=pipeline: list(p.pipe(texts))) for label, pipeline in pipelines.items()),
+    ):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            function(documents)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<17} {best * 1000:4.0f} ms")
+
+    timings = pipelines["pipeline n_jobs=1"].timings
+    print(", ".join(f"{stage} {seconds / 3 * 1000:.0f} ms" for stage, seconds in timings.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Cost of `Normalizer.decrease_repeated_chars` on pathological inputs.
+
+    python benchmarks/repeated_chars.py
+
+The running time should grow linearly with the size of the input:
+
+- `elongated`: a social-media post where every word is elongated
+  («سلاااام خوووبی»).
+- `distinct`: elongated words that are all different, so no decision can
+  be reused.
+- `no repeats`: one very long word without any repeated letter.
+"""
+
+import time
+
+from hazm import Normalizer
+
+LETTERS = "آابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی"
+
+
+def elongated(size: int) -> str:
+    return " ".join(["سلاااااام", "خووووبی", "چطوررررری", "عاااالی"] * (size // 4))
+
+
+def distinct(size: int) -> str:
+    return " ".join(
+        LETTERS[i % 32] + LETTERS[i // 32 % 32] * 4 + LETTERS[i // 1024 % 32]
+        for i in range(size)
+    )
+
+
+def no_repeats(size: int) -> str:
+    return "".join(LETTERS[i % 32] + LETTERS[(i + 1) % 32] for i in range(size * 4))
+
+
+def main() -> None:
+    normalizer = Normalizer(
+        correct_spacing=False, seperate_mi=False, decrease_repeated_chars=True,
+    )
+    print(f"{'words':>8} {'elongated':>12} {'distinct':>12} {'no repeats':>12}")
+    for size in (1000, 4000, 16000):
+        timings = []
+        for generate in (elongated, distinct, no_repeats):
+            text = generate(size)
+            start = time.perf_counter()
+            normalizer.decrease_repeated_chars(text)
+            timings.append(time.perf_counter() - start)
+        print(f"{size:>8}" + "".join(f" {timing * 1000:9.1f} ms" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Peak memory of `SentenceTokenizer.tokenize` vs `tokenize_stream` on a large file.
+
+A file of repeated news text is written to a temporary directory and split
+into sentences in a fresh interpreter, once read whole and once streamed;
+the growth of the peak resident set size is reported:
+
+    python benchmarks/sentence_stream.py [megabytes]
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from normalizer_throughput import SAMPLE
+
+PROBE = """
+import json, resource, time
+from hazm import SentenceTokenizer
+
+tokenizer = SentenceTokenizer()
+tokenizer.tokenize("سلام. دنیا")
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+with open({path!r}, encoding="utf8") as source, open({path!r} + ".{stream}", "w", encoding="utf8") as target:
+    if {stream}:
+        for sentence in tokenizer.tokenize_stream(source):
+            target.write(sentence + "\\n")
+    else:
+        for sentence in tokenizer.tokenize(source.read()):
+            target.write(sentence + "\\n")
+elapsed = time.perf_counter() - start
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([(after - before) * 1024, elapsed]))
+"""
+
+
+def measure(path: str, stream: bool) -> list:
+    return json.loads(
+        subprocess.run(
+            [sys.executable, "-c", PROBE.format(path=path, stream=stream)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout,
+    )
+
+
+def main() -> None:
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "news.txt")
+        paragraph = SAMPLE + "\n"
+        Path(path).write_text(paragraph * int(megabytes * 2**20 / len(paragraph.encode())), encoding="utf8")
+        print(f"{Path(path).stat().st_size / 2**20:.0f} MB of text")
+        for label, stream in (("tokenize", False), ("tokenize_stream", True)):
+            peak, elapsed = measure(path, stream)
+            print(f"{label:<16} peak +{peak / 2**20:6.1f} MB  {elapsed:5.1f} s")
+        same = Path(path + ".True").read_text(encoding="utf8") == Path(path + ".False").read_text(encoding="utf8")
+        print("outputs are identical" if same else "outputs differ")
+
+
+if __name__ == "__main__":
+    main()
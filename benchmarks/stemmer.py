@@ -0,0 +1,46 @@
+"""Throughput of `Stemmer.stem` and `Stemmer.stem_many`.
+
+    PYTHONPATH=. python benchmarks/stemmer.py
+
+Every word of the default lexicon is stemmed bare and with a few common
+endings. `stem_many` then stems the tokens of the built-in news sample of
+`normalizer_throughput.py`, which repeat as words of real text do.
+"""
+
+import time
+from typing import Callable
+
+from normalizer_throughput import SAMPLE
+
+from hazm import Normalizer
+from hazm import Stemmer
+from hazm import WordTokenizer
+from hazm import words_list
+
+
+def best_of(function: Callable, *args: object) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    stemmer = Stemmer()
+    words = [word for word, _, _ in words_list()]
+    words += [word + end for word in words[::10] for end in ("ها", "‌هایشان", "ی", "ترین", "ۀ")]
+    tokens = WordTokenizer().tokenize(Normalizer().normalize(" ".join(SAMPLE.splitlines() * 200)))
+
+    seconds = best_of(lambda: [stemmer.stem(word) for word in words])
+    print(f"stem       {len(words)} words  {seconds * 1000:4.0f} ms, {seconds / len(words) * 1e9:4.0f} ns/word")
+    seconds = best_of(lambda: [stemmer.stem(token) for token in tokens])
+    print(f"stem       {len(tokens)} tokens {seconds * 1000:4.0f} ms")
+    if hasattr(stemmer, "stem_many"):
+        seconds = best_of(stemmer.stem_many, tokens)
+        print(f"stem_many  {len(tokens)} tokens {seconds * 1000:4.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
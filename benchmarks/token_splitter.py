@@ -0,0 +1,37 @@
+"""Speed of `TokenSplitter` on run-together tokens.
+
+    PYTHONPATH=. python benchmarks/token_splitter.py
+
+Words of the lexicon, drawn by their frequency in `words.dat`, are glued
+together in runs of one, two and three and each run is split with
+`split_token_words` (two-way) and with `split_token` (up to three parts).
+"""
+
+import random
+import time
+
+from hazm import TokenSplitter
+
+
+def main() -> None:
+    splitter = TokenSplitter()
+    words = splitter.words
+    rng = random.Random(0)
+    for size in (1, 2, 3):
+        runs = rng.choices(words.keys(), weights=words.counts, k=3000 * size)
+        tokens = ["".join(runs[i : i + size]) for i in range(0, len(runs), size)]
+        methods = [("split_token_words", splitter.split_token_words)]
+        if hasattr(splitter, "split_token"):
+            methods.append(("split_token", splitter.split_token))
+        for name, method in methods:
+            best = float("inf")
+            for _ in range(3):
+                start = time.perf_counter()
+                for token in tokens:
+                    method(token)
+                best = min(best, time.perf_counter() - start)
+            print(f"{size} words  {name:<18} {best / len(tokens) * 1e6:6.0f} µs/token")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Memory and lookup cost of the verb forms: materialized table vs `VerbAnalyzer`.
+
+Each representation is loaded in a fresh interpreter (the table from its
+binary cache) and the memory it allocates is reported, with the time of
+looking up 100,000 verb forms and 100,000 lexicon words the way
+`Lemmatizer.lemmatize` does:
+
+    PYTHONPATH=. python benchmarks/verb_analyzer.py
+"""
+
+import json
+import subprocess
+import sys
+
+PROBE = """
+import json, random, time, tracemalloc
+from hazm import Lemmatizer, WordTokenizer, clear_resources
+
+rng = random.Random(0)
+forms = rng.sample(sorted(Lemmatizer().verbs), 100000)  # also fills the binary cache
+words = rng.sample(sorted(WordTokenizer().words), 100000)
+clear_resources()
+lemmatizer = Lemmatizer(verb_analyzer={analyzer})
+start = time.perf_counter()
+lemmatizer.verbs
+load = time.perf_counter() - start
+
+# the memory of the verbs alone: the lexicons are loaded before tracing
+clear_resources()
+lemmatizer = Lemmatizer(verb_analyzer={analyzer})
+tracemalloc.start()
+verbs = lemmatizer.verbs
+size = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+timings = []
+for sample in (forms, words):
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for word in sample:
+            word in verbs and verbs[word]
+        best = min(best, time.perf_counter() - start)
+    timings.append(best / len(sample))
+print(json.dumps([size, load, *timings]))
+"""
+
+
+def measure(analyzer: bool) -> list:
+    return json.loads(
+        subprocess.run(
+            [sys.executable, "-c", PROBE.format(analyzer=analyzer)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout,
+    )
+
+
+def main() -> None:
+    print(f"{'':<13} {'memory':>10} {'load':>10} {'verbs':>10} {'words':>10}")
+    for label, analyzer in (("table", False), ("VerbAnalyzer", True)):
+        size, load, forms, words = measure(analyzer)
+        print(
+            f"{label:<13} {size / 2**20:7.1f} MB {load * 1000:7.0f} ms"
+            f" {forms * 1e9:7.0f} ns {words * 1e9:7.0f} ns",
+        )
+
+
+if __name__ == "__main__":
+    main()
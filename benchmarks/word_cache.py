@@ -0,0 +1,74 @@
+"""Effect of the word-level memo (`cache_size`) on a Zipfian token stream.
+
+Documents are sampled from the lexicon with Zipf-distributed word
+frequencies, as in real text, and normalized and lemmatized with and
+without the memo:
+
+    python benchmarks/word_cache.py
+"""
+
+import random
+import time
+
+from hazm import Lemmatizer
+from hazm import Normalizer
+from hazm import words_list
+
+
+def documents(count: int = 2000, length: int = 40) -> list:
+    random.seed(0)
+    words = [word for word, _, _ in words_list()]
+    random.shuffle(words)
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    stream = random.choices(words, weights, k=count * length)
+    # inflected, elongated and «می» words so that every cached decision,
+    # including the stemmer fallback of the lemmatizer, is exercised
+    suffixes = ["‌ها", "‌های", "ی", "‌ترین", "ان"]
+    stream = [
+        word + word[-1] * 3 if i % 97 == 0
+        else "می" + word if i % 89 == 0
+        else word + suffixes[i % 5] if i % 3 == 0
+        else word
+        for i, word in enumerate(stream)
+    ]
+    return [" ".join(stream[i : i + length]) for i in range(0, len(stream), length)]
+
+
+def timed(function, items) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    texts = documents()
+    tokens = " ".join(texts).split()
+    print(f"{len(texts)} documents, {len(tokens)} tokens, {len(set(tokens))} distinct")
+
+    for cache_size in (0, 4096, 65536):
+        normalizer = Normalizer(cache_size=cache_size)
+        lemmatizer = Lemmatizer(cache_size=cache_size)
+        lemmatizer.lemmatize(tokens[0])
+        normalize = timed(normalizer.normalize, texts)
+        lemmatize = timed(lemmatizer.lemmatize, tokens)
+        # statistics of a single pass
+        for memo in [*normalizer.caches.values(), lemmatizer.cache]:
+            if memo is not None:
+                memo.clear()
+        for text in texts:
+            normalizer.normalize(text)
+        for token in tokens:
+            lemmatizer.lemmatize(token)
+        print(f"cache_size={cache_size:<6} normalize {normalize * 1000:6.0f} ms   lemmatize {lemmatize * 1000:5.0f} ms")
+        for name, memo in [*normalizer.caches.items(), ("lemmatize", lemmatizer.cache)]:
+            if memo is not None:
+                info = memo.info()
+                print(f"    {name:<24} hit rate {info.hits / max(info.hits + info.misses, 1):5.1%}, {info.evictions} evictions")
+
+
+if __name__ == "__main__":
+    main()
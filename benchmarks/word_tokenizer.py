@@ -0,0 +1,46 @@
+"""Throughput of `WordTokenizer.tokenize` for each of its options.
+
+    PYTHONPATH=. python benchmarks/word_tokenizer.py
+
+The built-in news sample of `normalizer_throughput.py` is normalized once
+and then tokenized with the default options, with each option on its own
+and with all of them.
+"""
+
+import time
+
+from normalizer_throughput import SAMPLE
+
+from hazm import Normalizer
+from hazm import WordTokenizer
+
+OPTIONS = [
+    "join_abbreviations",
+    "separate_emoji",
+    "replace_links",
+    "replace_ids",
+    "replace_emails",
+    "replace_numbers",
+    "replace_hashtags",
+]
+
+
+def main() -> None:
+    documents = list(map(Normalizer().normalize, SAMPLE.splitlines() * 200))
+    combinations = [{}] + [{option: True} for option in OPTIONS]
+    combinations.append(dict.fromkeys(OPTIONS, True))
+
+    for options in combinations:
+        tokenizer = WordTokenizer(join_verb_parts=False, **options)
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            for document in documents:
+                tokenizer.tokenize(document)
+            best = min(best, time.perf_counter() - start)
+        label = "all" if len(options) > 1 else next(iter(options), "default")
+        print(f"{label:<18} {best * 1000:4.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
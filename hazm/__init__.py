@@ -1,6 +1,13 @@
 # ruff: noqa
-"""entry point for the package."""
+"""entry point for the package.
 
+Public names are resolved lazily (PEP 562): `import hazm` only loads the
+lightweight utilities, and each class is imported from its module on first
+access. So `from hazm import Normalizer` never pulls in gensim, fasttext,
+scikit-learn or the corpus readers.
+"""
+
+import importlib
 from typing import List
 
 from hazm.utils import default_verbs
@@ -9,34 +16,127 @@ from hazm.utils import stopwords_list
 from hazm.utils import words_list
 from hazm.utils import maketrans
 from hazm.utils import regex_replace
-from hazm.utils import words_list
 from hazm.utils import NUMBERS
 from hazm.utils import informal_verbs
 from hazm.utils import informal_words
 from hazm.utils import abbreviations
 
-from hazm.sequence_tagger import IOBTagger
-from hazm.sequence_tagger import SequenceTagger
-
-from hazm.pos_tagger import POSTagger
-
-from hazm.stemmer import Stemmer
-from hazm.word_tokenizer import WordTokenizer
-
-from hazm.lemmatizer import Conjugation
-from hazm.lemmatizer import Lemmatizer
-
-from hazm.normalizer import Normalizer
+_lazy_imports = {
+    "CacheInfo": "hazm.cache",
+    "DocumentCache": "hazm.cache",
+    "Memo": "hazm.cache",
+    "Lexicon": "hazm.lexicon",
+    "build_lexicon": "hazm.lexicon",
+    "load_lexicon": "hazm.lexicon",
+    "load_verb_forms": "hazm.lexicon",
+    "FrozenDict": "hazm.resources",
+    "clear_resources": "hazm.resources",
+    "shared_resource": "hazm.resources",
+    "IOBTagger": "hazm.sequence_tagger",
+    "SequenceTagger": "hazm.sequence_tagger",
+    "POSTagger": "hazm.pos_tagger",
+    "Stemmer": "hazm.stemmer",
+    "WordTokenizer": "hazm.word_tokenizer",
+    "Conjugation": "hazm.lemmatizer",
+    "Lemmatizer": "hazm.lemmatizer",
+    "VerbAnalyzer": "hazm.lemmatizer",
+    "Normalizer": "hazm.normalizer",
+    "Chunker": "hazm.chunker",
+    "RuleBasedChunker": "hazm.chunker",
+    "tree2brackets": "hazm.chunker",
+    "SentenceTokenizer": "hazm.sentence_tokenizer",
+    "PeykareReader": "hazm.corpus_readers",
+    "BijankhanReader": "hazm.corpus_readers",
+    "DadeganReader": "hazm.corpus_readers",
+    "UniversalDadeganReader": "hazm.corpus_readers",
+    "DegarbayanReader": "hazm.corpus_readers",
+    "HamshahriReader": "hazm.corpus_readers",
+    "MirasTextReader": "hazm.corpus_readers",
+    "PersicaReader": "hazm.corpus_readers",
+    "QuranReader": "hazm.corpus_readers",
+    "SentiPersReader": "hazm.corpus_readers",
+    "TNewsReader": "hazm.corpus_readers",
+    "TreebankReader": "hazm.corpus_readers",
+    "VerbValencyReader": "hazm.corpus_readers",
+    "PersianPlainTextReader": "hazm.corpus_readers",
+    "WikipediaReader": "hazm.corpus_readers",
+    "MizanReader": "hazm.corpus_readers",
+    "NerReader": "hazm.corpus_readers",
+    "NaabReader": "hazm.corpus_readers",
+    "ArmanReader": "hazm.corpus_readers",
+    "FaSpellReader": "hazm.corpus_readers",
+    "PnSummaryReader": "hazm.corpus_readers",
+    "DependencyParser": "hazm.dependency_parser",
+    "MaltParser": "hazm.dependency_parser",
+    "TurboParser": "hazm.dependency_parser",
+    "SentEmbedding": "hazm.embedding",
+    "WordEmbedding": "hazm.embedding",
+    "InformalLemmatizer": "hazm.informal_normalizer",
+    "InformalNormalizer": "hazm.informal_normalizer",
+    "TokenSplitter": "hazm.token_splitter",
+    "Document": "hazm.pipeline",
+    "Pipeline": "hazm.pipeline",
+}
+
+_submodules = {
+    "cache",
+    "chunker",
+    "corpus_readers",
+    "dependency_parser",
+    "embedding",
+    "informal_normalizer",
+    "lemmatizer",
+    "lexicon",
+    "normalizer",
+    "pipeline",
+    "pos_tagger",
+    "resources",
+    "sentence_tokenizer",
+    "sequence_tagger",
+    "stemmer",
+    "token_splitter",
+    "utils",
+    "word_tokenizer",
+}
+
+__all__ = [
+    "default_verbs",
+    "default_words",
+    "stopwords_list",
+    "words_list",
+    "maketrans",
+    "regex_replace",
+    "NUMBERS",
+    "informal_verbs",
+    "informal_words",
+    "abbreviations",
+    "sent_tokenize",
+    "word_tokenize",
+    *_lazy_imports,
+]
+
+
+def __getattr__(name: str):
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+    elif name in _submodules:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | _submodules)
 
-from hazm.chunker import Chunker
-from hazm.chunker import RuleBasedChunker
-from hazm.chunker import tree2brackets
-
-from hazm.sentence_tokenizer import SentenceTokenizer
 
 def sent_tokenize(text: str) -> List[str]:
     """Sentence Tokenizer."""
     if not hasattr(sent_tokenize, "tokenizer"):
+        from hazm.sentence_tokenizer import SentenceTokenizer
+
         sent_tokenize.tokenizer = SentenceTokenizer()
     return sent_tokenize.tokenizer.tokenize(text)
 
@@ -44,42 +144,7 @@ def sent_tokenize(text: str) -> List[str]:
 def word_tokenize(sentence: str) -> List[str]:
     """Word Tokenizer."""
     if not hasattr(word_tokenize, "tokenizer"):
+        from hazm.word_tokenizer import WordTokenizer
+
         word_tokenize.tokenizer = WordTokenizer()
     return word_tokenize.tokenizer.tokenize(sentence)
-
-from hazm.corpus_readers import PeykareReader
-from hazm.corpus_readers import BijankhanReader
-from hazm.corpus_readers import DadeganReader
-from hazm.corpus_readers import UniversalDadeganReader
-from hazm.corpus_readers import DegarbayanReader
-from hazm.corpus_readers import HamshahriReader
-from hazm.corpus_readers import MirasTextReader
-from hazm.corpus_readers import PersicaReader
-from hazm.corpus_readers import QuranReader
-from hazm.corpus_readers import SentiPersReader
-from hazm.corpus_readers import TNewsReader
-from hazm.corpus_readers import TreebankReader
-from hazm.corpus_readers import VerbValencyReader
-from hazm.corpus_readers import PersianPlainTextReader
-from hazm.corpus_readers import WikipediaReader
-from hazm.corpus_readers import MizanReader
-from hazm.corpus_readers import NerReader
-from hazm.corpus_readers import NaabReader
-from hazm.corpus_readers import ArmanReader
-from hazm.corpus_readers import FaSpellReader
-from hazm.corpus_readers import PnSummaryReader
-
-
-from hazm.dependency_parser import DependencyParser
-from hazm.dependency_parser import MaltParser
-from hazm.dependency_parser import TurboParser
-
-from hazm.embedding import SentEmbedding
-from hazm.embedding import WordEmbedding
-
-from hazm.informal_normalizer import InformalLemmatizer
-from hazm.informal_normalizer import InformalNormalizer
-
-from hazm.token_splitter import TokenSplitter
-
-
@@ -0,0 +1,286 @@
+"""این ماژول شامل ابزارهایی برای به‌خاطرسپردن نتایج تکراری است.
+
+بسامد واژه‌ها در متن‌های واقعی از قانون زیف پیروی می‌کند؛ یعنی تعداد کمی از
+واژه‌ها بخش بزرگی از متن را می‌سازند. اجزایی مثل
+[Normalizer][hazm.Normalizer] و [Lemmatizer][hazm.Lemmatizer] برای هر واژه
+تصمیم‌هایی می‌گیرند که فقط به خودِ واژه و واژگان بستگی دارد؛ پس با
+به‌خاطرسپردن این تصمیم‌ها در یک حافظهٔ محدود، بیشتر آن‌ها دیگر تکرار نمی‌شوند.
+در سطحی بالاتر، [DocumentCache][hazm.cache.DocumentCache] نتیجهٔ پردازش
+متن‌های تکراری (مثل بازنشرها و پانویس‌های ثابت) را نگه می‌دارد.
+
+"""
+
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    """آمار یک حافظهٔ نهان.
+
+    Attributes:
+        hits: تعداد دفعاتی که نتیجه در حافظه پیدا شد.
+        misses: تعداد دفعاتی که نتیجه در حافظه نبود و محاسبه شد.
+        evictions: تعداد نتایجی که برای باز کردن جا از حافظه حذف شدند.
+        size: تعداد نتایجِ موجود در حافظه.
+        maxsize: ظرفیت حافظه.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self: "CacheInfo") -> float:
+        """نسبت برخوردها به کل درخواست‌ها."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class Memo(Generic[T]):
+    """تابع را با حافظه‌ای محدود به روش LRU به‌خاطر می‌سپارد.
+
+    وقتی حافظه پر شود، نتیجه‌ای که مدت بیشتری استفاده نشده حذف می‌شود.
+    تابع باید برای ورودی‌های یکسان خروجی یکسان داشته باشد و ورودی‌هایش
+    hashable باشند. در مسیرهای پرتکرار می‌توان به‌جای خودِ شیء، `cached` را
+    فراخوانی کرد که سربارِ کمتری دارد.
+
+    Examples:
+        >>> memo = Memo(str.upper, maxsize=2)
+        >>> memo('a'), memo('a'), memo('b'), memo('c')
+        ('A', 'A', 'B', 'C')
+        >>> memo.info()
+        CacheInfo(hits=1, misses=3, evictions=1, size=2, maxsize=2)
+
+    Args:
+        function: تابعی که نتایجش باید به‌خاطر سپرده شود.
+        maxsize: حداکثر تعداد نتایجی که نگه داشته می‌شود.
+
+    """
+
+    def __init__(self: "Memo", function: Callable[..., T], maxsize: int) -> None:
+        self.function = function
+        self.maxsize = maxsize
+        self.cached = lru_cache(maxsize)(function)
+
+    def __call__(self: "Memo", *args: object, **kwargs: object) -> T:
+        return self.cached(*args, **kwargs)
+
+    def info(self: "Memo") -> CacheInfo:
+        """آمار حافظه را برمی‌گرداند.
+
+        Returns:
+            تعداد برخوردها، نبودن‌ها و حذف‌ها، و اندازه و ظرفیت حافظه.
+
+        """
+        hits, misses, maxsize, size = self.cached.cache_info()
+        # every miss stores its result, so the misses not in the cache were evicted
+        return CacheInfo(hits, misses, misses - size, size, maxsize)
+
+    def clear(self: "Memo") -> None:
+        """حافظه و آمار آن را پاک می‌کند."""
+        self.cached.cache_clear()
+
+    def __reduce__(self: "Memo") -> Tuple[type, tuple]:
+        # the cached results are not pickled
+        return Memo, (self.function, self.maxsize)
+
+
+def cache_sizes(
+    cache_size: Union[int, Dict[str, int]], names: Tuple[str, ...],
+) -> Dict[str, int]:
+    """ظرفیت حافظهٔ هر یک از تصمیم‌های `names` را برمی‌گرداند.
+
+    Examples:
+        >>> cache_sizes(100, ('a', 'b'))
+        {'a': 100, 'b': 100}
+        >>> cache_sizes({'b': 10}, ('a', 'b'))
+        {'b': 10}
+
+    Args:
+        cache_size: یک عدد برای همهٔ تصمیم‌ها یا دیکشنری‌ای از نام تصمیم به
+            ظرفیت آن. ظرفیت صفر یعنی حافظه‌ای ساخته نشود.
+        names: نام تصمیم‌هایی که می‌توانند به‌خاطر سپرده شوند.
+
+    Returns:
+        دیکشنری نام تصمیم به ظرفیت حافظهٔ آن، فقط برای ظرفیت‌های بزرگ‌تر از صفر.
+
+    Raises:
+        ValueError: اگر نام تصمیمی ناشناخته باشد.
+
+    """
+    if isinstance(cache_size, int):
+        cache_size = dict.fromkeys(names, cache_size)
+
+    unknown = set(cache_size) - set(names)
+    if unknown:
+        msg = f"unknown caches {sorted(unknown)}; expected some of {list(names)}."
+        raise ValueError(msg)
+
+    return {name: size for name, size in cache_size.items() if size > 0}
+
+
+class DocumentCache:
+    """نتیجهٔ پردازش متن‌ها را با کلیدی از چکیدهٔ محتوای آن‌ها نگه می‌دارد.
+
+    نتایج در حافظه‌ای به روش LRU با سقف حجمی `max_bytes` نگه داشته می‌شوند و
+    اگر `path` داده شود، در یک پایگاه دادهٔ SQLite روی دیسک هم ذخیره می‌شوند
+    تا در اجراهای بعدی یا در پردازه‌های دیگر هم در دسترس باشند. یک حافظه را
+    می‌توان بین چند پردازشگر به اشتراک گذاشت؛ زیرا هر پردازشگر با `namespace`
+    خودش (مثلاً چکیدهٔ تنظیماتش) کلیدها را از هم جدا می‌کند. یک حافظه را
+    می‌توان از چند ریسه هم به کار برد.
+
+    Examples:
+        >>> cache = DocumentCache(max_bytes=2**20)
+        >>> cache.lookup('hazm', str.upper), cache.lookup('hazm', str.upper)
+        ('HAZM', 'HAZM')
+        >>> cache.info().hit_rate
+        0.5
+
+    Args:
+        max_bytes: حداکثر حجمِ تقریبیِ نتایجی که در حافظه نگه داشته می‌شود.
+        path: مسیر فایل پایگاه داده برای ذخیرهٔ نتایج روی دیسک.
+
+    """
+
+    def __init__(
+        self: "DocumentCache", max_bytes: int = 64 * 2**20, path: Optional[str] = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.path = path
+        self._entries: OrderedDict = OrderedDict()
+        self._size = self._hits = self._misses = self._evictions = 0
+        # guards the entries, the statistics and the connection, which all
+        # threads share; compute() runs outside of it
+        self._lock = threading.Lock()
+
+        self._store = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            # autocommit with a write-ahead log: every insert is durable
+            # without an fsync, and other processes can read concurrently
+            self._store = sqlite3.connect(
+                path, timeout=60, isolation_level=None, check_same_thread=False,
+            )
+            self._store.execute("PRAGMA journal_mode=WAL")
+            self._store.execute("PRAGMA synchronous=NORMAL")
+            self._store.execute(
+                "CREATE TABLE IF NOT EXISTS documents (key BLOB PRIMARY KEY, value TEXT)",
+            )
+
+    def lookup(
+        self: "DocumentCache",
+        text: str,
+        compute: Callable[[str], str],
+        namespace: bytes = b"",
+    ) -> str:
+        """نتیجهٔ `compute(text)` را از حافظه برمی‌گرداند یا آن را محاسبه و ذخیره می‌کند.
+
+        Args:
+            text: متن ورودی.
+            compute: تابعی که نتیجه را محاسبه می‌کند.
+            namespace: چکیده‌ای حداکثر ۶۴ بایتی که کلیدهای پردازشگرهای مختلف را از هم جدا می‌کند.
+
+        Returns:
+            نتیجهٔ `compute(text)`.
+
+        """
+        key = blake2b(
+            text.encode("utf8", "surrogatepass"), digest_size=16, key=namespace,
+        ).digest()
+
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+
+            if self._store is not None:
+                row = self._store.execute(
+                    "SELECT value FROM documents WHERE key = ?", (key,),
+                ).fetchone()
+                if row is not None:
+                    self._hits += 1
+                    self._remember(key, row[0])
+                    return row[0]
+
+            self._misses += 1
+
+        value = compute(text)
+        with self._lock:
+            self._remember(key, value)
+            if self._store is not None:
+                self._store.execute(
+                    "INSERT OR REPLACE INTO documents VALUES (?, ?)", (key, value),
+                )
+        return value
+
+    def _remember(self: "DocumentCache", key: bytes, value: str) -> None:
+        cost = sys.getsizeof(key) + sys.getsizeof(value)
+        if cost > self.max_bytes:
+            return
+        # threads that missed the same key at once all store their result
+        old_value = self._entries.pop(key, None)
+        if old_value is not None:
+            self._size -= sys.getsizeof(key) + sys.getsizeof(old_value)
+        self._entries[key] = value
+        self._size += cost
+        while self._size > self.max_bytes:
+            old_key, old_value = self._entries.popitem(last=False)
+            self._size -= sys.getsizeof(old_key) + sys.getsizeof(old_value)
+            self._evictions += 1
+
+    def info(self: "DocumentCache") -> CacheInfo:
+        """آمار حافظه را برمی‌گرداند.
+
+        برخوردها شامل نتایجی هم هست که از دیسک خوانده شده‌اند. اندازه و ظرفیت
+        بر حسب بایت است.
+
+        Returns:
+            تعداد برخوردها، نبودن‌ها و حذف‌ها، و حجم و ظرفیت حافظه.
+
+        """
+        return CacheInfo(
+            self._hits, self._misses, self._evictions, self._size, self.max_bytes,
+        )
+
+    def clear(self: "DocumentCache") -> None:
+        """نتایجِ درون حافظه و آمار آن را پاک می‌کند؛ نتایجِ روی دیسک باقی می‌مانند."""
+        with self._lock:
+            self._entries.clear()
+            self._size = self._hits = self._misses = self._evictions = 0
+
+    def close(self: "DocumentCache") -> None:
+        """اتصال به پایگاه داده را می‌بندد."""
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+                self._store = None
+
+    def __enter__(self: "DocumentCache") -> "DocumentCache":
+        return self
+
+    def __exit__(self: "DocumentCache", *_exc_info: object) -> None:
+        self.close()
+
+    def __reduce__(self: "DocumentCache") -> Tuple[type, tuple]:
+        # each process keeps its own memory and connection to the shared store
+        return DocumentCache, (self.max_bytes, self.path)
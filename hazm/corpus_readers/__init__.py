@@ -1,23 +1,43 @@
 # ruff: noqa
 
-from .bijankhan_reader import BijankhanReader
-from .dadegan_reader import DadeganReader
-from .universal_dadegan_reader import UniversalDadeganReader
-from .degarbayan_reader import DegarbayanReader
-from .hamshahri_reader import HamshahriReader
-from .mirastext_reader import MirasTextReader
-from .persica_reader import PersicaReader
-from .peykare_reader import PeykareReader
-from .quran_reader import QuranReader
-from .sentipers_reader import SentiPersReader
-from .tnews_reader import TNewsReader
-from .treebank_reader import TreebankReader
-from .verbvalency_reader import VerbValencyReader
-from .persian_plain_text_reader import PersianPlainTextReader
-from .wikipedia_reader import WikipediaReader
-from .mizan_reader import MizanReader
-from .ner_reader import NerReader
-from .naab_reader import NaabReader
-from .arman_reader import ArmanReader
-from .faspell_reader import FaSpellReader
-from .pn_summary_reader import PnSummaryReader
+import importlib
+from typing import List
+
+_lazy_imports = {
+    "BijankhanReader": "bijankhan_reader",
+    "DadeganReader": "dadegan_reader",
+    "UniversalDadeganReader": "universal_dadegan_reader",
+    "DegarbayanReader": "degarbayan_reader",
+    "HamshahriReader": "hamshahri_reader",
+    "MirasTextReader": "mirastext_reader",
+    "PersicaReader": "persica_reader",
+    "PeykareReader": "peykare_reader",
+    "QuranReader": "quran_reader",
+    "SentiPersReader": "sentipers_reader",
+    "TNewsReader": "tnews_reader",
+    "TreebankReader": "treebank_reader",
+    "VerbValencyReader": "verbvalency_reader",
+    "PersianPlainTextReader": "persian_plain_text_reader",
+    "WikipediaReader": "wikipedia_reader",
+    "MizanReader": "mizan_reader",
+    "NerReader": "ner_reader",
+    "NaabReader": "naab_reader",
+    "ArmanReader": "arman_reader",
+    "FaSpellReader": "faspell_reader",
+    "PnSummaryReader": "pn_summary_reader",
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name: str):
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{_lazy_imports[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
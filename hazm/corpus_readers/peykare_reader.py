@@ -222,21 +222,19 @@ def join_verb_parts(sentence: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
     """
     if not hasattr(join_verb_parts, "tokenizer"):
         join_verb_parts.tokenizer = WordTokenizer()
-    before_verbs, after_verbs, verbe = (
-        join_verb_parts.tokenizer.before_verbs,
-        join_verb_parts.tokenizer.after_verbs,
-        join_verb_parts.tokenizer.verbe,
-    )
-
-    result = [("", "")]
-    for word in reversed(sentence):
-        if word[0] in before_verbs or (
-            result[-1][0] in after_verbs and word[0] in verbe
-        ):
-            result[-1] = (word[0] + "_" + result[-1][0], result[-1][1])
-        else:
-            result.append(word)
-    return list(reversed(result[1:]))
+    ranges = join_verb_parts.tokenizer.verb_part_ranges([word for word, _ in sentence])
+
+    result = []
+    done = 0
+    for start, end in ranges:
+        result += sentence[done:start]
+        # a joined verb keeps the tag of its last part
+        result.append(
+            ("_".join(word for word, _ in sentence[start:end]), sentence[end - 1][1]),
+        )
+        done = end
+    result += sentence[done:]
+    return result
 
 
 class PeykareReader:
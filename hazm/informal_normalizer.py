@@ -1,19 +1,25 @@
 """این ماژول شامل کلاس‌ها و توابعی برای نرمال‌سازی متن‌های محاوره‌ای است."""
 
 
+import math
 import re
 from pathlib import Path
+from typing import FrozenSet
 from typing import List
+from typing import Tuple
 
 from hazm import NUMBERS
+from hazm import FrozenDict
 from hazm import Lemmatizer
 from hazm import Normalizer
 from hazm import SentenceTokenizer
 from hazm import Stemmer
 from hazm import WordTokenizer
 from hazm import default_verbs
+from hazm import default_words
 from hazm import informal_verbs
 from hazm import informal_words
+from hazm import shared_resource
 
 
 class InformalNormalizer(Normalizer):
@@ -122,24 +128,46 @@ class InformalNormalizer(Normalizer):
                 res.remove("")
             return res
 
-        def perm(lst):
-            if len(lst) > 1:
-                up = perm(lst[1:])
-            else:
-                return [lst]
-            res = []
-            for i in up:
-                res.append([lst[0], *i])
-                res.append([lst[0] + i[0]] + i[1:])
-            res.sort(key=len)
-            return res
-
         token = re.sub(r"(.)\1{2,}", r"\1", token)
-        ps = perm(shekan(token))
-        for c in ps:
-            if {self.ilemmatizer.lemmatize(x) for x in c}.issubset(self.words):
-                return " ".join(c)
-        return token
+        pieces = shekan(token)
+        count = len(pieces)
+
+        # whether a run of pieces is a word; each run is lemmatized once
+        checked = {}
+
+        def is_word(start: int, end: int) -> bool:
+            word = "".join(pieces[start:end])
+            if word not in checked:
+                checked[word] = self.ilemmatizer.lemmatize(word) in self.words
+            return checked[word]
+
+        # fewest[start]: the fewest words pieces[start:] can be split into
+        fewest = [math.inf] * count + [0]
+        for start in range(count - 1, -1, -1):
+            fewest[start] = min(
+                (
+                    fewest[end] + 1
+                    for end in range(start + 1, count + 1)
+                    if fewest[end] < math.inf and is_word(start, end)
+                ),
+                default=math.inf,
+            )
+        if fewest[0] == math.inf:
+            return token
+
+        # of the splits into the fewest words, the one with the shortest
+        # words from the start is returned
+        words = []
+        start = 0
+        while start < count:
+            end = next(
+                end
+                for end in range(start + 1, count + 1)
+                if fewest[end] == fewest[start] - 1 and is_word(start, end)
+            )
+            words.append("".join(pieces[start:end]))
+            start = end
+        return " ".join(words)
 
     def normalized_word(self: "InformalNormalizer", word: str) -> List[str]:
         """اشکال مختلف نرمالایزشدهٔ کلمه را برمی‌گرداند.
@@ -809,27 +837,36 @@ class InformalLemmatizer(Lemmatizer):
         """__init__."""
         super().__init__(**kargs)
 
-        temp = []
-        self.words = set(self.words.keys())
-        for word in self.words:
-            if word.endswith("ً"):
-                temp.append(word[:-1])
+        # Lemmatizer reads its words from default_words whatever words_file is
+        self.words, self.verbs = shared_resource(
+            "informal_lexicon",
+            self._informal_lexicon,
+            default_words,
+            self.verbs_file,
+            self.joined_verb_parts,
+            informal_words,
+            informal_verbs,
+        )
 
-        self.words.update(temp)
+    def _informal_lexicon(
+        self: "InformalLemmatizer", *_config: str,
+    ) -> Tuple[FrozenSet[str], FrozenDict]:
+        words = set(self.words.keys())
+        words.update([word[:-1] for word in words if word.endswith("ً")])
 
-        temp = {}
+        verbs = dict(self.verbs)
         for verb in self.verbs:
             if verb.endswith("د"):
-                temp[verb[:-1] + "ن"] = self.verbs[verb]
-
-        self.verbs.update(temp)
+                verbs[verb[:-1] + "ن"] = self.verbs[verb]
 
         with Path.open(informal_verbs, encoding="utf8") as vf:
             for f, i, _flag in [x.strip().split(" ", 2) for x in vf]:
-                self.verbs.update({x: f for x in self.iconjugations(i)})
+                verbs.update({x: f for x in self.iconjugations(i)})
 
         with Path.open(informal_words, encoding="utf8") as wf:
-            self.words.update([x.strip().split(" ", 1)[0] for x in wf])
+            words.update([x.strip().split(" ", 1)[0] for x in wf])
+
+        return frozenset(words), FrozenDict(verbs)
 
     def iconjugations(self: "InformalNormalizer", verb: str):
         """iconjugations."""
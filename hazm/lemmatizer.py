@@ -11,12 +11,77 @@
 """
 
 
+import hashlib
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
 
+from hazm import FrozenDict
+from hazm import Memo
 from hazm import Stemmer
 from hazm import WordTokenizer
 from hazm import default_verbs
 from hazm import default_words
+from hazm import load_verb_forms
+from hazm import shared_resource
+
+
+def _conjugate_verbs(verbs_file: str, joined_verb_parts: bool) -> Dict[str, str]:
+    """جدول صورت‌های صرفی افعال را به شکل `{صورت صرفی: بن ماضی#بن مضارع}` می‌سازد."""
+    tokenizer = WordTokenizer(words_file=default_words, verbs_file=verbs_file)
+
+    verbs = {"است": "#است"}
+    for verb in tokenizer.verbs:
+        # every verb is conjugated once here, so bypass the per-verb cache
+        verbs.update(dict.fromkeys(_conjugate_verb(verb), verb))
+    if joined_verb_parts:
+        for verb in tokenizer.verbs:
+            bon = verb.split("#")[0]
+            for after_verb in tokenizer.after_verbs:
+                verbs[bon + "ه_" + after_verb] = verb
+                verbs["ن" + bon + "ه_" + after_verb] = verb
+            for before_verb in tokenizer.before_verbs:
+                verbs[before_verb + "_" + bon] = verb
+
+    return verbs
+
+
+def _conjugation_fingerprint() -> bytes:
+    """چکیدهٔ قالب‌های صرف و اجزای افعالِ چندبخشی را برمی‌گرداند.
+
+    جدولِ ذخیره‌شده در کش به این داده‌های کد هم وابسته است؛ پس اگر در نسخه‌ای
+    از هضم تغییر کنند، جدول دوباره ساخته می‌شود.
+
+    """
+    tokenizer = WordTokenizer()
+    data = (
+        _TEMPLATES,
+        _IRREGULAR_FORMS,
+        sorted(tokenizer.after_verbs),
+        sorted(tokenizer.before_verbs),
+    )
+    return hashlib.sha256(repr(data).encode("utf8")).digest()
+
+
+def _verb_forms(verbs_file: str, joined_verb_parts: bool) -> FrozenDict:
+    return FrozenDict(
+        load_verb_forms(
+            verbs_file, joined_verb_parts, _conjugate_verbs, _conjugation_fingerprint(),
+        ),
+    )
+
+
+def _pos_key(pos: str) -> str:
+    # lemmatize only tells apart no tag, verbs, adjectives, pronouns and any
+    # other tag; tags that lemmatize the same share a key
+    if not pos or pos in {"VERB", "PRON"}:
+        return pos
+    return "ADJ" if pos.startswith("ADJ") else "X"
 
 
 class Lemmatizer:
@@ -32,6 +97,11 @@ class Lemmatizer:
             این حال شما می‌توانید فایل موردنظر خود را معرفی کنید. برای آگاهی از
             ساختار این فایل به فایل پیش‌فرض مراجعه کنید.
         joined_verb_parts: اگر `True` باشد افعال چندبخشی را با کاراکتر زیرخط به هم می‌چسباند.
+        cache_size: اگر بزرگ‌تر از صفر باشد ریشهٔ این تعداد از کلماتِ اخیر به
+            خاطر سپرده می‌شود و آمار آن در `cache` در دسترس است.
+        verb_analyzer: اگر `True` باشد به‌جای جدولِ صورت‌های صرفی، افعال با
+            [VerbAnalyzer][hazm.VerbAnalyzer] تحلیل می‌شوند که حافظهٔ بسیار
+            کمتری مصرف می‌کند ولی کندتر است.
 
     """
 
@@ -40,28 +110,63 @@ class Lemmatizer:
         words_file: str = default_words,
         verbs_file: str = default_verbs,
         joined_verb_parts: bool = True,
+        cache_size: int = 0,
+        verb_analyzer: bool = False,
     ) -> None:
         self.words_file = words_file
-        self.verbs = {}
+        self.verbs_file = verbs_file
+        self.joined_verb_parts = joined_verb_parts
+        self.verb_analyzer = verb_analyzer
+        self._verbs = None
         self.stemmer = Stemmer()
         self.conjugation = Conjugation()
 
         tokenizer = WordTokenizer(words_file=default_words, verbs_file=verbs_file)
         self.words = tokenizer.words
 
-        if verbs_file:
-            self.verbs["است"] = "#است"
-            for verb in tokenizer.verbs:
-                for tense in self.conjugation.get_all(verb):
-                    self.verbs[tense] = verb
-            if joined_verb_parts:
-                for verb in tokenizer.verbs:
-                    bon = verb.split("#")[0]
-                    for after_verb in tokenizer.after_verbs:
-                        self.verbs[bon + "ه_" + after_verb] = verb
-                        self.verbs["ن" + bon + "ه_" + after_verb] = verb
-                    for before_verb in tokenizer.before_verbs:
-                        self.verbs[before_verb + "_" + bon] = verb
+        self.cache = None
+        if cache_size > 0:
+            self.cache = Memo(self.lemmatize, cache_size)
+            self.lemmatize = self.cache.cached
+
+    def __getstate__(self: "Lemmatizer") -> dict:
+        state = self.__dict__.copy()
+        state.pop("lemmatize", None)
+        return state
+
+    def __setstate__(self: "Lemmatizer", state: dict) -> None:
+        self.__dict__.update(state)
+        if self.cache is not None:
+            self.lemmatize = self.cache.cached
+
+    @property
+    def verbs(self: "Lemmatizer") -> Mapping:
+        """جدول صورت‌های صرفی افعال به شکل `{صورت صرفی: بن ماضی#بن مضارع}`.
+
+        این جدول در اولین دسترسی از نسخهٔ دودوییِ ذخیره‌شده در پوشهٔ کش
+        بارگذاری می‌شود؛ بنابراین ریشه‌یابیِ کلماتی که فعل نیستند هزینهٔ
+        بارگذاری آن را نمی‌پردازد. با `verb_analyzer=True` به‌جای جدول یک
+        [VerbAnalyzer][hazm.VerbAnalyzer] با همان محتوا برگردانده می‌شود.
+
+        """
+        if self._verbs is None:
+            if not self.verbs_file:
+                self._verbs = {}
+            elif self.verb_analyzer:
+                self._verbs = shared_resource(
+                    "verb_analyzer", VerbAnalyzer, self.verbs_file, self.joined_verb_parts,
+                )
+            else:
+                self._verbs = shared_resource(
+                    "verb_forms", _verb_forms, self.verbs_file, self.joined_verb_parts,
+                )
+        return self._verbs
+
+    @verbs.setter
+    def verbs(self: "Lemmatizer", verbs: Mapping) -> None:
+        self._verbs = verbs
+        if getattr(self, "cache", None) is not None:
+            self.cache.clear()
 
     def lemmatize(self: "Lemmatizer", word: str, pos: str = "") -> str:
         """ریشهٔ کلمه را پیدا می‌کند.
@@ -117,6 +222,616 @@ class Lemmatizer:
 
         return word
 
+    def lemmatize_sents(
+        self: "Lemmatizer",
+        tagged_sents: Iterable[List[Tuple[str, str]]],
+        cache_size: int = 2**16,
+    ) -> List[List[str]]:
+        """ریشهٔ توکن‌های جملاتِ برچسب‌خورده را پیدا می‌کند.
+
+        ورودی همان خروجیِ `POSTagger.tag_sents` است. برچسب‌هایی که روی
+        ریشه‌یابی اثر یکسانی دارند (مثلاً `NOUN` و `NOUN,EZ`) یکی می‌شوند و
+        ریشهٔ هر `(کلمه، برچسب)` فقط یک بار پیدا می‌شود. ریشه‌ها در حافظه‌ای
+        نگه داشته می‌شوند که با رسیدن به `cache_size` خالی می‌شود؛ کلماتِ
+        پرتکرار به‌سرعت دوباره به آن برمی‌گردند.
+
+        Examples:
+            >>> lemmatizer = Lemmatizer()
+            >>> lemmatizer.lemmatize_sents([[('کتاب‌ها', 'NOUN'), ('را', 'ADP'), ('خواندم', 'VERB')], [('کتاب‌ها', 'NOUN,EZ')]])
+            [['کتاب', 'را', 'خواند#خوان'], ['کتاب']]
+
+        Args:
+            tagged_sents: جملات در قالب لیستی از `(توکن، برچسب)`ها.
+            cache_size: حداکثر تعداد ریشه‌هایی که به خاطر سپرده می‌شود.
+
+        Returns:
+            ریشهٔ توکن‌های هر جمله به همان ترتیب.
+
+        """
+        # the lemmas of each key by word; every tag points to its key's dict
+        lemmas: Dict[str, Dict[str, str]] = {}
+        memos: Dict[str, Dict[str, str]] = {}
+        size = 0
+        results = []
+        for sentence in tagged_sents:
+            result = []
+            for word, tag in sentence:
+                memo = memos.get(tag)
+                if memo is None:
+                    memo = memos[tag] = lemmas.setdefault(_pos_key(tag), {})
+                lemma = memo.get(word)
+                if lemma is None:
+                    if size >= cache_size:
+                        for full in lemmas.values():
+                            full.clear()
+                        size = 0
+                    lemma = memo[word] = self.lemmatize(word, _pos_key(tag))
+                    size += 1
+                result.append(lemma)
+            results.append(result)
+        return results
+
+
+# tense: (stem, templates); the templates are separated by "|" and "{}" marks
+# where the past (ri) or present (rii) stem of the verb goes
+_TENSES = {
+    # گذشتهٔ مطلق
+    "perfective_past": ("ri", "{}م|{}ی|{}|{}یم|{}ید|{}ند"),
+    # گذشتهٔ مطلق منفی
+    "negative_perfective_past": ("ri", "ن{}م|ن{}ی|ن{}|ن{}یم|ن{}ید|ن{}ند"),
+    # گذشتهٔ مطلق مجهول
+    "passive_perfective_past": ("ri", "{}ه شدم|{}ه شدی|{}ه شد|{}ه شدیم|{}ه شدید|{}ه شدند"),
+    # گذشتهٔ مطلق مجهول منفی
+    "negative_passive_perfective_past": ("ri", "{}ه نشدم|{}ه نشدی|{}ه نشد|{}ه نشدیم|{}ه نشدید|{}ه نشدند"),
+    # گذشتهٔ پایا
+    "imperfective_past": ("ri", "می‌{}م|می‌{}ی|می‌{}|می‌{}یم|می‌{}ید|می‌{}ند"),
+    # گذشتهٔ پایای منفی
+    "negative_imperfective_past": ("ri", "نمی‌{}م|نمی‌{}ی|نمی‌{}|نمی‌{}یم|نمی‌{}ید|نمی‌{}ند"),
+    # گذشتهٔ پایای مجهول
+    "passive_imperfective_past": ("ri", "{}ه می‌شدم|{}ه می‌شدی|{}ه می‌شد|{}ه می‌شدیم|{}ه می‌شدید|{}ه می‌شدند"),
+    # گذشتهٔ پایای مجهول منفی
+    "negative_passive_imperfective_past": ("ri", "{}ه نمی‌شدم|{}ه نمی‌شدی|{}ه نمی‌شد|{}ه نمی‌شدیم|{}ه نمی‌شدید|{}ه نمی‌شدند"),
+    # گذشتهٔ استمراری
+    "past_progresive": ("ri", "داشتم می‌{}م|داشتی می‌{}ی|داشت می‌{}|داشتیم می‌{}یم|داشتید می‌{}ید|داشتند می‌{}ند"),
+    # گذشتهٔ استمراری مجهول
+    "passive_past_progresive": ("ri", "داشتم {}ه می‌شدم|داشتی {}ه می‌شدی|داشت {}ه می‌شد|داشتیم {}ه می‌شدیم|داشتید {}ه می‌شدید|داشتند {}ه می‌شدند"),
+    # حال کامل
+    "present_perfect": ("ri", "{}ه‌ام|{}ه‌ای|{}ه است|{}ه|{}ه‌ایم|{}ه‌اید|{}ه‌اند"),
+    # حال کامل منفی
+    "negative_present_perfect": ("ri", "ن{}ه‌ام|ن{}ه‌ای|ن{}ه است|ن{}ه|ن{}ه‌ایم|ن{}ه‌اید|ن{}ه‌اند"),
+    # حال کامل التزامی
+    "subjunctive_present_perfect": ("ri", "{}ه باشم|{}ه باشی|{}ه باشد|{}ه باشیم|{}ه باشید|{}ه باشند"),
+    # حال کامل التزامی منفی
+    "negative_subjunctive_present_perfect": ("ri", "ن{}ه باشم|ن{}ه باشی|ن{}ه باشد|ن{}ه باشیم|ن{}ه باشید|ن{}ه باشند"),
+    # حال کامل دستوری
+    "grammatical_present_perfect": ("ri", "{}ه باشم|{}ه باش|{}ه باشد|{}ه باشیم|{}ه باشید|{}ه باشند"),
+    # حال کامل دستوری منفی
+    "negative_grammatical_present_perfect": ("ri", "ن{}ه باشم|ن{}ه باش|ن{}ه باشد|ن{}ه باشیم|ن{}ه باشید|ن{}ه باشند"),
+    # حال کامل مجهول
+    "passive_present_perfect": ("ri", "{}ه شده‌ام|{}ه شده‌ای|{}ه شده است|{}ه شده|{}ه شده‌ایم|{}ه شده‌اید|{}ه شده‌اند"),
+    # حال کامل مجهول منفی
+    "negative_passive_present_perfect": ("ri", "{}ه نشده‌ام|{}ه نشده‌ای|{}ه نشده است|{}ه نشده|{}ه نشده‌ایم|{}ه نشده‌اید|{}ه نشده‌اند"),
+    # حال کامل التزامی مجهول
+    "passive_subjunctive_present_perfect": ("ri", "{}ه شده باشم|{}ه شده باشی|{}ه شده باشد|{}ه شده باشیم|{}ه شده باشید|{}ه شده باشند"),
+    # حال کامل التزامی مجهول منفی
+    "negative_passive_subjunctive_present_perfect": ("ri", "{}ه نشده باشم|{}ه نشده باشی|{}ه نشده باشد|{}ه نشده باشیم|{}ه نشده باشید|{}ه نشده باشند"),
+    # حال کامل دستوری مجهول
+    "passive_grammatical_present_perfect": ("ri", "{}ه شده باشم|{}ه شده باش|{}ه شده باشد|{}ه شده باشیم|{}ه شده باشید|{}ه شده باشند"),
+    # حال کامل دستوری مجهول منفی
+    "negative_passive_grammatical_present_perfect": ("ri", "{}ه نشده باشم|{}ه نشده باش|{}ه نشده باشد|{}ه نشده باشیم|{}ه نشده باشید|{}ه نشده باشند"),
+    # حال کامل پایا
+    "imperfective_present_perfect": ("ri", "می‌{}ه‌ام|می‌{}ه‌ای|می‌{}ه است|می‌{}ه|می‌{}ه‌ایم|می‌{}ه‌اید|می‌{}ه‌اند"),
+    # حال کامل پایای منفی
+    "negative_imperfective_present_perfect": ("ri", "نمی‌{}ه‌ام|نمی‌{}ه‌ای|نمی‌{}ه است|نمی‌{}ه|نمی‌{}ه‌ایم|نمی‌{}ه‌اید|نمی‌{}ه‌اند"),
+    # حال کامل پایای التزامی
+    "subjunctive_imperfective_present_perfect": ("ri", "می‌{}ه باشم|می‌{}ه باشی|می‌{}ه باشد|می‌{}ه باشیم|می‌{}ه باشید|می‌{}ه باشند"),
+    # حال کامل پایای التزامی منفی
+    "negative_subjunctive_imperfective_present_perfect": ("ri", "نمی‌{}ه باشم|نمی‌{}ه باشی|نمی‌{}ه باشد|نمی‌{}ه باشیم|نمی‌{}ه باشید|نمی‌{}ه باشند"),
+    # حال کامل پایای مجهول
+    "passive_imperfective_present_perfect": ("ri", "{}ه می‌شده‌ام|{}ه می‌شده‌ای|{}ه می‌شده است|{}ه می‌شده|{}ه می‌شده‌ایم|{}ه می‌شده‌اید|{}ه می‌شده‌اند"),
+    # حال کامل پایای مجهول منفی
+    "negative_passive_imperfective_present_perfect": ("ri", "{}ه نمی‌شده‌ام|{}ه نمی‌شده‌ای|{}ه نمی‌شده است|{}ه نمی‌شده|{}ه نمی‌شده‌ایم|{}ه نمی‌شده‌اید|{}ه نمی‌شده‌اند"),
+    # حال کامل پایای التزامی مجهول
+    "passive_subjunctive_imperfective_present_perfect": ("ri", "{}ه می‌شده باشم|{}ه می‌شده باشی|{}ه می‌شده باشد|{}ه می‌شده باشیم|{}ه می‌شده باشید|{}ه می‌شده باشند"),
+    # حال کامل پایای التزامی مجهول منفی
+    "negative_passive_subjunctive_imperfective_present_perfect": ("ri", "{}ه نمی‌شده باشم|{}ه نمی‌شده باشی|{}ه نمی‌شده باشد|{}ه نمی‌شده باشیم|{}ه نمی‌شده باشید|{}ه نمی‌شده باشند"),
+    # حال کامل استمراری
+    "present_perfect_progressive": ("ri", "داشته‌ام می‌{}ه‌ام|داشته‌ای می‌{}ه‌ای|داشته است می‌{}ه است|داشته می‌{}ه|داشته‌ایم می‌{}ه‌ایم|داشته‌اید می‌{}ه‌اید|داشته‌اند می‌{}ه‌اند"),
+    # حال کامل استمراری مجهول
+    "passive_present_perfect_progressive": ("ri", "داشته‌ام {}ه می‌شده‌ام|داشته‌ای {}ه می‌شده‌ای|داشته است {}ه می‌شده است|داشته {}ه می‌شده|داشته‌ایم {}ه می‌شده‌ایم|داشته‌اید {}ه می‌شده‌اید|داشته‌اند {}ه می‌شده‌اند"),
+    # گذشتهٔ پیشین
+    "past_precedent": ("ri", "{}ه بودم|{}ه بودی|{}ه بود|{}ه بودیم|{}ه بودید|{}ه بودند"),
+    # گذشتهٔ پیشین منفی
+    "negative_past_precedent": ("ri", "ن{}ه بودم|ن{}ه بودی|ن{}ه بود|ن{}ه بودیم|ن{}ه بودید|ن{}ه بودند"),
+    # گذشتهٔ پیشین مجهول
+    "passive_past_precedent": ("ri", "{}ه شده بودم|{}ه شده بودی|{}ه شده بود|{}ه شده بودیم|{}ه شده بودید|{}ه شده بودند"),
+    # گذشتهٔ پیشین مجهول منفی
+    "negative_passive_past_precedent": ("ri", "{}ه نشده بودم|{}ه نشده بودی|{}ه نشده بود|{}ه نشده بودیم|{}ه نشده بودید|{}ه نشده بودند"),
+    # گذشتهٔ پیشین پایا
+    "imperfective_past_precedent": ("ri", "می‌{}ه بودم|می‌{}ه بودی|می‌{}ه بود|می‌{}ه بودیم|می‌{}ه بودید|می‌{}ه بودند"),
+    # گذشتهٔ پیشین پایای منفی
+    "negative_imperfective_past_precedent": ("ri", "نمی‌{}ه بودم|نمی‌{}ه بودی|نمی‌{}ه بود|نمی‌{}ه بودیم|نمی‌{}ه بودید|نمی‌{}ه بودند"),
+    # گذشتهٔ پیشین پایای مجهول
+    "passive_imperfective_past_precedent": ("ri", "{}ه می‌شده بودم|{}ه می‌شده بودی|{}ه می‌شده بود|{}ه می‌شده بودیم|{}ه می‌شده بودید|{}ه می‌شده بودند"),
+    # گذشتهٔ پیشین پایای مجهول منفی
+    "negative_passive_imperfective_past_precedent": ("ri", "{}ه نمی‌شده بودم|{}ه نمی‌شده بودی|{}ه نمی‌شده بود|{}ه نمی‌شده بودیم|{}ه نمی‌شده بودید|{}ه نمی‌شده بودند"),
+    # گذشتهٔ پیشین استمراری
+    "past_precedent_progressive": ("ri", "داشتم می‌{}ه بودم|داشتی می‌{}ه بودی|داشت می‌{}ه بود|داشتیم می‌{}ه بودیم|داشتید می‌{}ه بودید|داشتند می‌{}ه بودند"),
+    # گذشتهٔ پیشین استمراری مجهول
+    "passive_past_precedent_progressive": ("ri", "داشتم {}ه می‌شده بودم|داشتی {}ه می‌شده بودی|داشت {}ه می‌شده بود|داشتیم {}ه می‌شده بودیم|داشتید {}ه می‌شده بودید|داشتند {}ه می‌شده بودند"),
+    # گذشتهٔ پیشین کامل
+    "past_precedent_perfect": ("ri", "{}ه بوده‌ام|{}ه بوده‌ای|{}ه بوده است|{}ه بوده|{}ه بوده‌ایم|{}ه بوده‌اید|{}ه بوده‌اند"),
+    # گذشتهٔ پیشین کامل منفی
+    "negative_past_precedent_perfect": ("ri", "ن{}ه بوده‌ام|ن{}ه بوده‌ای|ن{}ه بوده است|ن{}ه بوده|ن{}ه بوده‌ایم|ن{}ه بوده‌اید|ن{}ه بوده‌اند"),
+    # گذشتهٔ پیشین کامل التزامی
+    "subjunctive_past_precedent_perfect": ("ri", "{}ه بوده باشم|{}ه بوده باشی|{}ه بوده باشد|{}ه بوده باشیم|{}ه بوده باشید|{}ه بوده باشند"),
+    # گذشتهٔ پیشین کامل التزامی منفی
+    "negative_subjunctive_past_precedent_perfect": ("ri", "ن{}ه بوده باشم|ن{}ه بوده باشی|ن{}ه بوده باشد|ن{}ه بوده باشیم|ن{}ه بوده باشید|ن{}ه بوده باشند"),
+    # گذشتهٔ پیشین کامل دستوری
+    "grammatical_past_precedent_perfect": ("ri", "{}ه بوده باشم|{}ه بوده باش|{}ه بوده باشد|{}ه بوده باشیم|{}ه بوده باشید|{}ه بوده باشند"),
+    # گذشتهٔ پیشین کامل دستوری منفی
+    "negative_grammatical_past_precedent_perfect": ("ri", "ن{}ه بوده باشم|ن{}ه بوده باش|ن{}ه بوده باشد|ن{}ه بوده باشیم|ن{}ه بوده باشید|ن{}ه بوده باشند"),
+    # گذشتهٔ پیشین کامل مجهول
+    "passive_past_precedent_perfect": ("ri", "{}ه شده بوده‌ام|{}ه شده بوده‌ای|{}ه شده بوده است|{}ه شده بوده|{}ه شده بوده‌ایم|{}ه شده بوده‌اید|{}ه شده بوده‌اند"),
+    # گذشتهٔ پیشین کامل مجهول منفی
+    "negative_passive_past_precedent_perfect": ("ri", "{}ه نشده بوده‌ام|{}ه نشده بوده‌ای|{}ه نشده بوده است|{}ه نشده بوده|{}ه نشده بوده‌ایم|{}ه نشده بوده‌اید|{}ه نشده بوده‌اند"),
+    # گذشتهٔ پیشین کامل التزامی مجهول
+    "passive_subjunctive_past_precedent_perfect": ("ri", "{}ه شده بوده باشم|{}ه شده بوده باشی|{}ه شده بوده باشد|{}ه شده بوده باشیم|{}ه شده بوده باشید|{}ه شده بوده باشند"),
+    # گذشتهٔ پیشین کامل التزامی مجهول منفی
+    "negative_passive_subjunctive_past_precedent_perfect": ("ri", "{}ه نشده بوده باشم|{}ه نشده بوده باشی|{}ه نشده بوده باشد|{}ه نشده بوده باشیم|{}ه نشده بوده باشید|{}ه نشده بوده باشند"),
+    # گذشتهٔ پیشین کامل دستوری مجهول
+    "passive_grammatical_past_precedent_perfect": ("ri", "{}ه شده بوده باشم|{}ه شده بوده باش|{}ه شده بوده باشد|{}ه شده بوده باشیم|{}ه شده بوده باشید|{}ه شده بوده باشند"),
+    # گذشتهٔ پیشین کامل دستوری مجهول منفی
+    "negative_passive_grammatical_past_precedent_perfect": ("ri", "{}ه نشده بوده باشم|{}ه نشده بوده باش|{}ه نشده بوده باشد|{}ه نشده بوده باشیم|{}ه نشده بوده باشید|{}ه نشده بوده باشند"),
+    # گذشتهٔ پیشین کامل پایا
+    "imperfective_past_precedent_perfect": ("ri", "می‌{}ه بوده‌ام|می‌{}ه بوده‌ای|می‌{}ه بوده است|می‌{}ه بوده|می‌{}ه بوده‌ایم|می‌{}ه بوده‌اید|می‌{}ه بوده‌اند"),
+    # گذشتهٔ پیشین کامل پایای منفی
+    "negative_imperfective_past_precedent_perfect": ("ri", "نمی‌{}ه بوده‌ام|نمی‌{}ه بوده‌ای|نمی‌{}ه بوده است|نمی‌{}ه بوده|نمی‌{}ه بوده‌ایم|نمی‌{}ه بوده‌اید|نمی‌{}ه بوده‌اند"),
+    # گذشتهٔ پیشین کامل پایای التزامی
+    "subjunctive_imperfective_past_precedent_perfect": ("ri", "می‌{}ه بوده باشم|می‌{}ه بوده باشی|می‌{}ه بوده باشد|می‌{}ه بوده باشیم|می‌{}ه بوده باشید|می‌{}ه بوده باشند"),
+    # گذشتهٔ پیشین کامل پایای التزامی منفی
+    "negative_subjunctive_imperfective_past_precedent_perfect": ("ri", "نمی‌{}ه بوده باشم|نمی‌{}ه بوده باشی|نمی‌{}ه بوده باشد|نمی‌{}ه بوده باشیم|نمی‌{}ه بوده باشید|نمی‌{}ه بوده باشند"),
+    # گذشتهٔ پیشین کامل پایای مجهول
+    "passive_imperfective_past_precedent_perfect": ("ri", "{}ه می‌شده بوده‌ام|{}ه می‌شده بوده‌ای|{}ه می‌شده بوده است|{}ه می‌شده بوده|{}ه می‌شده بوده‌ایم|{}ه می‌شده بوده‌اید|{}ه می‌شده بوده‌اند"),
+    # گذشتهٔ پیشین کامل پایای مجهول منفی
+    "negative_passive_imperfective_past_precedent_perfect": ("ri", "{}ه نمی‌شده بوده‌ام|{}ه نمی‌شده بوده‌ای|{}ه نمی‌شده بوده است|{}ه نمی‌شده بوده|{}ه نمی‌شده بوده‌ایم|{}ه نمی‌شده بوده‌اید|{}ه نمی‌شده بوده‌اند"),
+    # گذشتهٔ پیشین کامل پایای التزامی مجهول
+    "passive_subjunctive_imperfective_past_precedent_perfect": ("ri", "{}ه می‌شده بوده باشم|{}ه می‌شده بوده باشی|{}ه می‌شده بوده باشد|{}ه می‌شده بوده باشیم|{}ه می‌شده بوده باشید|{}ه می‌شده بوده باشند"),
+    # گذشتهٔ پیشین کامل پایای التزامی مجهول منفی
+    "negative_passive_subjunctive_imperfective_past_precedent_perfect": ("ri", "{}ه نمی‌شده بوده باشم|{}ه نمی‌شده بوده باشی|{}ه نمی‌شده بوده باشد|{}ه نمی‌شده بوده باشیم|{}ه نمی‌شده بوده باشید|{}ه نمی‌شده بوده باشند"),
+    # گذشتهٔ پیشین کامل استمراری
+    "past_precedent_perfect_progressive": ("ri", "داشته‌ام می‌{}ه بوده‌ام|داشته‌ای می‌{}ه بوده‌ای|داشته است می‌{}ه بوده است|داشته می‌{}ه بوده|داشته‌ایم می‌{}ه بوده‌ایم|داشته‌اید می‌{}ه بوده‌اید|داشته‌اند می‌{}ه بوده‌اند"),
+    # گذشتهٔ پیشین کامل استمراری مجهول
+    "passive_past_precedent_perfect_progressive": ("ri", "داشته‌ام {}ه می‌شده بوده‌ام|داشته‌ای {}ه می‌شده بوده‌ای|داشته است {}ه می‌شده بوده است|داشته {}ه می‌شده بوده|داشته‌ایم {}ه می‌شده بوده‌ایم|داشته‌اید {}ه می‌شده بوده‌اید|داشته‌اند {}ه می‌شده بوده‌اند"),
+    # حال مطلق
+    "perfective_present": ("rii", "{}م|{}ی|{}د|{}یم|{}ید|{}ند"),
+    # حال مطلق منفی
+    "negative_perfective_present": ("rii", "ن{}م|ن{}ی|ن{}د|ن{}یم|ن{}ید|ن{}ند"),
+    # حال مطلق التزامی
+    "subjunctive_perfective_present": ("rii", "ب{}م|ب{}ی|ب{}د|ب{}یم|ب{}ید|ب{}ند"),
+    # حال مطلق التزامی منفی
+    "negative_subjunctive_perfective_present": ("rii", "ن{}م|ن{}ی|ن{}د|ن{}یم|ن{}ید|ن{}ند"),
+    # حال مطلق دستوری
+    "grammatical_perfective_present": ("rii", "ب{}م|ب{}ی|ب{}د|ب{}یم|ب{}ید|ب{}ند"),
+    # حال مطلق دستوری منفی
+    "negative_grammatical_perfective_present": ("rii", "ن{}م|ن{}ی|ن{}د|ن{}یم|ن{}ید|ن{}ند"),
+    # حال مطلق مجهول
+    "passive_perfective_present": ("ri", "{}ه شوم|{}ه شوی|{}ه شود|{}ه شویم|{}ه شوید|{}ه شوند"),
+    # حال مطلق مجهول منفی
+    "negative_passive_perfective_present": ("ri", "{}ه نشوم|{}ه نشوی|{}ه نشود|{}ه نشویم|{}ه نشوید|{}ه نشوند"),
+    # حال مطلق التزامی مجهول
+    "passive_subjunctive_perfective_present": ("ri", "{}ه بشوم|{}ه بشوی|{}ه بشود|{}ه بشویم|{}ه بشوید|{}ه بشوند"),
+    # حال مطلق التزامی مجهول منفی
+    "negative_passive_subjunctive_perfective_present": ("ri", "{}ه نشوم|{}ه نشوی|{}ه نشود|{}ه نشویم|{}ه نشوید|{}ه نشوند"),
+    # حال مطلق دستوری مجهول
+    "passive_grammatical_perfective_present": ("ri", "{}ه بشوم|{}ه بشو|{}ه بشود|{}ه بشویم|{}ه بشوید|{}ه بشوند"),
+    # حال مطلق دستوری مجهول منفی
+    "negative_passive_grammatical_perfective_present": ("ri", "{}ه نشوم|{}ه نشو|{}ه نشود|{}ه نشویم|{}ه نشوید|{}ه نشوند"),
+    # حال پایا
+    "imperfective_present": ("rii", "می‌{}م|می‌{}ی|می‌{}د|می‌{}یم|می‌{}ید|می‌{}ند"),
+    # حال پایای منفی
+    "negative_imperfective_present": ("rii", "نمی‌{}م|نمی‌{}ی|نمی‌{}د|نمی‌{}یم|نمی‌{}ید|نمی‌{}ند"),
+    # حال پایای مجهول
+    "passive_imperfective_present": ("ri", "{}ه می‌شوم|{}ه می‌شوی|{}ه می‌شود|{}ه می‌شویم|{}ه می‌شوید|{}ه می‌شوند"),
+    # حال پایای مجهول منفی
+    "negative_passive_imperfective_present": ("ri", "{}ه نمی‌شوم|{}ه نمی‌شوی|{}ه نمی‌شود|{}ه نمی‌شویم|{}ه نمی‌شوید|{}ه نمی‌شوند"),
+    # حال استمراری
+    "present_progressive": ("rii", "دارم می‌{}م|داری می‌{}ی|دارد می‌{}د|داریم می‌{}یم|دارید می‌{}ید|دارند می‌{}ند"),
+    # حال استمراری مجهول
+    "passive_present_progressive": ("ri", "دارم {}ه می‌شوم|داری {}ه می‌شوی|دارد {}ه می‌شود|داریم {}ه می‌شویم|دارید {}ه می‌شوید|دارند {}ه می‌شوند"),
+    # آیندهٔ مطلق
+    "perfective_future": ("ri", "خواهم {}|خواهی {}|خواهد {}|خواهیم {}|خواهید {}|خواهند {}"),
+    # آیندهٔ مطلق منفی
+    "negative_perfective_future": ("ri", "نخواهم {}|نخواهی {}|نخواهد {}|نخواهیم {}|نخواهید {}|نخواهند {}"),
+    # آیندهٔ مطلق مجهول
+    "passive_perfective_future": ("ri", "{}ه خواهم شد|{}ه خواهی شد|{}ه خواهد شد|{}ه خواهیم شد|{}ه خواهید شد|{}ه خواهند شد"),
+    # آیندهٔ مطلق مجهول منفی
+    "negative_passive_perfective_future": ("ri", "{}ه نخواهم شد|{}ه نخواهی شد|{}ه نخواهد شد|{}ه نخواهیم شد|{}ه نخواهید شد|{}ه نخواهند شد"),
+    # آیندهٔ پایا
+    "imperfective_future": ("ri", "می‌خواهم {}|می‌خواهی {}|می‌خواهد {}|می‌خواهیم {}|می‌خواهید {}|می‌خواهند {}"),
+    # آیندهٔ پایای منفی
+    "negative_imperfective_future": ("ri", "نمی‌خواهم {}|نمی‌خواهی {}|نمی‌خواهد {}|نمی‌خواهیم {}|نمی‌خواهید {}|نمی‌خواهند {}"),
+    # آیندهٔ پایای مجهول
+    "passive_imperfective_future": ("ri", "{}ه می‌خواهم شد|{}ه می‌خواهی شد|{}ه می‌خواهد شد|{}ه می‌خواهیم شد|{}ه می‌خواهید شد|{}ه می‌خواهند شد"),
+    # آیندهٔ پایای مجهول منفی
+    "negative_passive_imperfective_future": ("ri", "{}ه نمی‌خواهم شد|{}ه نمی‌خواهی شد|{}ه نمی‌خواهد شد|{}ه نمی‌خواهیم شد|{}ه نمی‌خواهید شد|{}ه نمی‌خواهند شد"),
+    # آیندهٔ پیشین
+    "future_precedent": ("ri", "{}ه خواهم بود|{}ه خواهی بود|{}ه خواهد بود|{}ه خواهیم بود|{}ه خواهید بود|{}ه خواهند بود"),
+    # آیندهٔ پیشین منفی
+    "negative_future_precedent": ("ri", "ن{}ه خواهم بود|ن{}ه خواهی بود|ن{}ه خواهد بود|ن{}ه خواهیم بود|ن{}ه خواهید بود|ن{}ه خواهند بود"),
+    # آیندهٔ پیشین مجهول
+    "passive_future_precedent": ("ri", "{}ه شده خواهم بود|{}ه شده خواهی بود|{}ه شده خواهد بود|{}ه شده خواهیم بود|{}ه شده خواهید بود|{}ه شده خواهند بود"),
+    # آیندهٔ پیشین مجهول منفی
+    "negative_passive_future_precedent": ("ri", "{}ه نشده خواهم بود|{}ه نشده خواهی بود|{}ه نشده خواهد بود|{}ه نشده خواهیم بود|{}ه نشده خواهید بود|{}ه نشده خواهند بود"),
+    # آیندهٔ پیشین پایا
+    "future_precedent_imperfective": ("ri", "می‌{}ه خواهم بود|می‌{}ه خواهی بود|می‌{}ه خواهد بود|می‌{}ه خواهیم بود|می‌{}ه خواهید بود|می‌{}ه خواهند بود"),
+    # آیندهٔ پیشین پایای منفی
+    "negative_future_precedent_imperfective": ("ri", "نمی‌{}ه خواهم بود|نمی‌{}ه خواهی بود|نمی‌{}ه خواهد بود|نمی‌{}ه خواهیم بود|نمی‌{}ه خواهید بود|نمی‌{}ه خواهند بود"),
+    # آیندهٔ پیشین پایای مجهول
+    "passive_future_precedent_imperfective": ("ri", "{}ه می‌شده خواهم بود|{}ه می‌شده خواهی بود|{}ه می‌شده خواهد بود|{}ه می‌شده خواهیم بود|{}ه می‌شده خواهید بود|{}ه می‌شده خواهند بود"),
+    # آیندهٔ پیشین پایای مجهول منفی
+    "negative_passive_future_precedent_imperfective": ("ri", "{}ه نمی‌شده خواهم بود|{}ه نمی‌شده خواهی بود|{}ه نمی‌شده خواهد بود|{}ه نمی‌شده خواهیم بود|{}ه نمی‌شده خواهید بود|{}ه نمی‌شده خواهند بود"),
+}
+
+# «دید#بین» has irregular imperatives: «ببین» and «نبین» instead of «ببینی» and «نبینی»
+_IRREGULAR_FORMS = {
+    "grammatical_perfective_present": {"ببینی": "ببین"},
+    "negative_grammatical_perfective_present": {"نبینی": "نبین"},
+}
+
+# (negative, passive): tenses returned by Conjugation.get
+_GET_TENSES = {
+    (True, True): (
+        "negative_passive_perfective_past",
+        "negative_passive_imperfective_past",
+        "negative_passive_present_perfect",
+        "negative_passive_subjunctive_present_perfect",
+        "negative_passive_grammatical_present_perfect",
+        "negative_passive_imperfective_present_perfect",
+        "negative_passive_subjunctive_imperfective_present_perfect",
+        "negative_passive_past_precedent",
+        "negative_passive_imperfective_past_precedent",
+        "negative_passive_past_precedent_perfect",
+        "negative_passive_subjunctive_past_precedent_perfect",
+        "negative_passive_grammatical_past_precedent_perfect",
+        "negative_passive_imperfective_past_precedent_perfect",
+        "negative_passive_subjunctive_imperfective_past_precedent_perfect",
+        "negative_passive_perfective_present",
+        "negative_passive_subjunctive_perfective_present",
+        "negative_passive_grammatical_perfective_present",
+        "negative_passive_imperfective_present",
+        "negative_passive_perfective_future",
+        "negative_passive_imperfective_future",
+        "negative_passive_future_precedent",
+        "negative_passive_future_precedent_imperfective",
+    ),
+    (False, True): (
+        "passive_perfective_past",
+        "passive_imperfective_past",
+        "passive_past_progresive",
+        "passive_present_perfect",
+        "passive_subjunctive_present_perfect",
+        "passive_grammatical_present_perfect",
+        "passive_imperfective_present_perfect",
+        "passive_subjunctive_imperfective_present_perfect",
+        "passive_present_perfect_progressive",
+        "passive_past_precedent",
+        "passive_imperfective_past_precedent",
+        "passive_past_precedent_progressive",
+        "passive_past_precedent_perfect",
+        "passive_subjunctive_past_precedent_perfect",
+        "passive_grammatical_past_precedent_perfect",
+        "passive_imperfective_past_precedent_perfect",
+        "passive_subjunctive_imperfective_past_precedent_perfect",
+        "passive_past_precedent_perfect_progressive",
+        "passive_perfective_present",
+        "passive_subjunctive_perfective_present",
+        "passive_grammatical_perfective_present",
+        "passive_imperfective_present",
+        "passive_present_progressive",
+        "passive_perfective_future",
+        "passive_imperfective_future",
+        "passive_future_precedent",
+        "passive_future_precedent_imperfective",
+    ),
+    (True, False): (
+        "negative_perfective_past",
+        "negative_imperfective_past",
+        "negative_present_perfect",
+        "negative_subjunctive_present_perfect",
+        "negative_grammatical_present_perfect",
+        "negative_imperfective_present_perfect",
+        "negative_subjunctive_imperfective_present_perfect",
+        "negative_past_precedent",
+        "negative_imperfective_past_precedent",
+        "negative_past_precedent_perfect",
+        "negative_subjunctive_past_precedent_perfect",
+        "negative_grammatical_past_precedent_perfect",
+        "negative_imperfective_past_precedent_perfect",
+        "negative_subjunctive_imperfective_past_precedent_perfect",
+        "negative_perfective_present",
+        "negative_subjunctive_perfective_present",
+        "negative_grammatical_perfective_present",
+        "negative_imperfective_present",
+        "negative_perfective_future",
+        "negative_imperfective_future",
+        "negative_future_precedent",
+        "negative_future_precedent_imperfective",
+    ),
+    (False, False): (
+        "perfective_past",
+        "imperfective_past",
+        "past_progresive",
+        "present_perfect",
+        "subjunctive_present_perfect",
+        "grammatical_present_perfect",
+        "imperfective_present_perfect",
+        "subjunctive_imperfective_present_perfect",
+        "present_perfect_progressive",
+        "past_precedent",
+        "imperfective_past_precedent",
+        "past_precedent_progressive",
+        "past_precedent_perfect",
+        "subjunctive_past_precedent_perfect",
+        "grammatical_past_precedent_perfect",
+        "imperfective_past_precedent_perfect",
+        "subjunctive_imperfective_past_precedent_perfect",
+        "past_precedent_perfect_progressive",
+        "perfective_present",
+        "subjunctive_perfective_present",
+        "grammatical_perfective_present",
+        "imperfective_present",
+        "present_progressive",
+        "perfective_future",
+        "imperfective_future",
+        "future_precedent",
+        "future_precedent_imperfective",
+    ),
+}
+
+_TEMPLATES = {
+    tense: (stem == "rii", [tuple(template.split("{}")) for template in templates.split("|")])
+    for tense, (stem, templates) in _TENSES.items()
+}
+
+
+def _conjugate(tense: str, stem: str) -> List[str]:
+    """فعل را در زمانِ `tense` از روی قالب‌های آن صرف می‌کند."""
+    forms = [prefix + stem + suffix for prefix, suffix in _TEMPLATES[tense][1]]
+    irregular = _IRREGULAR_FORMS.get(tense)
+    if irregular:
+        forms = [irregular.get(form, form) for form in forms]
+    return forms
+
+
+def _compile_plan(
+    tenses: Iterable[str],
+) -> Tuple[List[Tuple[bool, str, str]], List[Tuple[int, Dict[str, str]]]]:
+    """قالب‌های چند زمان را پشت سر هم می‌چیند تا فعل در یک گذر صرف شود.
+
+    خروجی فهرست `(present, prefix, suffix)` قالب‌ها، با مصدر در ابتدای آن، و
+    جایگاه صورت‌های بی‌قاعده است.
+
+    """
+    entries = [(False, "", "ن")]
+    irregular = []
+    for tense in tenses:
+        present, templates = _TEMPLATES[tense]
+        if tense in _IRREGULAR_FORMS:
+            irregular += [
+                (position, _IRREGULAR_FORMS[tense])
+                for position in range(len(entries), len(entries) + len(templates))
+            ]
+        entries += [(present, prefix, suffix) for prefix, suffix in templates]
+    return entries, irregular
+
+
+_PLANS = {
+    None: _compile_plan(_TENSES),
+    **{key: _compile_plan(tenses) for key, tenses in _GET_TENSES.items()},
+}
+
+
+def _conjugate_verb(verb: str, plan: Optional[Tuple[bool, bool]] = None) -> Tuple[str, ...]:
+    """صورت‌های صرفی فعل را در یک گذر می‌سازد.
+
+    Args:
+        verb: فعل به‌صورت بن ماضی#بن مضارع؛ مانند: دید#بین.
+        plan: `(negative, passive)` برای صورت‌های [get()][hazm.Conjugation.get] و
+            `None` برای همهٔ صورت‌ها.
+
+    """
+    ri, rii = verb.split("#")
+    entries, irregular = _PLANS[plan]
+    forms = [prefix + (rii if present else ri) + suffix for present, prefix, suffix in entries]
+    for position, mapping in irregular:
+        forms[position] = mapping.get(forms[position], forms[position])
+    return tuple(forms)
+
+
+# the tables of recently conjugated verbs; each holds a few hundred forms
+_cached_conjugate_verb = lru_cache(maxsize=128)(_conjugate_verb)
+
+
+def _add_affix(trie: dict, letters: Iterable[str], affix: str) -> None:
+    node = trie
+    for letter in letters:
+        node = node.setdefault(letter, {})
+    node[""] = affix
+
+
+def _affixes(trie: dict, letters: Iterable[str]) -> List[str]:
+    """وندهایی از `trie` که `letters` با آن‌ها شروع می‌شود، از کوتاه به بلند."""
+    node = trie
+    affixes = [node[""]] if "" in node else []
+    for letter in letters:
+        node = node.get(letter)
+        if node is None:
+            break
+        if "" in node:
+            affixes.append(node[""])
+    return affixes
+
+
+class VerbAnalyzer(Mapping):
+    """این کلاس صورت‌های صرفی افعال را بدون ساختنِ جدولِ آن‌ها تحلیل می‌کند.
+
+    برای هر کلمه، پیشوندها (مانند «می‌»، «نمی‌»، «ب» و «ن») و پسوندهای
+    قالب‌های صرفی (شناسه‌ها و افعال کمکی) از دو سرِ آن جدا می‌شوند و آنچه
+    می‌ماند در میانِ بن‌های ماضی و مضارعِ فایل افعال جست‌وجو می‌شود؛ بنابراین
+    حافظهٔ آن متناسب با تعداد افعال است و نه تعداد صورت‌های صرفی. نتیجه
+    دقیقاً همان جدولِ [Lemmatizer.verbs][hazm.Lemmatizer.verbs] است و می‌توان
+    آن را مانند یک دیکشنریِ فقط‌خواندنی به کار برد؛ اما پیمایشِ آن همهٔ افعال
+    را صرف می‌کند.
+
+    Examples:
+        >>> analyzer = VerbAnalyzer()
+        >>> analyzer['می‌روم']
+        'رفت#رو'
+        >>> analyzer['نچشیده_است']
+        'چشید#چش'
+        >>> 'کتاب' in analyzer
+        False
+
+    Args:
+        verbs_file: مسیر فایل افعال.
+        joined_verb_parts: اگر `True` باشد افعال چندبخشیِ چسبیده با زیرخط هم
+            تحلیل می‌شوند.
+
+    """
+
+    def __init__(
+        self: "VerbAnalyzer",
+        verbs_file: str = default_verbs,
+        joined_verb_parts: bool = True,
+    ) -> None:
+        tokenizer = WordTokenizer(words_file=default_words, verbs_file=verbs_file)
+        self.verbs_file = verbs_file
+        self.joined_verb_parts = joined_verb_parts
+        self._verbs = tuple(tokenizer.verbs)
+        self._after_verbs = tuple(tokenizer.after_verbs)
+        self._before_verbs = tuple(tokenizer.before_verbs)
+        self._length = None
+        self._last = None, -1
+
+        # a form belongs to the last verb that produces it, as in the table;
+        # so each stem keeps the position of its last verb
+        self._stems = ({}, {})
+        for index, verb in enumerate(self._verbs):
+            ri, rii = verb.split("#")
+            self._stems[0][ri] = index
+            self._stems[1][rii] = index
+
+        # (prefix, suffix, present): irregular forms of the template
+        templates: Dict[Tuple[str, str, bool], Optional[Dict[str, str]]] = {}
+        for tense, (present, pairs) in _TEMPLATES.items():
+            irregular = _IRREGULAR_FORMS.get(tense)
+            for prefix, suffix in pairs:
+                key = (prefix, suffix, present)
+                # a template that is regular in any tense always applies
+                if key not in templates or irregular is None:
+                    templates[key] = irregular
+        templates["", "ن", False] = None
+        if joined_verb_parts:
+            for after_verb in self._after_verbs:
+                templates["", "ه_" + after_verb, False] = None
+                templates["ن", "ه_" + after_verb, False] = None
+            for before_verb in self._before_verbs:
+                templates[before_verb + "_", "", False] = None
+
+        # (prefix, suffix): ((stems, irregular forms), ...)
+        self._templates: Dict[Tuple[str, str], Tuple[Tuple[Dict[str, int], Optional[Dict[str, str]]], ...]] = {}
+        for (prefix, suffix, present), irregular in templates.items():
+            self._templates[prefix, suffix] = (
+                *self._templates.get((prefix, suffix), ()),
+                (self._stems[present], irregular),
+            )
+        # letter tries of the prefixes and the reversed suffixes; "" marks
+        # where an affix ends
+        self._prefixes: dict = {}
+        self._suffixes: dict = {}
+        for prefix, suffix in self._templates:
+            _add_affix(self._prefixes, prefix, prefix)
+            _add_affix(self._suffixes, reversed(suffix), suffix)
+
+        # the replacements of irregular forms, e.g. «ببین», by their verbs
+        self._irregular: Dict[str, int] = {}
+        for tense, mapping in _IRREGULAR_FORMS.items():
+            present, pairs = _TEMPLATES[tense]
+            for form, replacement in mapping.items():
+                for prefix, suffix in pairs:
+                    if len(prefix) + len(suffix) <= len(form) and (
+                        form.startswith(prefix) and form.endswith(suffix)
+                    ):
+                        stem = form[len(prefix) : len(form) - len(suffix)]
+                        index = self._stems[present].get(stem, -1)
+                        if index > self._irregular.get(replacement, -1):
+                            self._irregular[replacement] = index
+
+    def _index(self: "VerbAnalyzer", word: str) -> int:
+        """جایگاهِ فعلِ `word` در فهرست افعال یا `-1`."""
+        best = self._irregular.get(word, -1)
+        suffixes = _affixes(self._suffixes, reversed(word))
+        if not suffixes:
+            return best
+        length = len(word)
+        for prefix in _affixes(self._prefixes, word):
+            for suffix in suffixes:
+                start = length - len(suffix)
+                if start < len(prefix):
+                    break
+                templates = self._templates.get((prefix, suffix))
+                if templates is None:
+                    continue
+                stem = word[len(prefix) : start]
+                for stems, irregular in templates:
+                    if irregular and word in irregular:
+                        continue
+                    best = max(best, stems.get(stem, -1))
+        return best
+
+    def get(self: "VerbAnalyzer", word: str, default: Optional[str] = None) -> Optional[str]:
+        """فعلِ `word` را به شکل `بن ماضی#بن مضارع` یا `default` برمی‌گرداند."""
+        last, index = self._last
+        if word != last:
+            index = self._index(word)
+            # lemmatize asks `in` and then `[]` for the same word
+            self._last = word, index
+        if index >= 0:
+            return self._verbs[index]
+        return "#است" if word == "است" else default
+
+    def __getitem__(self: "VerbAnalyzer", word: str) -> str:
+        verb = self.get(word)
+        if verb is None:
+            raise KeyError(word)
+        return verb
+
+    def __contains__(self: "VerbAnalyzer", word: object) -> bool:
+        return isinstance(word, str) and self.get(word) is not None
+
+    def __iter__(self: "VerbAnalyzer") -> Iterator[str]:
+        if self._index("است") < 0:
+            yield "است"
+        for index, verb in enumerate(self._verbs):
+            forms = _conjugate_verb(verb)
+            if self.joined_verb_parts:
+                bon = verb.split("#")[0]
+                forms += tuple(
+                    form
+                    for after_verb in self._after_verbs
+                    for form in (bon + "ه_" + after_verb, "ن" + bon + "ه_" + after_verb)
+                )
+                forms += tuple(before_verb + "_" + bon for before_verb in self._before_verbs)
+            for form in dict.fromkeys(forms):
+                if self._index(form) == index:
+                    yield form
+
+    def __len__(self: "VerbAnalyzer") -> int:
+        if self._length is None:
+            self._length = sum(1 for _ in self)
+        return self._length
+
 
 class Conjugation:
     """این کلاس دارای توابعی برای صرف‌کردن افعال است."""
@@ -135,7 +850,7 @@ class Conjugation:
         Returns:
             صورت‌های صرفی فعل در زمان گذشتهٔ مطلق.
         """
-        return [ri + x for x in ["م", "ی", "", "یم", "ید", "ند"]]
+        return _conjugate("perfective_past", ri)
 
     def negative_perfective_past(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ مطلق به‌شکل منفی صرف می‌کند.
@@ -151,7 +866,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ مطلق به‌شکل منفی.
         """
-        return ["ن" + x for x in self.perfective_past(ri)]
+        return _conjugate("negative_perfective_past", ri)
 
     def passive_perfective_past(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ مطلق در حالت مجهول صرف می‌کند.
@@ -167,7 +882,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ مطلق در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.perfective_past("شد")]
+        return _conjugate("passive_perfective_past", ri)
 
     def negative_passive_perfective_past(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ مطلق در حالت مجهول به‌شکل منفی صرف می‌کند.
@@ -183,7 +898,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ مطلق در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_perfective_past("شد")]
+        return _conjugate("negative_passive_perfective_past", ri)
 
     def imperfective_past(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پایا صرف می‌کند.
@@ -199,7 +914,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پایا.
         """
-        return ["می‌" + x for x in self.perfective_past(ri)]
+        return _conjugate("imperfective_past", ri)
 
     def negative_imperfective_past(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پایا به‌شکل منفی صرف می‌کند.
@@ -215,7 +930,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پایا به‌شکل منفی.
         """
-        return ["ن" + x for x in self.imperfective_past(ri)]
+        return _conjugate("negative_imperfective_past", ri)
 
     def passive_imperfective_past(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پایا در حالت مجهول صرف می‌کند.
@@ -231,7 +946,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پایا در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.imperfective_past("شد")]
+        return _conjugate("passive_imperfective_past", ri)
 
     def negative_passive_imperfective_past(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پایا در حالت مجهول به‌شکل منفی صرف می‌کند.
@@ -247,7 +962,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پایا در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_imperfective_past("شد")]
+        return _conjugate("negative_passive_imperfective_past", ri)
 
     def past_progresive(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ استمراری صرف می‌کند.
@@ -263,10 +978,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ استمراری.
         """
-        return [
-            x + " " + y
-            for x, y in zip(self.perfective_past("داشت"), self.imperfective_past(ri))
-        ]
+        return _conjugate("past_progresive", ri)
 
     def passive_past_progresive(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ استمراری در حالت مجهول صرف می‌کند.
@@ -282,13 +994,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ استمراری در حالت مجهول.
         """
-        return [
-            x + " " + y
-            for x, y in zip(
-                self.perfective_past("داشت"),
-                self.passive_imperfective_past(ri),
-            )
-        ]
+        return _conjugate("passive_past_progresive", ri)
 
     def present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل صرف می‌کند.
@@ -304,7 +1010,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل.
         """
-        return [ri + x for x in ["ه‌ام", "ه‌ای", "ه است", "ه", "ه‌ایم", "ه‌اید", "ه‌اند"]]
+        return _conjugate("present_perfect", ri)
 
     def negative_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل به‌شکل منفی صرف می‌کند.
@@ -320,7 +1026,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل به‌شکل منفی.
         """
-        return ["ن" + x for x in self.present_perfect(ri)]
+        return _conjugate("negative_present_perfect", ri)
 
     def subjunctive_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل در وجه التزامی صرف می‌کند.
@@ -336,7 +1042,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در وجه التزامی.
         """
-        return [ri + "ه " + x for x in self.perfective_present("باش")]
+        return _conjugate("subjunctive_present_perfect", ri)
 
     def negative_subjunctive_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل در وجه التزامی به‌شکل منفی صرف می‌کند.
@@ -352,7 +1058,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در وجه التزامی به‌شکل منفی.
         """
-        return ["ن" + x for x in self.subjunctive_present_perfect(ri)]
+        return _conjugate("negative_subjunctive_present_perfect", ri)
 
     def grammatical_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل در وجه دستوری صرف می‌کند.
@@ -368,10 +1074,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در وجه دستوری.
         """
-        return [
-            ri + "ه " + ("باش" if x == "باشی" else x)
-            for x in self.perfective_present("باش")
-        ]
+        return _conjugate("grammatical_present_perfect", ri)
 
     def negative_grammatical_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل در وجه دستوری به‌شکل منفی صرف می‌کند.
@@ -387,10 +1090,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در وجه دستوری به‌شکل منفی.
         """
-        return [
-            "ن" + ri + "ه " + ("باش" if x == "باشی" else x)
-            for x in self.perfective_present("باش")
-        ]
+        return _conjugate("negative_grammatical_present_perfect", ri)
 
     def passive_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل در حالت مجهول صرف می‌کند.
@@ -406,7 +1106,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.present_perfect("شد")]
+        return _conjugate("passive_present_perfect", ri)
 
     def negative_passive_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل در حالت مجهول به‌شکل منفی صرف می‌کند.
@@ -422,7 +1122,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_present_perfect("شد")]
+        return _conjugate("negative_passive_present_perfect", ri)
 
     def passive_subjunctive_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل در وجه التزامی در حالت مجهول صرف می‌کند.
@@ -438,7 +1138,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در وجه التزامی در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.subjunctive_present_perfect("شد")]
+        return _conjugate("passive_subjunctive_present_perfect", ri)
 
     def negative_passive_subjunctive_present_perfect(
         self: "Conjugation", ri: str,
@@ -456,7 +1156,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در وجه التزامی در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_subjunctive_present_perfect("شد")]
+        return _conjugate("negative_passive_subjunctive_present_perfect", ri)
 
     def passive_grammatical_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل در وجه دستوری در حالت مجهول صرف می‌کند.
@@ -472,10 +1172,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در وجه دستوری در حالت مجهول.
         """
-        return [
-            ri + "ه شده " + ("باش" if x == "باشی" else x)
-            for x in self.perfective_present("باش")
-        ]
+        return _conjugate("passive_grammatical_present_perfect", ri)
 
     def negative_passive_grammatical_present_perfect(
         self: "Conjugation", ri: str,
@@ -493,10 +1190,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل در وجه دستوری در حالت مجهول به‌شکل منفی.
         """
-        return [
-            ri + "ه نشده " + ("باش" if x == "باشی" else x)
-            for x in self.perfective_present("باش")
-        ]
+        return _conjugate("negative_passive_grammatical_present_perfect", ri)
 
     def imperfective_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل پایا صرف می‌کند.
@@ -512,7 +1206,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل پایا.
         """
-        return ["می‌" + x for x in self.present_perfect(ri)]
+        return _conjugate("imperfective_present_perfect", ri)
 
     def negative_imperfective_present_perfect(
         self: "Conjugation", ri: str,
@@ -530,7 +1224,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل پایا به‌شکل منفی.
         """
-        return ["ن" + x for x in self.imperfective_present_perfect(ri)]
+        return _conjugate("negative_imperfective_present_perfect", ri)
 
     def subjunctive_imperfective_present_perfect(
         self: "Conjugation", ri: str,
@@ -548,7 +1242,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل پایا در وجه التزامی.
         """
-        return ["می‌" + x for x in self.subjunctive_present_perfect(ri)]
+        return _conjugate("subjunctive_imperfective_present_perfect", ri)
 
     def negative_subjunctive_imperfective_present_perfect(
         self: "Conjugation", ri: str,
@@ -566,7 +1260,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل پایا در وجه التزامی به‌شکل منفی.
         """
-        return ["ن" + x for x in self.subjunctive_imperfective_present_perfect(ri)]
+        return _conjugate("negative_subjunctive_imperfective_present_perfect", ri)
 
     def passive_imperfective_present_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل پایا در حالت مجهول صرف می‌کند.
@@ -582,7 +1276,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل پایا در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.imperfective_present_perfect("شد")]
+        return _conjugate("passive_imperfective_present_perfect", ri)
 
     def negative_passive_imperfective_present_perfect(
         self: "Conjugation", ri: str,
@@ -600,7 +1294,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل پایا در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_imperfective_present_perfect("شد")]
+        return _conjugate("negative_passive_imperfective_present_perfect", ri)
 
     def passive_subjunctive_imperfective_present_perfect(
         self: "Conjugation", ri: str,
@@ -618,9 +1312,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل پایا در وجه التزامی در حالت مجهول.
         """
-        return [
-            ri + "ه " + x for x in self.subjunctive_imperfective_present_perfect("شد")
-        ]
+        return _conjugate("passive_subjunctive_imperfective_present_perfect", ri)
 
     def negative_passive_subjunctive_imperfective_present_perfect(
         self: "Conjugation",
@@ -639,10 +1331,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل پایا در وجه التزامی در حالت مجهول به‌شکل منفی.
         """
-        return [
-            ri + "ه " + x
-            for x in self.negative_subjunctive_imperfective_present_perfect("شد")
-        ]
+        return _conjugate("negative_passive_subjunctive_imperfective_present_perfect", ri)
 
     def present_perfect_progressive(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل استمراری صرف می‌کند.
@@ -658,13 +1347,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل استمراری.
         """
-        return [
-            x + " " + y
-            for x, y in zip(
-                self.present_perfect("داشت"),
-                self.imperfective_present_perfect(ri),
-            )
-        ]
+        return _conjugate("present_perfect_progressive", ri)
 
     def passive_present_perfect_progressive(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال کامل استمراری در حالت مجهول صرف می‌کند.
@@ -680,13 +1363,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال کامل استمراری در حالت مجهول.
         """
-        return [
-            x + " " + y
-            for x, y in zip(
-                self.present_perfect("داشت"),
-                self.passive_imperfective_present_perfect(ri),
-            )
-        ]
+        return _conjugate("passive_present_perfect_progressive", ri)
 
     def past_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین صرف می‌کند.
@@ -702,7 +1379,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین.
         """
-        return [ri + "ه " + x for x in self.perfective_past("بود")]
+        return _conjugate("past_precedent", ri)
 
     def negative_past_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین به‌شکل منفی صرف می‌کند.
@@ -718,7 +1395,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین به‌شکل منفی.
         """
-        return ["ن" + x for x in self.past_precedent(ri)]
+        return _conjugate("negative_past_precedent", ri)
 
     def passive_past_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین در حالت مجهول صرف می‌کند.
@@ -734,7 +1411,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.past_precedent("شد")]
+        return _conjugate("passive_past_precedent", ri)
 
     def negative_passive_past_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین در حالت مجهول به‌شکل منفی صرف می‌کند.
@@ -750,7 +1427,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_past_precedent("شد")]
+        return _conjugate("negative_passive_past_precedent", ri)
 
     def imperfective_past_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین پایا صرف می‌کند.
@@ -766,7 +1443,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین پایا.
         """
-        return ["می‌" + x for x in self.past_precedent(ri)]
+        return _conjugate("imperfective_past_precedent", ri)
 
     def negative_imperfective_past_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین پایا به‌شکل منفی صرف می‌کند.
@@ -782,7 +1459,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین پایا به‌شکل منفی.
         """
-        return ["ن" + x for x in self.imperfective_past_precedent(ri)]
+        return _conjugate("negative_imperfective_past_precedent", ri)
 
     def passive_imperfective_past_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین پایا در حالت مجهول صرف می‌کند.
@@ -798,7 +1475,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین پایا در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.imperfective_past_precedent("شد")]
+        return _conjugate("passive_imperfective_past_precedent", ri)
 
     def negative_passive_imperfective_past_precedent(
         self: "Conjugation", ri: str,
@@ -816,7 +1493,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین پایا در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_imperfective_past_precedent("شد")]
+        return _conjugate("negative_passive_imperfective_past_precedent", ri)
 
     def past_precedent_progressive(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین استمراری صرف می‌کند.
@@ -832,13 +1509,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین استمراری.
         """
-        return [
-            x + " " + y
-            for x, y in zip(
-                self.perfective_past("داشت"),
-                self.imperfective_past_precedent(ri),
-            )
-        ]
+        return _conjugate("past_precedent_progressive", ri)
 
     def passive_past_precedent_progressive(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین استمراری در حالت مجهول صرف می‌کند.
@@ -854,13 +1525,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین استمراری در حالت مجهول.
         """
-        return [
-            x + " " + y
-            for x, y in zip(
-                self.perfective_past("داشت"),
-                self.passive_imperfective_past_precedent(ri),
-            )
-        ]
+        return _conjugate("passive_past_precedent_progressive", ri)
 
     def past_precedent_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین کامل صرف می‌کند.
@@ -876,7 +1541,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل.
         """
-        return [ri + "ه " + x for x in self.present_perfect("بود")]
+        return _conjugate("past_precedent_perfect", ri)
 
     def negative_past_precedent_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین کامل به‌شکل منفی صرف می‌کند.
@@ -892,7 +1557,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل به‌شکل منفی.
         """
-        return ["ن" + x for x in self.past_precedent_perfect(ri)]
+        return _conjugate("negative_past_precedent_perfect", ri)
 
     def subjunctive_past_precedent_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین کامل در وجه التزامی صرف می‌کند.
@@ -908,7 +1573,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در وجه التزامی.
         """
-        return [ri + "ه " + x for x in self.subjunctive_present_perfect("بود")]
+        return _conjugate("subjunctive_past_precedent_perfect", ri)
 
     def negative_subjunctive_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -926,7 +1591,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در وجه التزامی به‌شکل منفی.
         """
-        return ["ن" + x for x in self.subjunctive_past_precedent_perfect(ri)]
+        return _conjugate("negative_subjunctive_past_precedent_perfect", ri)
 
     def grammatical_past_precedent_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین کامل در وجه دستوری صرف می‌کند.
@@ -942,10 +1607,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در وجه دستوری.
         """
-        return [
-            ri + "ه بوده " + ("باش" if x == "باشی" else x)
-            for x in self.perfective_present("باش")
-        ]
+        return _conjugate("grammatical_past_precedent_perfect", ri)
 
     def negative_grammatical_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -963,7 +1625,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در وجه دستوری به‌شکل منفی.
         """
-        return ["ن" + x for x in self.grammatical_past_precedent_perfect(ri)]
+        return _conjugate("negative_grammatical_past_precedent_perfect", ri)
 
     def passive_past_precedent_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین کامل در حالت مجهول صرف می‌کند.
@@ -979,7 +1641,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.past_precedent_perfect("شد")]
+        return _conjugate("passive_past_precedent_perfect", ri)
 
     def negative_passive_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -997,7 +1659,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_past_precedent_perfect("شد")]
+        return _conjugate("negative_passive_past_precedent_perfect", ri)
 
     def passive_subjunctive_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -1015,7 +1677,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در وجه التزامی در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.subjunctive_past_precedent_perfect("شد")]
+        return _conjugate("passive_subjunctive_past_precedent_perfect", ri)
 
     def negative_passive_subjunctive_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -1033,9 +1695,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در وجه التزامی در حالت مجهول به‌شکل منفی.
         """
-        return [
-            ri + "ه " + "ن" + x for x in self.subjunctive_past_precedent_perfect("شد")
-        ]
+        return _conjugate("negative_passive_subjunctive_past_precedent_perfect", ri)
 
     def passive_grammatical_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -1053,7 +1713,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در وجه دستوری در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.grammatical_past_precedent_perfect("شد")]
+        return _conjugate("passive_grammatical_past_precedent_perfect", ri)
 
     def negative_passive_grammatical_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -1071,10 +1731,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل در وجه دستوری در حالت مجهول به‌شکل منفی.
         """
-        return [
-            ri + "ه " + x
-            for x in self.negative_grammatical_past_precedent_perfect("شد")
-        ]
+        return _conjugate("negative_passive_grammatical_past_precedent_perfect", ri)
 
     def imperfective_past_precedent_perfect(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین کامل پایا صرف می‌کند.
@@ -1090,7 +1747,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل پایا.
         """
-        return ["می‌" + x for x in self.past_precedent_perfect(ri)]
+        return _conjugate("imperfective_past_precedent_perfect", ri)
 
     def negative_imperfective_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -1108,7 +1765,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل پایا به‌شکل منفی.
         """
-        return ["ن" + x for x in self.imperfective_past_precedent_perfect(ri)]
+        return _conjugate("negative_imperfective_past_precedent_perfect", ri)
 
     def subjunctive_imperfective_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -1126,7 +1783,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل پایا در وجه التزامی.
         """
-        return ["می‌" + x for x in self.subjunctive_past_precedent_perfect(ri)]
+        return _conjugate("subjunctive_imperfective_past_precedent_perfect", ri)
 
     def negative_subjunctive_imperfective_past_precedent_perfect(
         self: "Conjugation",
@@ -1145,9 +1802,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل پایا در وجه التزامی به‌شکل منفی.
         """
-        return [
-            "ن" + x for x in self.subjunctive_imperfective_past_precedent_perfect(ri)
-        ]
+        return _conjugate("negative_subjunctive_imperfective_past_precedent_perfect", ri)
 
     def passive_imperfective_past_precedent_perfect(
         self: "Conjugation", ri: str,
@@ -1165,7 +1820,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل پایا در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.imperfective_past_precedent_perfect("شد")]
+        return _conjugate("passive_imperfective_past_precedent_perfect", ri)
 
     def negative_passive_imperfective_past_precedent_perfect(
         self: "Conjugation",
@@ -1184,10 +1839,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل پایا در حالت مجهول به‌شکل منفی.
         """
-        return [
-            ri + "ه " + x
-            for x in self.negative_imperfective_past_precedent_perfect("شد")
-        ]
+        return _conjugate("negative_passive_imperfective_past_precedent_perfect", ri)
 
     def passive_subjunctive_imperfective_past_precedent_perfect(
         self: "Conjugation",
@@ -1206,10 +1858,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل پایا در وجه التزامی در حالت مجهول.
         """
-        return [
-            ri + "ه " + x
-            for x in self.subjunctive_imperfective_past_precedent_perfect("شد")
-        ]
+        return _conjugate("passive_subjunctive_imperfective_past_precedent_perfect", ri)
 
     def negative_passive_subjunctive_imperfective_past_precedent_perfect(
         self: "Conjugation",
@@ -1228,10 +1877,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل پایا در وجه التزامی در حالت مجهول به‌شکل منفی.
         """
-        return [
-            ri + "ه " + "ن" + x
-            for x in self.subjunctive_imperfective_past_precedent_perfect("شد")
-        ]
+        return _conjugate("negative_passive_subjunctive_imperfective_past_precedent_perfect", ri)
 
     def past_precedent_perfect_progressive(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان گذشتهٔ پیشین کامل استمراری صرف می‌کند.
@@ -1247,13 +1893,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل استمراری.
         """
-        return [
-            x + " " + y
-            for x, y in zip(
-                self.present_perfect("داشت"),
-                self.imperfective_past_precedent_perfect(ri),
-            )
-        ]
+        return _conjugate("past_precedent_perfect_progressive", ri)
 
     def passive_past_precedent_perfect_progressive(
         self: "Conjugation", ri: str,
@@ -1271,13 +1911,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان گذشتهٔ پیشین کامل استمراری در حالت مجهول.
         """
-        return [
-            x + " " + y
-            for x, y in zip(
-                self.present_perfect("داشت"),
-                self.passive_imperfective_past_precedent_perfect(ri),
-            )
-        ]
+        return _conjugate("passive_past_precedent_perfect_progressive", ri)
 
     def perfective_present(self: "Conjugation", rii: str) -> List[str]:
         """فعل را در زمان حال مطلق صرف می‌کند.
@@ -1293,7 +1927,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق.
         """
-        return [rii + x for x in ["م", "ی", "د", "یم", "ید", "ند"]]
+        return _conjugate("perfective_present", rii)
 
     def negative_perfective_present(self: "Conjugation", rii: str) -> List[str]:
         """فعل را در زمان حال مطلق به‌شکل منفی صرف می‌کند.
@@ -1309,7 +1943,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق به‌شکل منفی.
         """
-        return ["ن" + x for x in self.perfective_present(rii)]
+        return _conjugate("negative_perfective_present", rii)
 
     def subjunctive_perfective_present(self: "Conjugation", rii: str) -> List[str]:
         """فعل را در زمان حال مطلق در وجه التزامی صرف می‌کند.
@@ -1325,7 +1959,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در وجه التزامی.
         """
-        return ["ب" + x for x in self.perfective_present(rii)]
+        return _conjugate("subjunctive_perfective_present", rii)
 
     def negative_subjunctive_perfective_present(
         self: "Conjugation", rii: str,
@@ -1343,7 +1977,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در وجه التزامی به‌شکل منفی.
         """
-        return ["ن" + x for x in self.perfective_present(rii)]
+        return _conjugate("negative_subjunctive_perfective_present", rii)
 
     def grammatical_perfective_present(self: "Conjugation", rii: str) -> List[str]:
         """فعل را در زمان حال مطلق در وجه دستوری صرف می‌کند.
@@ -1359,10 +1993,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در وجه دستوری.
         """
-        return [
-            "ببین" if x == "ببینی" else x
-            for x in self.subjunctive_perfective_present(rii)
-        ]
+        return _conjugate("grammatical_perfective_present", rii)
 
     def negative_grammatical_perfective_present(
         self: "Conjugation", rii: str,
@@ -1380,9 +2011,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در وجه دستوری به‌شکل منفی.
         """
-        return [
-            "ن" + ("بین" if x == "بینی" else x) for x in self.perfective_present(rii)
-        ]
+        return _conjugate("negative_grammatical_perfective_present", rii)
 
     def passive_perfective_present(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال مطلق در حالت مجهول صرف می‌کند.
@@ -1398,7 +2027,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.perfective_present("شو")]
+        return _conjugate("passive_perfective_present", ri)
 
     def negative_passive_perfective_present(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال مطلق در حالت مجهول به‌شکل منفی صرف می‌کند.
@@ -1414,7 +2043,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_perfective_present("شو")]
+        return _conjugate("negative_passive_perfective_present", ri)
 
     def passive_subjunctive_perfective_present(
         self: "Conjugation", ri: str,
@@ -1432,7 +2061,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در وجه التزامی در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.subjunctive_perfective_present("شو")]
+        return _conjugate("passive_subjunctive_perfective_present", ri)
 
     def negative_passive_subjunctive_perfective_present(
         self: "Conjugation", ri: str,
@@ -1450,9 +2079,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در وجه التزامی در حالت مجهول به‌شکل منفی.
         """
-        return [
-            ri + "ه " + x for x in self.negative_subjunctive_perfective_present("شو")
-        ]
+        return _conjugate("negative_passive_subjunctive_perfective_present", ri)
 
     def passive_grammatical_perfective_present(
         self: "Conjugation", ri: str,
@@ -1470,10 +2097,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در وجه دستوری در حالت مجهول.
         """
-        return [
-            ri + "ه " + ("بشو" if x == "بشوی" else x)
-            for x in self.grammatical_perfective_present("شو")
-        ]
+        return _conjugate("passive_grammatical_perfective_present", ri)
 
     def negative_passive_grammatical_perfective_present(
         self: "Conjugation", ri: str,
@@ -1491,10 +2115,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال مطلق در وجه دستوری در حالت مجهول به‌شکل منفی.
         """
-        return [
-            ri + "ه " + ("نشو" if x == "نشوی" else x)
-            for x in self.negative_grammatical_perfective_present("شو")
-        ]
+        return _conjugate("negative_passive_grammatical_perfective_present", ri)
 
     def imperfective_present(self: "Conjugation", rii: str) -> List[str]:
         """فعل را در زمان حال پایا صرف می‌کند.
@@ -1510,7 +2131,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال پایا.
         """
-        return ["می‌" + x for x in self.perfective_present(rii)]
+        return _conjugate("imperfective_present", rii)
 
     def negative_imperfective_present(self: "Conjugation", rii: str) -> List[str]:
         """فعل را در زمان حال پایا به‌شکل منفی صرف می‌کند.
@@ -1526,7 +2147,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال پایا به‌شکل منفی.
         """
-        return ["ن" + x for x in self.imperfective_present(rii)]
+        return _conjugate("negative_imperfective_present", rii)
 
     def passive_imperfective_present(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال پایا در حالت مجهول صرف می‌کند.
@@ -1542,7 +2163,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال پایا در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.imperfective_present("شو")]
+        return _conjugate("passive_imperfective_present", ri)
 
     def negative_passive_imperfective_present(
         self: "Conjugation", ri: str,
@@ -1560,7 +2181,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال پایا در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_imperfective_present("شو")]
+        return _conjugate("negative_passive_imperfective_present", ri)
 
     def present_progressive(self: "Conjugation", rii: str) -> List[str]:
         """فعل را در زمان حال استمراری صرف می‌کند.
@@ -1576,13 +2197,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال استمراری.
         """
-        return [
-            x + " " + y
-            for x, y in zip(
-                self.perfective_present("دار"),
-                self.imperfective_present(rii),
-            )
-        ]
+        return _conjugate("present_progressive", rii)
 
     def passive_present_progressive(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان حال استمراری در حالت مجهول صرف می‌کند.
@@ -1598,13 +2213,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان حال استمراری در حالت مجهول.
         """
-        return [
-            x + " " + y
-            for x, y in zip(
-                self.perfective_present("دار"),
-                self.passive_imperfective_present(ri),
-            )
-        ]
+        return _conjugate("passive_present_progressive", ri)
 
     def perfective_future(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ مطلق صرف می‌کند.
@@ -1620,7 +2229,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ مطلق.
         """
-        return [x + " " + ri for x in self.perfective_present("خواه")]
+        return _conjugate("perfective_future", ri)
 
     def negative_perfective_future(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ مطلق به‌شکل منفی صرف می‌کند.
@@ -1636,7 +2245,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ مطلق به‌شکل منفی.
         """
-        return ["ن" + x for x in self.perfective_future(ri)]
+        return _conjugate("negative_perfective_future", ri)
 
     def passive_perfective_future(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ مطلق در حالت مجهول صرف می‌کند.
@@ -1652,7 +2261,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ مطلق در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.perfective_future("شد")]
+        return _conjugate("passive_perfective_future", ri)
 
     def negative_passive_perfective_future(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ مطلق در حالت مجهول به‌شکل منفی صرف می‌کند.
@@ -1668,7 +2277,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ مطلق در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_perfective_future("شد")]
+        return _conjugate("negative_passive_perfective_future", ri)
 
     def imperfective_future(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ پایا صرف می‌کند.
@@ -1684,7 +2293,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پایا.
         """
-        return ["می‌" + x for x in self.perfective_future(ri)]
+        return _conjugate("imperfective_future", ri)
 
     def negative_imperfective_future(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ پایا به‌شکل منفی صرف می‌کند.
@@ -1700,7 +2309,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پایا به‌شکل منفی.
         """
-        return ["ن" + x for x in self.imperfective_future(ri)]
+        return _conjugate("negative_imperfective_future", ri)
 
     def passive_imperfective_future(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ پایا در حالت مجهول صرف می‌کند.
@@ -1716,7 +2325,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پایا در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.imperfective_future("شد")]
+        return _conjugate("passive_imperfective_future", ri)
 
     def negative_passive_imperfective_future(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ پایا در حالت مجهول به‌شکل منفی صرف می‌کند.
@@ -1732,7 +2341,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پایا در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_imperfective_future("شد")]
+        return _conjugate("negative_passive_imperfective_future", ri)
 
     def future_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ پیشین صرف می‌کند.
@@ -1748,7 +2357,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پیشین.
         """
-        return [ri + "ه " + x for x in self.perfective_future("بود")]
+        return _conjugate("future_precedent", ri)
 
     def negative_future_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ پیشین به‌شکل منفی صرف می‌کند.
@@ -1764,7 +2373,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پیشین به‌شکل منفی.
         """
-        return ["ن" + x for x in self.future_precedent(ri)]
+        return _conjugate("negative_future_precedent", ri)
 
     def passive_future_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ پیشین در حالت مجهول صرف می‌کند.
@@ -1780,7 +2389,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پیشین در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.future_precedent("شد")]
+        return _conjugate("passive_future_precedent", ri)
 
     def negative_passive_future_precedent(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ پیشین در حالت مجهول به‌شکل منفی صرف می‌کند.
@@ -1796,7 +2405,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پیشین در حالت مجهول به‌شکل منفی.
         """
-        return [ri + "ه " + x for x in self.negative_future_precedent("شد")]
+        return _conjugate("negative_passive_future_precedent", ri)
 
     def future_precedent_imperfective(self: "Conjugation", ri: str) -> List[str]:
         """فعل را در زمان آیندهٔ پیشین پایا صرف می‌کند.
@@ -1812,7 +2421,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پیشین پایا.
         """
-        return ["می‌" + x for x in self.future_precedent(ri)]
+        return _conjugate("future_precedent_imperfective", ri)
 
     def negative_future_precedent_imperfective(
         self: "Conjugation", ri: str,
@@ -1830,7 +2439,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پیشین پایا به‌شکل منفی.
         """
-        return ["ن" + x for x in self.future_precedent_imperfective(ri)]
+        return _conjugate("negative_future_precedent_imperfective", ri)
 
     def passive_future_precedent_imperfective(
         self: "Conjugation", ri: str,
@@ -1848,7 +2457,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پیشین پایا در حالت مجهول.
         """
-        return [ri + "ه " + x for x in self.future_precedent_imperfective("شد")]
+        return _conjugate("passive_future_precedent_imperfective", ri)
 
     def negative_passive_future_precedent_imperfective(
         self: "Conjugation", ri: str,
@@ -1866,9 +2475,7 @@ class Conjugation:
         Returns:
              صورت‌های صرفی فعل در زمان آیندهٔ پیشین پایا در حالت مجهول به‌شکل منفی.
         """
-        return [
-            ri + "ه " + x for x in self.negative_future_precedent_imperfective("شد")
-        ]
+        return _conjugate("negative_passive_future_precedent_imperfective", ri)
 
     def get(self: "Conjugation", verb, negative=False, passive=False) -> List[str]:
         """صورت‌های صرفی فعل را برمی‌گرداند.
@@ -1881,127 +2488,7 @@ class Conjugation:
         Returns:
             (List(str)): صورت‌های صرفی فعل.
         """
-        ri, rii = verb.split("#")
-        infinitive = [ri + "ن"]
-        result = [infinitive]
-
-        if negative and passive:
-            result.append(self.negative_passive_perfective_past(ri))
-            result.append(self.negative_passive_imperfective_past(ri))
-            result.append(self.negative_passive_present_perfect(ri))
-            result.append(self.negative_passive_subjunctive_present_perfect(ri))
-            result.append(self.negative_passive_grammatical_present_perfect(ri))
-            result.append(self.negative_passive_imperfective_present_perfect(ri))
-            result.append(
-                self.negative_passive_subjunctive_imperfective_present_perfect(ri),
-            )
-            result.append(self.negative_passive_past_precedent(ri))
-            result.append(self.negative_passive_imperfective_past_precedent(ri))
-            result.append(self.negative_passive_past_precedent_perfect(ri))
-            result.append(self.negative_passive_subjunctive_past_precedent_perfect(ri))
-            result.append(self.negative_passive_grammatical_past_precedent_perfect(ri))
-            result.append(self.negative_passive_imperfective_past_precedent_perfect(ri))
-            result.append(
-                self.negative_passive_subjunctive_imperfective_past_precedent_perfect(
-                    ri,
-                ),
-            )
-            result.append(self.negative_passive_perfective_present(ri))
-            result.append(self.negative_passive_subjunctive_perfective_present(ri))
-            result.append(self.negative_passive_grammatical_perfective_present(ri))
-            result.append(self.negative_passive_imperfective_present(ri))
-            result.append(self.negative_passive_perfective_future(ri))
-            result.append(self.negative_passive_imperfective_future(ri))
-            result.append(self.negative_passive_future_precedent(ri))
-            result.append(self.negative_passive_future_precedent_imperfective(ri))
-
-        elif passive and not negative:
-            result.append(self.passive_perfective_past(ri))
-            result.append(self.passive_imperfective_past(ri))
-            result.append(self.passive_past_progresive(ri))
-            result.append(self.passive_present_perfect(ri))
-            result.append(self.passive_subjunctive_present_perfect(ri))
-            result.append(self.passive_grammatical_present_perfect(ri))
-            result.append(self.passive_imperfective_present_perfect(ri))
-            result.append(self.passive_subjunctive_imperfective_present_perfect(ri))
-            result.append(self.passive_present_perfect_progressive(ri))
-            result.append(self.passive_past_precedent(ri))
-            result.append(self.passive_imperfective_past_precedent(ri))
-            result.append(self.passive_past_precedent_progressive(ri))
-            result.append(self.passive_past_precedent_perfect(ri))
-            result.append(self.passive_subjunctive_past_precedent_perfect(ri))
-            result.append(self.passive_grammatical_past_precedent_perfect(ri))
-            result.append(self.passive_imperfective_past_precedent_perfect(ri))
-            result.append(
-                self.passive_subjunctive_imperfective_past_precedent_perfect(ri),
-            )
-            result.append(self.passive_past_precedent_perfect_progressive(ri))
-            result.append(self.passive_perfective_present(ri))
-            result.append(self.passive_subjunctive_perfective_present(ri))
-            result.append(self.passive_grammatical_perfective_present(ri))
-            result.append(self.passive_imperfective_present(ri))
-            result.append(self.passive_present_progressive(ri))
-            result.append(self.passive_perfective_future(ri))
-            result.append(self.passive_imperfective_future(ri))
-            result.append(self.passive_future_precedent(ri))
-            result.append(self.passive_future_precedent_imperfective(ri))
-
-        elif negative and not passive:
-            result.append(self.negative_perfective_past(ri))
-            result.append(self.negative_imperfective_past(ri))
-            result.append(self.negative_present_perfect(ri))
-            result.append(self.negative_subjunctive_present_perfect(ri))
-            result.append(self.negative_grammatical_present_perfect(ri))
-            result.append(self.negative_imperfective_present_perfect(ri))
-            result.append(self.negative_subjunctive_imperfective_present_perfect(ri))
-            result.append(self.negative_past_precedent(ri))
-            result.append(self.negative_imperfective_past_precedent(ri))
-            result.append(self.negative_past_precedent_perfect(ri))
-            result.append(self.negative_subjunctive_past_precedent_perfect(ri))
-            result.append(self.negative_grammatical_past_precedent_perfect(ri))
-            result.append(self.negative_imperfective_past_precedent_perfect(ri))
-            result.append(
-                self.negative_subjunctive_imperfective_past_precedent_perfect(ri),
-            )
-            result.append(self.negative_perfective_present(rii))
-            result.append(self.negative_subjunctive_perfective_present(rii))
-            result.append(self.negative_grammatical_perfective_present(rii))
-            result.append(self.negative_imperfective_present(rii))
-            result.append(self.negative_perfective_future(ri))
-            result.append(self.negative_imperfective_future(ri))
-            result.append(self.negative_future_precedent(ri))
-            result.append(self.negative_future_precedent_imperfective(ri))
-
-        elif not negative and not passive:
-            result.append(self.perfective_past(ri))
-            result.append(self.imperfective_past(ri))
-            result.append(self.past_progresive(ri))
-            result.append(self.present_perfect(ri))
-            result.append(self.subjunctive_present_perfect(ri))
-            result.append(self.grammatical_present_perfect(ri))
-            result.append(self.imperfective_present_perfect(ri))
-            result.append(self.subjunctive_imperfective_present_perfect(ri))
-            result.append(self.present_perfect_progressive(ri))
-            result.append(self.past_precedent(ri))
-            result.append(self.imperfective_past_precedent(ri))
-            result.append(self.past_precedent_progressive(ri))
-            result.append(self.past_precedent_perfect(ri))
-            result.append(self.subjunctive_past_precedent_perfect(ri))
-            result.append(self.grammatical_past_precedent_perfect(ri))
-            result.append(self.imperfective_past_precedent_perfect(ri))
-            result.append(self.subjunctive_imperfective_past_precedent_perfect(ri))
-            result.append(self.past_precedent_perfect_progressive(ri))
-            result.append(self.perfective_present(rii))
-            result.append(self.subjunctive_perfective_present(rii))
-            result.append(self.grammatical_perfective_present(rii))
-            result.append(self.imperfective_present(rii))
-            result.append(self.present_progressive(rii))
-            result.append(self.perfective_future(ri))
-            result.append(self.imperfective_future(ri))
-            result.append(self.future_precedent(ri))
-            result.append(self.future_precedent_imperfective(ri))
-
-        return sum(result, [])
+        return list(_cached_conjugate_verb(verb, (bool(negative), bool(passive))))
 
     def get_all(self: "Conjugation", verb: str) -> List[str]:
         """تمام صورت‌های صرفی فعل را در وجوه اخباری، التزامی، دستوری و در اشکال منفی و مثبت و مجهول برمی‌گرداند.
@@ -2012,306 +2499,4 @@ class Conjugation:
         Returns:
              لیست تمام صورت‌های صرفی فعل.
         """
-        ri, rii = verb.split("#")
-        infinitive = [ri + "ن"]
-        result = [infinitive]
-
-        # گذشتهٔ مطلق
-        result.append(self.perfective_past(ri))
-
-        # گذشتهٔ مطلق منفی
-        result.append(self.negative_perfective_past(ri))
-
-        # گذشتهٔ مطلق مجهول
-        result.append(self.passive_perfective_past(ri))
-
-        # گذشتهٔ مطلق مجهول منفی
-        result.append(self.negative_passive_perfective_past(ri))
-
-        # گذشتهٔ پایا
-        result.append(self.imperfective_past(ri))
-
-        # گذشتهٔ پایای منفی
-        result.append(self.negative_imperfective_past(ri))
-
-        # گذشتهٔ پایای مجهول
-        result.append(self.passive_imperfective_past(ri))
-
-        # گذشتهٔ پایای مجهول منفی
-        result.append(self.negative_passive_imperfective_past(ri))
-
-        # گذشتهٔ استمراری
-        result.append(self.past_progresive(ri))
-
-        # گذشتهٔ استمراری مجهول
-        result.append(self.passive_past_progresive(ri))
-
-        # حال کامل
-        result.append(self.present_perfect(ri))
-
-        # حال کامل منفی
-        result.append(self.negative_present_perfect(ri))
-
-        # حال کامل التزامی
-        result.append(self.subjunctive_present_perfect(ri))
-
-        # حال کامل التزامی منفی
-        result.append(self.negative_subjunctive_present_perfect(ri))
-
-        # حال کامل دستوری
-        result.append(self.grammatical_present_perfect(ri))
-
-        # حال کامل دستوری منفی
-        result.append(self.negative_grammatical_present_perfect(ri))
-
-        # حال کامل مجهول
-        result.append(self.passive_present_perfect(ri))
-
-        # حال کامل مجهول منفی
-        result.append(self.negative_passive_present_perfect(ri))
-
-        # حال کامل التزامی مجهول
-        result.append(self.passive_subjunctive_present_perfect(ri))
-
-        # حال کامل التزامی مجهول منفی
-        result.append(self.negative_passive_subjunctive_present_perfect(ri))
-
-        # حال کامل دستوری مجهول
-        result.append(self.passive_grammatical_present_perfect(ri))
-
-        # حال کامل دستوری مجهول منفی
-        result.append(self.negative_passive_grammatical_present_perfect(ri))
-
-        # حال کامل پایا
-        result.append(self.imperfective_present_perfect(ri))
-
-        # حال کامل پایای منفی
-        result.append(self.negative_imperfective_present_perfect(ri))
-
-        # حال کامل پایای التزامی
-        result.append(self.subjunctive_imperfective_present_perfect(ri))
-
-        # حال کامل پایای التزامی منفی
-        result.append(self.negative_subjunctive_imperfective_present_perfect(ri))
-
-        # حال کامل پایای مجهول
-        result.append(self.passive_imperfective_present_perfect(ri))
-
-        # حال کامل پایای مجهول منفی
-        result.append(self.negative_passive_imperfective_present_perfect(ri))
-
-        # حال کامل پایای التزامی مجهول
-        result.append(self.passive_subjunctive_imperfective_present_perfect(ri))
-
-        # حال کامل پایای التزامی مجهول منفی
-        result.append(
-            self.negative_passive_subjunctive_imperfective_present_perfect(ri),
-        )
-
-        # حال کامل استمراری
-        result.append(self.present_perfect_progressive(ri))
-
-        # حال کامل استمراری مجهول
-        result.append(self.passive_present_perfect_progressive(ri))
-
-        # گذشتهٔ پیشین
-        result.append(self.past_precedent(ri))
-
-        # گذشتهٔ پیشین منفی
-        result.append(self.negative_past_precedent(ri))
-
-        # گذشتهٔ پیشین مجهول
-        result.append(self.passive_past_precedent(ri))
-
-        # گذشتهٔ پیشین مجهول منفی
-        result.append(self.negative_passive_past_precedent(ri))
-
-        # گذشتهٔ پیشین پایا
-        result.append(self.imperfective_past_precedent(ri))
-
-        # گذشتهٔ پیشین پایای منفی
-        result.append(self.negative_imperfective_past_precedent(ri))
-
-        # گذشتهٔ پیشین پایای مجهول
-        result.append(self.passive_imperfective_past_precedent(ri))
-
-        # گذشتهٔ پیشین پایای مجهول منفی
-        result.append(self.negative_passive_imperfective_past_precedent(ri))
-
-        # گذشتهٔ پیشین استمراری
-        result.append(self.past_precedent_progressive(ri))
-
-        # گذشتهٔ پیشین استمراری مجهول
-        result.append(self.passive_past_precedent_progressive(ri))
-
-        # گذشتهٔ پیشین کامل
-        result.append(self.past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل منفی
-        result.append(self.negative_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل التزامی
-        result.append(self.subjunctive_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل التزامی منفی
-        result.append(self.negative_subjunctive_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل دستوری
-        result.append(self.grammatical_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل دستوری منفی
-        result.append(self.negative_grammatical_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل مجهول
-        result.append(self.passive_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل مجهول منفی
-        result.append(self.negative_passive_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل التزامی مجهول
-        result.append(self.passive_subjunctive_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل التزامی مجهول منفی
-        result.append(self.negative_passive_subjunctive_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشن کامل دستوری مجهول
-        result.append(self.passive_grammatical_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل دستوری مجهول منفی
-        result.append(self.negative_passive_grammatical_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل پایا
-        result.append(self.imperfective_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل پایای منفی
-        result.append(self.negative_imperfective_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل پایای التزامی
-        result.append(self.subjunctive_imperfective_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل پایای التزامی منفی
-        result.append(self.negative_subjunctive_imperfective_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل پایای مجهول
-        result.append(self.passive_imperfective_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل پایای مجهول منفی
-        result.append(self.negative_passive_imperfective_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل پایای التزامی مجهول
-        result.append(self.passive_subjunctive_imperfective_past_precedent_perfect(ri))
-
-        # گذشتهٔ پیشین کامل پایای التزامی مجهول منفی
-        result.append(
-            self.negative_passive_subjunctive_imperfective_past_precedent_perfect(ri),
-        )
-
-        # گذشتهٔ پیشین کامل استمراری
-        result.append(self.past_precedent_perfect_progressive(ri))
-
-        # گذشتهٔ پیشین کامل استمراری مجهول
-        result.append(self.passive_past_precedent_perfect_progressive(ri))
-
-        # حال مطلق
-        result.append(self.perfective_present(rii))
-
-        # حال مطلق منفی
-        result.append(self.negative_perfective_present(rii))
-
-        # حال مطلق التزامی
-        result.append(self.subjunctive_perfective_present(rii))
-
-        # حال مطلق التزامی منفی
-        result.append(self.negative_subjunctive_perfective_present(rii))
-
-        # حال مطلق دستوری
-        result.append(self.grammatical_perfective_present(rii))
-
-        # حال مطلق دستوری منفی
-        result.append(self.negative_grammatical_perfective_present(rii))
-
-        # حال مطلق مجهول
-        result.append(self.passive_perfective_present(ri))
-
-        # حال مطلق مجهول منفی
-        result.append(self.negative_passive_perfective_present(ri))
-
-        # حال مطلق التزامی مجهول
-        result.append(self.passive_subjunctive_perfective_present(ri))
-
-        # حال مطلق التزامی مجهول منفی
-        result.append(self.negative_passive_subjunctive_perfective_present(ri))
-
-        # حال مطلق دستوری مجهول
-        result.append(self.passive_grammatical_perfective_present(ri))
-
-        # حال مطلق دستوری مجهول منفی
-        result.append(self.negative_passive_grammatical_perfective_present(ri))
-
-        # حال پایا
-        result.append(self.imperfective_present(rii))
-
-        # حال پایای منفی
-        result.append(self.negative_imperfective_present(rii))
-
-        # حال پایای مجهول
-        result.append(self.passive_imperfective_present(ri))
-
-        # حال پایای مجهول منفی
-        result.append(self.negative_passive_imperfective_present(ri))
-
-        # حال استمراری
-        result.append(self.present_progressive(rii))
-
-        # حال استمراری مجهول
-        result.append(self.passive_present_progressive(ri))
-
-        # آیندهٔ مطلق
-        result.append(self.perfective_future(ri))
-
-        # آیندهٔ مطلق منفی
-        result.append(self.negative_perfective_future(ri))
-
-        # آیندهٔ مطلق مجهول
-        result.append(self.passive_perfective_future(ri))
-
-        # آیندهٔ مطلق مجهول منفی
-        result.append(self.negative_passive_perfective_future(ri))
-
-        # آیندهٔ پایا
-        result.append(self.imperfective_future(ri))
-
-        # آیندهٔ پایای منفی
-        result.append(self.negative_imperfective_future(ri))
-
-        # آیندهٔ پایای مجهول
-        result.append(self.passive_imperfective_future(ri))
-
-        # آیندهٔ پایای مجهول منفی
-        result.append(self.negative_passive_imperfective_future(ri))
-
-        # آیندهٔ پیشین
-        result.append(self.future_precedent(ri))
-
-        # آیندهٔ پیشین منفی
-        result.append(self.negative_future_precedent(ri))
-
-        # آیندهٔ پیشین مجهول
-        result.append(self.passive_future_precedent(ri))
-
-        # آیندهٔ پیشین مجهول منفی
-        result.append(self.negative_passive_future_precedent(ri))
-
-        # آیندهٔ پیشین پایا
-        result.append(self.future_precedent_imperfective(ri))
-
-        # آیندهٔ پیشین پایای منفی
-        result.append(self.negative_future_precedent_imperfective(ri))
-
-        # آیندهٔ پیشین پایای مجهول
-        result.append(self.passive_future_precedent_imperfective(ri))
-
-        # آیندهٔ پیشین پایای مجهول منفی
-        result.append(self.negative_passive_future_precedent_imperfective(ri))
-
-        return sum(result, [])
+        return list(_cached_conjugate_verb(verb))
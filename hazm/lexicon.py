@@ -0,0 +1,502 @@
+"""این ماژول شامل توابعی برای ساخت و بارگذاری نسخهٔ دودویی واژگان است.
+
+تجزیهٔ فایل متنیِ `words.dat` در هر بار ساختِ [WordTokenizer][hazm.WordTokenizer]
+زمان‌بر است. به همین دلیل این فایل به همراه `verbs.dat` یک بار به قالبی دودویی
+و فشرده تبدیل و در پوشهٔ کش ذخیره می‌شود و در دفعات بعد مستقیماً از همین نسخه
+خوانده می‌شود. نام و سرآیند این نسخه شامل چکیدهٔ SHA-256 فایل‌های منبع است؛
+پس هر تغییری در فایل‌های متنی باعث ساخت دوبارهٔ آن می‌شود.
+
+پوشهٔ کش به صورت پیش‌فرض `~/.cache/hazm` است و با متغیر محیطی
+`HAZM_CACHE_DIR` تغییر می‌کند. اگر امکان نوشتن در این پوشه نباشد، واژگان
+مستقیماً از فایل‌های متنی خوانده می‌شود.
+
+"""
+
+import contextlib
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+
+from hazm.utils import default_verbs
+from hazm.utils import default_words
+from hazm.utils import words_list
+
+T = TypeVar("T")
+
+LEXICON_VERSION = 2
+VERB_FORMS_VERSION = 1
+
+_LEXICON_MAGIC = b"HAZMLEX\x00"
+_VERB_FORMS_MAGIC = b"HAZMVRB\x00"
+# magic, format version, source digest, number of sections
+_HEADER = struct.Struct("<8sI32sI")
+
+
+def cache_dir() -> Path:
+    """مسیر پوشهٔ کشِ هضم را برمی‌گرداند.
+
+    Returns:
+        مسیر پوشهٔ کش.
+
+    """
+    directory = os.environ.get("HAZM_CACHE_DIR")
+    if directory:
+        return Path(directory)
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "hazm"
+
+
+def source_digest(*files: str) -> bytes:
+    """چکیدهٔ SHA-256 محتوای فایل‌های منبع را برمی‌گرداند.
+
+    Args:
+        *files: مسیر فایل‌های منبع.
+
+    Returns:
+        چکیدهٔ ۳۲ بایتی.
+
+    """
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(Path(file).read_bytes())
+        digest.update(b"\x00")
+    return digest.digest()
+
+
+def _read_verbs(verbs_file: str) -> List[str]:
+    with Path.open(verbs_file, encoding="utf8") as verbs:
+        lines = verbs.read().split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return [line.strip() for line in lines]
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, buffer: memoryview) -> array:
+    values = array(typecode)
+    values.frombytes(buffer)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _split(buffer: memoryview, count: int) -> List[str]:
+    return str(buffer, "utf8").split("\n") if count else []
+
+
+def _write_sections(
+    file: str,
+    magic: bytes,
+    version: int,
+    digest: bytes,
+    sections: List[bytes],
+) -> None:
+    header = _HEADER.pack(magic, version, digest, len(sections))
+    sizes = struct.pack(f"<{len(sections)}Q", *map(len, sections))
+
+    file = Path(file)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_file = tempfile.mkstemp(dir=file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as out:
+            for part in (header, sizes, *sections):
+                out.write(part)
+        Path(temp_file).replace(file)
+    except BaseException:
+        Path(temp_file).unlink(missing_ok=True)
+        raise
+
+
+def _read_sections(
+    file: str,
+    magic: bytes,
+    version: int,
+    digest: Optional[bytes],
+    decode: Callable[[List[memoryview]], T],
+) -> T:
+    with Path.open(file, "rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ,
+    ) as mapped, memoryview(mapped) as view:
+        if len(view) < _HEADER.size:
+            msg = f"{file} is not a hazm cache file."
+            raise ValueError(msg)
+
+        stored_magic, stored_version, stored_digest, count = _HEADER.unpack_from(view)
+        if stored_magic != magic or stored_version != version:
+            msg = f"{file} is not a version {version} {magic[:7].decode()} file."
+            raise ValueError(msg)
+        if digest is not None and digest != stored_digest:
+            msg = f"{file} is out of date with its source files."
+            raise ValueError(msg)
+
+        offset = _HEADER.size + 8 * count
+        sizes = struct.unpack_from(f"<{count}Q", view, _HEADER.size)
+        if offset + sum(sizes) != len(view):
+            msg = f"{file} is truncated."
+            raise ValueError(msg)
+
+        sections = []
+        try:
+            for size in sizes:
+                sections.append(view[offset : offset + size])
+                offset += size
+            return decode(sections)
+        finally:
+            for section in sections:
+                section.release()
+
+
+class Lexicon(Mapping):
+    """واژگانِ فشرده و فقط‌خواندنیِ هضم.
+
+    این کلاس جایگزین دیکشنریِ `{word: (count, tags)}` است و مانند آن یک
+    `Mapping` است که کلمات را به ترتیب الفبایی پیمایش می‌کند. هر کلمه فقط به
+    جایگاهش در این ترتیب نگاشت می‌شود؛ فراوانی‌ها در آرایه‌ای از اعداد ۳۲ بیتی و
+    برچسب‌ها به صورت اندیسی ۱۶ بیتی در جدولِ برچسب‌های یکتا ذخیره می‌شوند و
+    عبارت `words[word]` از روی همین جایگاه همان `(count, tags)` دیکشنریِ قبلی را
+    برمی‌گرداند.
+
+    Examples:
+        >>> words = Lexicon.from_words([("آب", 10, ("N", "AJ")), ("نان", 5, ("N",))])
+        >>> "آب" in words
+        True
+        >>> words["آب"]
+        (10, ('N', 'AJ'))
+        >>> words.get("شیر", (0, ()))
+        (0, ())
+        >>> list(words)
+        ['آب', 'نان']
+
+    Args:
+        words: کلمات به ترتیب الفبایی و بدون تکرار.
+        counts: فراوانیِ کلمات به همان ترتیب.
+        tag_indexes: اندیسِ برچسب‌های هر کلمه در `tag_sets`.
+        tag_sets: جدولِ برچسب‌های یکتا.
+
+    """
+
+    __slots__ = ("_counts", "_index", "_tag_indexes", "_tag_sets")
+
+    def __init__(
+        self: "Lexicon",
+        words: Iterable[str],
+        counts: array,
+        tag_indexes: array,
+        tag_sets: Sequence[Tuple[str]],
+    ) -> None:
+        self._index = {word: index for index, word in enumerate(words)}
+        self._counts = counts
+        self._tag_indexes = tag_indexes
+        self._tag_sets = tuple(tag_sets)
+
+    @classmethod
+    def from_words(
+        cls: Type["Lexicon"],
+        items: Iterable[Tuple[str, int, Tuple[str]]],
+    ) -> "Lexicon":
+        """واژگان را از سه‌تایی‌های `(word, count, tags)` می‌سازد.
+
+        اگر کلمه‌ای تکرار شده باشد، آخرین مقدار آن نگه داشته می‌شود.
+
+        Args:
+            items: سه‌تایی‌ها؛ مانند خروجیِ [words_list()][hazm.utils.words_list].
+
+        Returns:
+            واژگانِ ساخته‌شده.
+
+        """
+        words = {word: (count, tags) for word, count, tags in items}
+        keys = sorted(words)
+
+        tag_sets: Dict[Tuple[str], int] = {}
+        counts, tag_indexes = array("I"), array("H")
+        for key in keys:
+            count, tags = words[key]
+            counts.append(count)
+            tag_indexes.append(tag_sets.setdefault(tags, len(tag_sets)))
+        return cls(keys, counts, tag_indexes, list(tag_sets))
+
+    def __getitem__(self: "Lexicon", word: str) -> Tuple[int, Tuple[str]]:
+        index = self._index[word]
+        return self._counts[index], self._tag_sets[self._tag_indexes[index]]
+
+    def __contains__(self: "Lexicon", word: object) -> bool:
+        return word in self._index
+
+    def __iter__(self: "Lexicon") -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self: "Lexicon") -> int:
+        return len(self._index)
+
+    @property
+    def counts(self: "Lexicon") -> array:
+        """فراوانیِ کلمات به ترتیب الفبایی."""
+        return self._counts
+
+    @property
+    def tag_indexes(self: "Lexicon") -> array:
+        """اندیسِ برچسب‌های هر کلمه در [tag_sets][hazm.lexicon.Lexicon.tag_sets]."""
+        return self._tag_indexes
+
+    @property
+    def tag_sets(self: "Lexicon") -> Tuple[Tuple[str]]:
+        """جدولِ برچسب‌های یکتا."""
+        return self._tag_sets
+
+    def __reduce__(self: "Lexicon") -> Tuple[type, tuple]:
+        return Lexicon, (tuple(self._index), self._counts, self._tag_indexes, self._tag_sets)
+
+    def __repr__(self: "Lexicon") -> str:
+        return f"<Lexicon of {len(self)} words>"
+
+
+def build_lexicon(
+    lexicon_file: str,
+    words_file: str = default_words,
+    verbs_file: str = default_verbs,
+) -> None:
+    """فایل‌های `words.dat` و `verbs.dat` را به قالب دودویی تبدیل و ذخیره می‌کند.
+
+    کلمات به ترتیب الفبایی و پشت سر هم، فراوانی‌ها به صورت آرایه‌ای از اعداد
+    ۳۲ بیتی و برچسب‌ها به صورت اندیسی در جدول برچسب‌های یکتا ذخیره می‌شوند.
+    فایل ابتدا در مسیری موقت نوشته و سپس جایگزین می‌شود تا پردازه‌های
+    هم‌زمان هیچ‌گاه فایل نیمه‌کاره نبینند.
+
+    Args:
+        lexicon_file: مسیر فایل دودوییِ خروجی.
+        words_file: مسیر فایل حاوی کلمات.
+        verbs_file: مسیر فایل حاوی افعال.
+
+    """
+    lexicon = Lexicon.from_words(words_list(words_file))
+    _write_sections(
+        lexicon_file,
+        _LEXICON_MAGIC,
+        LEXICON_VERSION,
+        source_digest(words_file, verbs_file),
+        [
+            "\n".join(lexicon.keys()).encode("utf8"),
+            _to_bytes(lexicon.counts),
+            _to_bytes(lexicon.tag_indexes),
+            "\n".join(",".join(tags) for tags in lexicon.tag_sets).encode("utf8"),
+            "\n".join(_read_verbs(verbs_file)).encode("utf8"),
+        ],
+    )
+
+
+def read_lexicon(
+    lexicon_file: str,
+    digest: Optional[bytes] = None,
+) -> Tuple[List[str], array, array, List[Tuple[str]], List[str]]:
+    """نسخهٔ دودویی واژگان را با نگاشت حافظه (mmap) می‌خواند.
+
+    Args:
+        lexicon_file: مسیر فایل دودویی.
+        digest: چکیدهٔ مورد انتظار فایل‌های منبع. اگر داده شود و با چکیدهٔ
+            ذخیره‌شده یکسان نباشد خطا برمی‌گرداند.
+
+    Returns:
+        کلمات مرتب‌شده، فراوانی‌ها، اندیس برچسب‌ها، جدول برچسب‌ها و فهرست افعال.
+
+    Raises:
+        ValueError: اگر فایل معتبر، هم‌نسخه یا منطبق با فایل‌های منبع نباشد.
+
+    """
+
+    def decode(sections: List[memoryview]) -> tuple:
+        words, counts, tag_indexes, tag_sets, verbs = sections
+        counts = _from_bytes("I", counts)
+        return (
+            _split(words, len(counts)),
+            counts,
+            _from_bytes("H", tag_indexes),
+            [tuple(tags.split(",")) for tags in _split(tag_sets, len(tag_sets))],
+            _split(verbs, len(verbs)),
+        )
+
+    return _read_sections(
+        lexicon_file, _LEXICON_MAGIC, LEXICON_VERSION, digest, decode,
+    )
+
+
+def lexicon_path(
+    words_file: str = default_words,
+    verbs_file: str = default_verbs,
+) -> Tuple[Path, bytes]:
+    """مسیر نسخهٔ دودویی متناظر با فایل‌های منبع را برمی‌گرداند.
+
+    Args:
+        words_file: مسیر فایل حاوی کلمات.
+        verbs_file: مسیر فایل حاوی افعال.
+
+    Returns:
+        مسیر فایل دودویی و چکیدهٔ فایل‌های منبع.
+
+    """
+    digest = source_digest(words_file, verbs_file)
+    name = f"lexicon-v{LEXICON_VERSION}-{digest.hex()[:16]}.bin"
+    return cache_dir() / name, digest
+
+
+def load_lexicon(
+    words_file: str = default_words,
+    verbs_file: str = default_verbs,
+) -> Tuple[Lexicon, List[str]]:
+    """واژگان و فهرست افعال را از نسخهٔ دودویی بارگذاری می‌کند.
+
+    اگر نسخهٔ دودویی وجود نداشته باشد یا با فایل‌های منبع منطبق نباشد، ابتدا
+    ساخته می‌شود.
+
+    Examples:
+        >>> words, verbs = load_lexicon()
+        >>> words['آب']
+        (549005877, ('N', 'AJ'))
+        >>> verbs[1]
+        'آجید#آجین'
+
+    Args:
+        words_file: مسیر فایل حاوی کلمات.
+        verbs_file: مسیر فایل حاوی افعال.
+
+    Returns:
+        واژگان به صورت [Lexicon][hazm.lexicon.Lexicon] و فهرست افعال به ترتیب فایل.
+
+    """
+    lexicon_file, digest = lexicon_path(words_file, verbs_file)
+    try:
+        try:
+            lexicon = read_lexicon(lexicon_file, digest)
+        except (OSError, ValueError):
+            build_lexicon(lexicon_file, words_file, verbs_file)
+            lexicon = read_lexicon(lexicon_file, digest)
+    except (OSError, ValueError):
+        # the cache directory is not usable; fall back to the text files
+        return Lexicon.from_words(words_list(words_file)), _read_verbs(verbs_file)
+
+    *words, verbs = lexicon
+    return Lexicon(*words), verbs
+
+
+def build_verb_forms(
+    verb_forms_file: str,
+    verb_forms: Dict[str, str],
+    digest: bytes,
+) -> None:
+    """جدول صورت‌های صرفی افعال را به قالب دودویی ذخیره می‌کند.
+
+    صورت‌های صرفی به همان ترتیب جدول پشت سر هم و فعلِ هر صورت به شکل اندیسی
+    در فهرست افعال یکتا ذخیره می‌شود.
+
+    Args:
+        verb_forms_file: مسیر فایل دودوییِ خروجی.
+        verb_forms: جدول صورت‌های صرفی به شکل `{صورت صرفی: بن ماضی#بن مضارع}`.
+        digest: چکیدهٔ فایل افعال و پیکربندی جدول.
+
+    """
+    verbs: Dict[str, int] = {}
+    verb_indexes = array("H")
+    for verb in verb_forms.values():
+        verb_indexes.append(verbs.setdefault(verb, len(verbs)))
+
+    _write_sections(
+        verb_forms_file,
+        _VERB_FORMS_MAGIC,
+        VERB_FORMS_VERSION,
+        digest,
+        [
+            "\n".join(verb_forms).encode("utf8"),
+            _to_bytes(verb_indexes),
+            "\n".join(verbs).encode("utf8"),
+        ],
+    )
+
+
+def read_verb_forms(
+    verb_forms_file: str,
+    digest: Optional[bytes] = None,
+) -> Dict[str, str]:
+    """جدول دودویی صورت‌های صرفی افعال را می‌خواند.
+
+    Args:
+        verb_forms_file: مسیر فایل دودویی.
+        digest: چکیدهٔ مورد انتظار فایل افعال و پیکربندی جدول.
+
+    Returns:
+        جدول صورت‌های صرفی به شکل `{صورت صرفی: بن ماضی#بن مضارع}`.
+
+    Raises:
+        ValueError: اگر فایل معتبر، هم‌نسخه یا منطبق با فایل افعال نباشد.
+
+    """
+
+    def decode(sections: List[memoryview]) -> Dict[str, str]:
+        forms, verb_indexes, verbs = sections
+        verb_indexes = _from_bytes("H", verb_indexes)
+        verbs = _split(verbs, len(verbs))
+        forms = _split(forms, len(verb_indexes))
+        return dict(zip(forms, map(verbs.__getitem__, verb_indexes)))
+
+    return _read_sections(
+        verb_forms_file, _VERB_FORMS_MAGIC, VERB_FORMS_VERSION, digest, decode,
+    )
+
+
+def load_verb_forms(
+    verbs_file: str,
+    joined_verb_parts: bool,
+    conjugate: Callable[[str, bool], Dict[str, str]],
+    fingerprint: bytes = b"",
+) -> Dict[str, str]:
+    """جدول صورت‌های صرفی افعال را از نسخهٔ دودویی بارگذاری می‌کند.
+
+    اگر نسخهٔ دودویی وجود نداشته باشد یا با فایل افعال و `fingerprint` منطبق
+    نباشد، جدول با `conjugate(verbs_file, joined_verb_parts)` ساخته و ذخیره
+    می‌شود.
+
+    Args:
+        verbs_file: مسیر فایل حاوی افعال.
+        joined_verb_parts: اگر `True` باشد صورت‌های چندبخشیِ افعال هم در جدول هستند.
+        conjugate: تابعی که جدول را از روی فایل افعال می‌سازد.
+        fingerprint: چکیده‌ای از داده‌هایی که `conjugate` در کد به آن‌ها وابسته
+            است، مانند قالب‌های صرف؛ با تغییرِ آن جدول دوباره ساخته می‌شود.
+
+    Returns:
+        جدول صورت‌های صرفی به شکل `{صورت صرفی: بن ماضی#بن مضارع}`.
+
+    """
+    digest = hashlib.sha256(
+        source_digest(verbs_file) + bytes([joined_verb_parts]) + fingerprint,
+    ).digest()
+    name = f"verb-forms-v{VERB_FORMS_VERSION}-{digest.hex()[:16]}.bin"
+    verb_forms_file = cache_dir() / name
+
+    with contextlib.suppress(OSError, ValueError):
+        return read_verb_forms(verb_forms_file, digest)
+
+    verb_forms = conjugate(verbs_file, joined_verb_parts)
+    # if the cache directory is not usable, keep the table in memory only
+    with contextlib.suppress(OSError):
+        build_verb_forms(verb_forms_file, verb_forms, digest)
+    return verb_forms
@@ -1,13 +1,125 @@
 """این ماژول شامل کلاس‌ها و توابعی برای نرمال‌سازی متن است."""
 
 
+import os
 import re
+from collections import Counter
+from functools import partial
+from hashlib import blake2b
+from multiprocessing import Pool
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
+from hazm import DocumentCache
 from hazm import Lemmatizer
+from hazm import Memo
 from hazm import WordTokenizer
+from hazm import default_verbs
+from hazm import default_words
 from hazm import maketrans
-from hazm import regex_replace
+from hazm.cache import cache_sizes
+from hazm.lexicon import source_digest
+
+# bump when the output of `Normalizer.normalize` changes, so that results
+# stored by a `DocumentCache` on disk are not reused
+NORMALIZER_VERSION = 1
+
+
+def _regex_replace(patterns: List[tuple], text: str) -> str:
+    for pattern, repl, guard in patterns:
+        # a pattern is only run if the text contains what all its matches contain
+        if guard is None or guard.search(text):
+            text = pattern.sub(repl, text)
+    return text
+
+
+def _chain_translations(
+    first: Dict[int, Optional[str]], second: Dict[int, Optional[str]],
+) -> Dict[int, Optional[str]]:
+    """جدولی برمی‌گرداند که اثر آن برابر با اجرای پشت سر همِ دو جدول است."""
+    chained = dict(second)
+    for char, new in first.items():
+        chained[char] = new.translate(second) if new else new
+    return chained
+
+
+def _translator(
+    table: Dict[int, Optional[str]],
+) -> Tuple[Callable[[str], str], re.Pattern]:
+    """تابعی برمی‌گرداند که جدول را فقط روی بخش‌هایی از متن اجرا می‌کند که تغییر می‌کنند.
+
+    `str.translate` برای متن غیراَسکی به ازای هر نویسه یک جست‌وجو در
+    دیکشنری انجام می‌دهد؛ یافتنِ همین نویسه‌ها با ریجکس بسیار سریع‌تر است.
+
+    Returns:
+        تابع و الگویی که فقط در صورت وجود نویسه‌های جدول در متن پیدا می‌شود.
+
+    """
+    chars = "[" + "".join(re.escape(chr(char)) for char in table) + "]"
+    pattern = re.compile(chars + "+")
+    return partial(pattern.sub, partial(_translate_match, table)), re.compile(chars)
+
+
+def _translate_match(table: Dict[int, Optional[str]], match: re.Match) -> str:
+    return match.group().translate(table)
+
+
+# the normalizer of a normalize_many() worker process
+_worker = {}
+
+
+def _chunks(
+    lines: Iterable[str], chunk_size: int, keeps_content: Callable[[str], bool],
+) -> Iterator[str]:
+    """خط‌ها را در تکه‌هایی دست‌کم به اندازهٔ `chunk_size` کنار هم می‌گذارد.
+
+    هر تکه فقط پیش از خطی تمام می‌شود که بعد از نرمال‌سازی هم نویسه‌ای غیر
+    از فاصله داشته باشد (`keeps_content`)؛ چنین خطی هیچ‌گاه خالی نمی‌شود، پس
+    هیچ دنباله‌ای از خط‌های خالی (حتی خط‌هایی که بعد از حذف اعراب خالی
+    می‌شوند) بین دو تکه تقسیم نمی‌شود. خطی که با یک حرف یا رقم شروع شود
+    بدون نرمال‌سازی پذیرفته می‌شود.
+
+    """
+    chunk, size = [], 0
+    for line in lines:
+        if (
+            chunk
+            and size >= chunk_size
+            and chunk[-1].endswith("\n")
+            and (line[:1].isalnum() or keeps_content(line))
+        ):
+            yield "".join(chunk)
+            chunk, size = [], 0
+        chunk.append(line)
+        size += len(line)
+    if chunk:
+        yield "".join(chunk)
+
+
+def _init_worker(normalizer: "Normalizer") -> None:
+    _worker["normalizer"] = normalizer
+
+
+def _normalize_in_worker(text: str) -> str:
+    return _worker["normalizer"].normalize(text)
+
+
+# where SentenceTokenizer ends a sentence: the spaces and newlines after
+# one of !.?⸮؟, and an empty line
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[!.?⸮؟])[ \n]+|\n\n")
+
+# the methods that make the word-level decisions of each step
+_DECISIONS = {
+    "seperate_mi": "_separate_mi_word",
+    "token_spacing": "_join_tokens",
+    "decrease_repeated_chars": "_decrease_repeats",
+}
 
 
 class Normalizer:
@@ -22,6 +134,15 @@ class Normalizer:
         persian_numbers: اگر `True` باشد ارقام انگلیسی را با فارسی جایگزین می‌کند.
         unicodes_replacement: اگر `True` باشد برخی از کاراکترهای یونیکد را با معادل نرمال‌شدهٔ آن جایگزین می‌کند.
         seperate_mi: اگر `True` باشد پیشوند «می» و «نمی» را در افعال جدا می‌کند.
+        cache_size: ظرفیت حافظهٔ تصمیم‌های کلمه‌به‌کلمه؛ یعنی جداکردن «می»
+            (`seperate_mi`)، چسباندن توکن‌ها (`token_spacing`) و کاهش تکرارها
+            (`decrease_repeated_chars`). می‌تواند یک عدد برای همه یا دیکشنری‌ای از
+            این نام‌ها به ظرفیت هر کدام باشد. مقدار صفر حافظه را غیرفعال می‌کند.
+            آمار حافظه‌ها در `caches` در دسترس است.
+        document_cache: اگر داده شود نتیجهٔ `normalize` برای متن‌های تکراری
+            از این [DocumentCache][hazm.cache.DocumentCache] خوانده می‌شود. کلیدها
+            به تنظیمات نرمال‌ساز وابسته‌اند؛ پس یک حافظه را می‌توان بین چند
+            نرمال‌ساز به اشتراک گذاشت.
 
     """
 
@@ -35,6 +156,8 @@ class Normalizer:
         persian_numbers: bool = True,
         unicodes_replacement: bool = True,
         seperate_mi: bool = True,
+        cache_size: Union[int, Dict[str, int]] = 0,
+        document_cache: Optional[DocumentCache] = None,
     ) -> None:
         self._correct_spacing = correct_spacing
         self._remove_diacritics = remove_diacritics
@@ -54,9 +177,14 @@ class Normalizer:
             self.tokenizer = WordTokenizer(join_verb_parts=False)
             self.words = self.tokenizer.words
 
+        self._translations = maketrans(self.translation_src, self.translation_dst)
+
         if self._persian_number:
             self.number_translation_src = "0123456789%٠١٢٣٤٥٦٧٨٩"
             self.number_translation_dst = "۰۱۲۳۴۵۶۷۸۹٪۰۱۲۳۴۵۶۷۸۹"
+            self._number_translations = maketrans(
+                self.number_translation_src, self.number_translation_dst,
+            )
 
         if self._correct_spacing:
             self.suffixes = {
@@ -146,26 +274,28 @@ class Normalizer:
             self.more_than_two_repeat_pattern = (
                 r"([آابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی])\1{2,}"
             )
+            # a whole word with a letter repeated more than twice; the lookbehind
+            # makes the search start only at word boundaries, so words without
+            # repeats are scanned once instead of once per letter
             self.repeated_chars_pattern = (
-                r"[آابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی]*"
+                r"(?<![آابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی])"
+                r"[آابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی]*?"
                 + self.more_than_two_repeat_pattern
                 + "[آابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی]*"
             )
 
         if self._remove_diacritics:
-            self.diacritics_patterns = [
-                # remove FATHATAN, DAMMATAN, KASRATAN, FATHA, DAMMA, KASRA, SHADDA, SUKUN
-                ("[\u064b\u064c\u064d\u064e\u064f\u0650\u0651\u0652]", ""),
-            ]
+            # FATHATAN, DAMMATAN, KASRATAN, FATHA, DAMMA, KASRA, SHADDA, SUKUN
+            diacritics = "\u064b\u064c\u064d\u064e\u064f\u0650\u0651\u0652"
+            self.diacritics_patterns = [("[" + diacritics + "]", "")]
+            self._diacritics_translations = dict.fromkeys(map(ord, diacritics))
 
         if self._remove_specials_chars:
-            self.specials_chars_patterns = [
-                # Remove almoast all arabic unicode superscript and subscript characters in the ranges of 00600-06FF, 08A0-08FF, FB50-FDFF, and FE70-FEFF
-                (
-                    "[\u0605\u0653\u0654\u0655\u0656\u0657\u0658\u0659\u065a\u065b\u065c\u065d\u065e\u065f\u0670\u0610\u0611\u0612\u0613\u0614\u0615\u0616\u0618\u0619\u061a\u061e\u06d4\u06d6\u06d7\u06d8\u06d9\u06da\u06db\u06dc\u06dd\u06de\u06df\u06e0\u06e1\u06e2\u06e3\u06e4\u06e5\u06e6\u06e7\u06e8\u06e9\u06ea\u06eb\u06ec\u06ed\u06fd\u06fe\u08ad\u08d4\u08d5\u08d6\u08d7\u08d8\u08d9\u08da\u08db\u08dc\u08dd\u08de\u08df\u08e0\u08e1\u08e2\u08e3\u08e4\u08e5\u08e6\u08e7\u08e8\u08e9\u08ea\u08eb\u08ec\u08ed\u08ee\u08ef\u08f0\u08f1\u08f2\u08f3\u08f4\u08f5\u08f6\u08f7\u08f8\u08f9\u08fa\u08fb\u08fc\u08fd\u08fe\u08ff\ufbb2\ufbb3\ufbb4\ufbb5\ufbb6\ufbb7\ufbb8\ufbb9\ufbba\ufbbb\ufbbc\ufbbd\ufbbe\ufbbf\ufbc0\ufbc1\ufc5e\ufc5f\ufc60\ufc61\ufc62\ufc63\ufcf2\ufcf3\ufcf4\ufd3e\ufd3f\ufe70\ufe71\ufe72\ufe76\ufe77\ufe78\ufe79\ufe7a\ufe7b\ufe7c\ufe7d\ufe7e\ufe7f\ufdfa\ufdfb]",
-                    "",
-                ),
-            ]
+            # almost all arabic unicode superscript and subscript characters in the
+            # ranges of 00600-06FF, 08A0-08FF, FB50-FDFF, and FE70-FEFF
+            specials_chars = "\u0605\u0653\u0654\u0655\u0656\u0657\u0658\u0659\u065a\u065b\u065c\u065d\u065e\u065f\u0670\u0610\u0611\u0612\u0613\u0614\u0615\u0616\u0618\u0619\u061a\u061e\u06d4\u06d6\u06d7\u06d8\u06d9\u06da\u06db\u06dc\u06dd\u06de\u06df\u06e0\u06e1\u06e2\u06e3\u06e4\u06e5\u06e6\u06e7\u06e8\u06e9\u06ea\u06eb\u06ec\u06ed\u06fd\u06fe\u08ad\u08d4\u08d5\u08d6\u08d7\u08d8\u08d9\u08da\u08db\u08dc\u08dd\u08de\u08df\u08e0\u08e1\u08e2\u08e3\u08e4\u08e5\u08e6\u08e7\u08e8\u08e9\u08ea\u08eb\u08ec\u08ed\u08ee\u08ef\u08f0\u08f1\u08f2\u08f3\u08f4\u08f5\u08f6\u08f7\u08f8\u08f9\u08fa\u08fb\u08fc\u08fd\u08fe\u08ff\ufbb2\ufbb3\ufbb4\ufbb5\ufbb6\ufbb7\ufbb8\ufbb9\ufbba\ufbbb\ufbbc\ufbbd\ufbbe\ufbbf\ufbc0\ufbc1\ufc5e\ufc5f\ufc60\ufc61\ufc62\ufc63\ufcf2\ufcf3\ufcf4\ufd3e\ufd3f\ufe70\ufe71\ufe72\ufe76\ufe77\ufe78\ufe79\ufe7a\ufe7b\ufe7c\ufe7d\ufe7e\ufe7f\ufdfa\ufdfb"
+            self.specials_chars_patterns = [("[" + specials_chars + "]", "")]
+            self._specials_chars_translations = dict.fromkeys(map(ord, specials_chars))
 
         if self._seperate_mi:
             self.verbs = Lemmatizer(joined_verb_parts=False).verbs
@@ -185,10 +315,162 @@ class Normalizer:
                 ("ﷸ", "وسلم"),
                 ("ﻵ|ﻶ|ﻷ|ﻸ|ﻹ|ﻺ|ﻻ|ﻼ", "لا"),
             ]
+            # every pattern above is a single character or an alternation of them
+            self._unicodes_translations = {
+                ord(char): new
+                for old, new in self.replacements
+                for char in old.strip("()").split("|")
+            }
+
+        self._compile_patterns()
+        self._plan = self._compile_plan()
+
+        self.caches: Dict[str, Memo] = {
+            name: Memo(getattr(self, _DECISIONS[name]), size)
+            for name, size in cache_sizes(cache_size, tuple(_DECISIONS)).items()
+        }
+        self._install_caches()
+
+        self.skipped_steps: Counter = Counter()
+        self.document_cache = document_cache
+        if document_cache is not None:
+            self._namespace = self._configuration_digest()
+
+    def _configuration_digest(self: "Normalizer") -> bytes:
+        """چکیده‌ای از تنظیمات و واژگانی که خروجی `normalize` به آن‌ها وابسته است."""
+        configuration = (
+            type(self).__qualname__,
+            NORMALIZER_VERSION,
+            self._correct_spacing,
+            self._remove_diacritics,
+            self._remove_specials_chars,
+            self._decrease_repeated_chars,
+            self._persian_style,
+            self._persian_number,
+            self._unicodes_replacement,
+            self._seperate_mi,
+        )
+        digest = blake2b(repr(configuration).encode(), digest_size=32)
+        digest.update(source_digest(default_words, default_verbs))
+        return digest.digest()
+
+    def _install_caches(self: "Normalizer") -> None:
+        # the steps call the cached functions directly, skipping `Memo.__call__`
+        for name, memo in self.caches.items():
+            setattr(self, _DECISIONS[name], memo.cached)
+
+    def __getstate__(self: "Normalizer") -> dict:
+        state = self.__dict__.copy()
+        for name in self.caches:
+            del state[_DECISIONS[name]]
+        return state
+
+    def __setstate__(self: "Normalizer", state: dict) -> None:
+        self.__dict__.update(state)
+        self._install_caches()
+
+    def _compile_patterns(self: "Normalizer") -> None:
+        """الگوهای ریجکسِ مراحل فعال را یک بار کامپایل می‌کند."""
+
+        def compile_all(
+            patterns: List[tuple], guards: Optional[List[Optional[str]]] = None,
+        ) -> List[tuple]:
+            guards = guards or [None] * len(patterns)
+            return [
+                (re.compile(pattern), repl, guard and re.compile(guard))
+                for (pattern, repl), guard in zip(patterns, guards)
+            ]
+
+        if self._correct_spacing:
+            self._extra_space_patterns = compile_all(self.extra_space_patterns)
+            # every match of the patterns above contains one of these; a
+            # ZWNJ is only kept when it is alone and between two letters
+            self._extra_space_guard = re.compile(
+                r" {2}|\n{3}|[ـ\r]|(?<!\w)\u200c|\u200c(?!\w)",
+            )
+            # the guards are cheap searches for what every match of the
+            # corresponding pattern contains; simple patterns need none
+            self._punctuation_spacing_patterns = compile_all(
+                self.punctuation_spacing_patterns,
+                ['" ', None, None, None, None, r"[«\[\(\{]", r"\d", r"\d"],
+            )
+            self._affix_spacing_patterns = compile_all(
+                self.affix_spacing_patterns,
+                ["ه ی ", "می ", " (?:تر|گر|ها)", "ه ا", "هها"],
+            )
+
+        if self._persian_style:
+            self._persian_style_patterns = compile_all(self.persian_style_patterns)
+            self._persian_style_guard = re.compile(r'"|[\d+]\.[\d+]|\.\.\.')
+
+        if self._decrease_repeated_chars:
+            self._more_than_two_repeat_pattern = re.compile(
+                self.more_than_two_repeat_pattern,
+            )
+            self._repeated_chars_pattern = re.compile(self.repeated_chars_pattern)
+
+        if self._seperate_mi:
+            self._joint_mi_pattern = re.compile(self.joint_mi_patterns)
+            self._mi_prefix_pattern = re.compile("^(ن?می)")
+
+    def _compile_plan(
+        self: "Normalizer",
+    ) -> List[Tuple[str, Optional[re.Pattern], Callable[[str], str]]]:
+        """مراحل فعالِ نرمال‌سازی را به ترتیبِ اجرا در قالب یک برنامه می‌چیند.
+
+        مراحلی که فقط نویسه‌ها را جایگزین یا حذف می‌کنند و پشت سر هم اجرا
+        می‌شوند، در یک جدول ترکیب می‌شوند تا با یک فراخوانیِ `str.translate`
+        اجرا شوند. هر مرحله یک الگوی نگهبان هم دارد که هر تغییری که مرحله
+        بدهد از جایی در متن شروع می‌شود که این الگو پیدا شود؛ پس اگر الگو
+        پیدا نشود، مرحله متن را تغییر نمی‌دهد و اجرا نمی‌شود.
+
+        Returns:
+            فهرست مراحل به شکل `(نام، الگوی نگهبان یا None، تابع)`؛ تابع متن را می‌گیرد و متن تغییریافته را برمی‌گرداند.
+
+        """
+        steps: List[tuple] = [("translations", None, self._translations)]
+        if self._persian_style:
+            steps.append(("persian_style", self._persian_style_guard, self.persian_style))
+        if self._persian_number:
+            steps.append(("persian_numbers", None, self._number_translations))
+        if self._remove_diacritics:
+            steps.append(("remove_diacritics", None, self._diacritics_translations))
+        if self._correct_spacing:
+            steps.append(("correct_spacing", None, self.correct_spacing))
+        if self._unicodes_replacement:
+            steps.append(("unicodes_replacement", None, self._unicodes_translations))
+        if self._remove_specials_chars:
+            steps.append(
+                ("remove_specials_chars", None, self._specials_chars_translations),
+            )
+        if self._decrease_repeated_chars:
+            steps.append(("decrease_repeated_chars", None, self.decrease_repeated_chars))
+        if self._seperate_mi:
+            steps.append(("seperate_mi", None, self.seperate_mi))
+
+        plan = []
+        for name, guard, step in steps:
+            if isinstance(step, dict) and plan and isinstance(plan[-1][2], dict):
+                previous, _, table = plan[-1]
+                plan[-1] = (previous + "+" + name, None, _chain_translations(table, step))
+            else:
+                plan.append((name, guard, step))
+
+        for i, (name, _, step) in enumerate(plan):
+            if isinstance(step, dict):
+                # a table only changes the characters it has
+                translate, guard = _translator(step)
+                plan[i] = (name, guard, translate)
+        return plan
 
     def normalize(self: "Normalizer", text: str) -> str:
         """متن را نرمال‌سازی می‌کند.
 
+        پیش از هر مرحله با یک جست‌وجوی ارزان بررسی می‌شود که آیا مرحله اصلاً
+        می‌تواند متن را تغییر دهد؛ مراحلی که نمی‌توانند (مثلاً برای متنی که
+        قبلاً نرمال شده) اجرا نمی‌شوند و تعدادشان به تفکیکِ نام مرحله در
+        `skipped_steps` شمرده می‌شود.
+
         Examples:
             >>> normalizer = Normalizer()
             >>> normalizer.normalize('اِعلاممممم کَرد : « زمین لرزه ای به بُزرگیِ 6 دهم ریشتر ...»')
@@ -203,34 +485,139 @@ class Normalizer:
             متنِ نرمال‌سازی‌شده.
 
         """
-        translations = maketrans(self.translation_src, self.translation_dst)
-        text = text.translate(translations)
+        if self.document_cache is not None:
+            return self.document_cache.lookup(text, self._normalize, self._namespace)
+        return self._normalize(text)
+
+    def _normalize(self: "Normalizer", text: str) -> str:
+        for name, guard, step in self._plan:
+            if guard is None or guard.search(text):
+                text = step(text)
+            else:
+                self.skipped_steps[name] += 1
 
-        if self._persian_style:
-            text = self.persian_style(text)
+        return text
 
-        if self._persian_number:
-            text = self.persian_number(text)
+    def normalize_many(
+        self: "Normalizer",
+        texts: Iterable[str],
+        n_jobs: int = 1,
+        chunksize: int = 64,
+    ) -> Iterator[str]:
+        """متن‌ها را یکی‌یکی نرمال‌سازی می‌کند و نتیجه را به همان ترتیب برمی‌گرداند.
+
+        اگر `n_jobs` بیشتر از یک باشد، متن‌ها در دسته‌هایی به اندازهٔ
+        `chunksize` میان چند پردازه تقسیم می‌شوند. نرمال‌ساز فقط یک بار به هر
+        پردازه فرستاده می‌شود و نه همراهِ هر متن. نتایج به ترتیب ورودی و به
+        محض آماده‌شدن برگردانده می‌شوند؛ بنابراین ورودی می‌تواند یک جریان
+        طولانی از متن‌ها باشد.
 
-        if self._remove_diacritics:
-            text = self.remove_diacritics(text)
+        Examples:
+            >>> normalizer = Normalizer()
+            >>> list(normalizer.normalize_many(['سلام   دنیا', 'ساعت 18']))
+            ['سلام دنیا', 'ساعت ۱۸']
 
-        if self._correct_spacing:
-            text = self.correct_spacing(text)
+        Args:
+            texts: متن‌هایی که باید نرمال‌سازی شوند.
+            n_jobs: تعداد پردازه‌ها. با `1` نرمال‌سازی در همین پردازه انجام
+                می‌شود و با `-1` به تعداد هسته‌های پردازنده پردازه ساخته می‌شود.
+            chunksize: تعداد متن‌هایی که یک‌جا به هر پردازه فرستاده می‌شود.
 
-        if self._unicodes_replacement:
-            text = self.unicodes_replacement(text)
+        Yields:
+            متنِ نرمال‌سازی‌شده.
 
-        if self._remove_specials_chars:
-            text = self.remove_specials_chars(text)
+        Raises:
+            ValueError: اگر `n_jobs` نه `-1` باشد و نه عددی مثبت.
 
-        if self._decrease_repeated_chars:
-            text = self.decrease_repeated_chars(text)
+        """
+        if n_jobs == 0 or n_jobs < -1:
+            msg = "n_jobs must be -1 or >= 1"
+            raise ValueError(msg)
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
 
-        if self._seperate_mi:
-            text = self.seperate_mi(text)
+        if n_jobs == 1:
+            yield from map(self.normalize, texts)
+            return
 
-        return text
+        with Pool(n_jobs, initializer=_init_worker, initargs=(self,)) as pool:
+            yield from pool.imap(_normalize_in_worker, texts, chunksize)
+
+    def normalize_stream(
+        self: "Normalizer", lines: Iterable[str], chunk_size: int = 2**16,
+    ) -> Iterator[str]:
+        r"""متنی طولانی را تکه‌تکه نرمال‌سازی می‌کند.
+
+        خط‌های ورودی (مثلاً یک فایل باز) در تکه‌هایی حدوداً به اندازهٔ
+        `chunk_size` نویسه نرمال‌سازی می‌شوند؛ بنابراین حافظهٔ مصرفی به اندازهٔ
+        تکه‌ها بستگی دارد و نه به اندازهٔ کل متن. الحاقِ خروجی‌ها دقیقاً برابر
+        با نرمال‌سازیِ کل متن با `normalize` است.
+
+        Examples:
+            >>> normalizer = Normalizer()
+            >>> ''.join(normalizer.normalize_stream(['سلام   دنیا\n', '\n', 'ساعت 18\n'], chunk_size=1))
+            'سلام دنیا\n\nساعت ۱۸\n'
+
+        Args:
+            lines: خط‌های متن، هر کدام همراه با `\n` انتهایی‌اش.
+            chunk_size: حداقل تعداد نویسه‌های هر تکه. یک خط هیچ‌وقت تقسیم نمی‌شود.
+
+        Yields:
+            متنِ نرمال‌سازی‌شدهٔ تکه‌ها به ترتیب.
+
+        """
+        chunks = _chunks(lines, chunk_size, self._keeps_content)
+        first = next(chunks, None)
+        if first is None:
+            return
+        yield self.normalize(first)
+        for chunk in chunks:
+            # inside the whole text a chunk follows a newline; the newline
+            # gives the patterns that look behind the chunk start the same
+            # context, and is removed from the result
+            yield self.normalize("\n" + chunk)[1:]
+
+    def _keeps_content(self: "Normalizer", line: str) -> bool:
+        # runs the plan without its guards, so skipped_steps is not counted
+        for _, _, step in self._plan:
+            line = step(line)
+        return bool(line.strip())
+
+    def normalize_tokens(self: "Normalizer", text: str) -> List[List[str]]:
+        """متن را نرمال‌سازی می‌کند و آن را جمله‌به‌جمله و توکن‌به‌توکن برمی‌گرداند.
+
+        خروجی همان جمله‌ها و توکن‌هایی است که
+        [SentenceTokenizer][hazm.SentenceTokenizer] و
+        [WordTokenizer][hazm.WordTokenizer] (با `join_verb_parts=False`) از
+        `normalize(text)` می‌سازند؛ اما بدون ساختنِ رشته‌های میانیِ جمله‌ها و
+        فراخوانیِ توکن‌ساز برای هر جمله. اجزای افعال مرکب به هم وصل نمی‌شوند؛ برای این
+        کار می‌توان هر جمله را به `WordTokenizer.join_verb_parts` داد.
+
+        Examples:
+            >>> normalizer = Normalizer()
+            >>> normalizer.normalize_tokens('زمین لرزه ای به بزرگی 6 ریشتر آمد. نمیدانم چرا!')
+            [['زمین‌لرزه‌ای', 'به', 'بزرگی', '۶', 'ریشتر', 'آمد', '.'], ['نمی‌دانم', 'چرا', '!']]
+
+        Args:
+            text: متنی که باید نرمال‌سازی شود.
+
+        Returns:
+            فهرست جمله‌ها که هر جمله فهرستی از توکن‌هاست.
+
+        """
+        # __init__ only builds the tokenizer for correct_spacing and
+        # decrease_repeated_chars
+        if not hasattr(self, "tokenizer"):
+            self.tokenizer = WordTokenizer(join_verb_parts=False)
+        findall = self.tokenizer.token_pattern.findall
+        sentences = _SENTENCE_BOUNDARY.split(self.normalize(text))
+        # token_pattern only splits on space, newline and tab, so the other
+        # whitespace is stripped as SentenceTokenizer.tokenize does
+        return [
+            tokens
+            for tokens in (findall(sentence.strip()) for sentence in sentences)
+            if tokens
+        ]
 
     def correct_spacing(self: "Normalizer", text: str) -> str:
         """فاصله‌گذاری‌ها را در پیشوندها و پسوندها اصلاح می‌کند.
@@ -262,21 +649,21 @@ class Normalizer:
 
 
         """
-        text = regex_replace(self.extra_space_patterns, text)
+        if self._extra_space_guard.search(text):
+            text = _regex_replace(self._extra_space_patterns, text)
 
         lines = text.split("\n")
         result = []
         for line in lines:
             tokens = self.tokenizer.tokenize(line)
-            spaced_tokens = self.token_spacing(tokens)
+            spaced_tokens = self.token_spacing(tokens) if self._may_join(tokens) else tokens
             line = " ".join(spaced_tokens)
             result.append(line)
 
         text = "\n".join(result)
 
-        text = regex_replace(self.affix_spacing_patterns, text)
-        return regex_replace(self.punctuation_spacing_patterns, text)
-
+        text = _regex_replace(self._affix_spacing_patterns, text)
+        return _regex_replace(self._punctuation_spacing_patterns, text)
 
     def remove_diacritics(self: "Normalizer", text: str) -> str:
         """اِعراب را از متن حذف می‌کند.
@@ -299,7 +686,7 @@ class Normalizer:
             متنی بدون اعراب.
 
         """
-        return regex_replace(self.diacritics_patterns, text)
+        return text.translate(self._diacritics_translations)
 
     def remove_specials_chars(self: "Normalizer", text: str) -> str:
         """برخی از کاراکترها و نشانه‌های خاص را که کاربردی در پردازش متن ندارند حذف
@@ -317,7 +704,7 @@ class Normalizer:
             متنی بدون کاراکترها و نشانه‌های اضافه.
 
         """
-        return regex_replace(self.specials_chars_patterns, text)
+        return text.translate(self._specials_chars_translations)
 
     def decrease_repeated_chars(self: "Normalizer", text: str) -> str:
         """تکرارهای زائد حروف را در کلماتی مثل سلامممممم حذف می‌کند و در مواردی که
@@ -343,21 +730,26 @@ class Normalizer:
             متنی بدون کاراکترهای زائد یا حداقل با دو تکرار.
 
         """
-        matches = re.finditer(self.repeated_chars_pattern, text)
+        decisions = {}
 
-        for m in matches:
-            word = m.group()
-            if word not in self.words:
-                no_repeat = re.sub(self.more_than_two_repeat_pattern, r"\1", word)
-                two_repeat = re.sub(self.more_than_two_repeat_pattern, r"\1\1", word)
+        def replace_match(match: re.Match) -> str:
+            word = match.group()
+            if word not in decisions:
+                decisions[word] = self._decrease_repeats(word)
+            return decisions[word]
 
-                if (no_repeat in self.words) != (two_repeat in self.words):
-                    r = no_repeat if no_repeat in self.words else two_repeat
-                    text = text.replace(word, r)
-                else:
-                    text = text.replace(word, two_repeat)
+        return self._repeated_chars_pattern.sub(replace_match, text)
 
-        return text
+    def _decrease_repeats(self: "Normalizer", word: str) -> str:
+        """شکلِ درستِ کلمه‌ای با تکرارهای زائد را برمی‌گرداند."""
+        if word in self.words:
+            return word
+
+        no_repeat = self._more_than_two_repeat_pattern.sub(r"\1", word)
+        two_repeat = self._more_than_two_repeat_pattern.sub(r"\1\1", word)
+        if (no_repeat in self.words) != (two_repeat in self.words):
+            return no_repeat if no_repeat in self.words else two_repeat
+        return two_repeat
 
     def persian_style(self: "Normalizer", text: str) -> str:
         """برخی از حروف و نشانه‌ها را با حروف و نشانه‌های فارسی جایگزین می‌کند.
@@ -380,7 +772,7 @@ class Normalizer:
             متنی با حروف و نشانه‌های فارسی‌سازی شده.
 
         """
-        return regex_replace(self.persian_style_patterns, text)
+        return _regex_replace(self._persian_style_patterns, text)
 
     def persian_number(self: "Normalizer", text: str) -> str:
         """اعداد لاتین و علامت % را با معادل فارسی آن جایگزین می‌کند.
@@ -401,11 +793,7 @@ class Normalizer:
             متنی با اعداد و علامت ٪ فارسی.
 
         """
-        translations = maketrans(
-            self.number_translation_src,
-            self.number_translation_dst,
-        )
-        return text.translate(translations)
+        return text.translate(self._number_translations)
 
     def unicodes_replacement(self: "Normalizer", text: str) -> str:
         """برخی از کاراکترهای خاص یونیکد را با معادلِ نرمال آن جایگزین می‌کند. غالباً
@@ -442,10 +830,7 @@ class Normalizer:
             متنی که برخی از کاراکترهای یونیکد آن با شکل استاندارد جایگزین شده است.
 
         """
-        for old, new in self.replacements:
-            text = re.sub(old, new, text)
-
-        return text
+        return text.translate(self._unicodes_translations)
 
     def seperate_mi(self: "Normalizer", text: str) -> str:
         """پیشوند «می» و «نمی» را در افعال جدا کرده و با نیم‌فاصله می‌چسباند.
@@ -467,16 +852,16 @@ class Normalizer:
             متنی با «می» و «نمی» جدا شده.
 
         """
-        def replace_match(match):
-            m = match.group(0)
-            r = re.sub("^(ن?می)", r"\1‌", m)
-            if r in self.verbs:
-                return r
-            return m
-
-        text = re.sub(r"\bن?می[آابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی]+", replace_match, text)
-    
-        return text
+        return self._joint_mi_pattern.sub(
+            lambda match: self._separate_mi_word(match.group()), text,
+        )
+
+    def _separate_mi_word(self: "Normalizer", word: str) -> str:
+        """اگر کلمه با جداکردن «می» یا «نمی» فعل شود، شکل جداشده را برمی‌گرداند."""
+        separated = self._mi_prefix_pattern.sub(r"\1‌", word)
+        if separated in self.verbs:
+            return separated
+        return word
 
     def token_spacing(self: "Normalizer", tokens: List[str]) -> List[str]:
         """توکن‌های ورودی را به فهرستی از توکن‌های نرمال‌سازی شده تبدیل می‌کند.
@@ -512,27 +897,54 @@ class Normalizer:
             joined = False
 
             if result:
-                token_pair = result[-1] + "‌" + token
+                joined = self._join_tokens(result[-1], token)
                 if (
-                    token_pair in self.verbs
-                    or token_pair in self.words
-                    and self.words[token_pair][0] > 0
+                    joined == "word"
+                    and t < len(tokens) - 1
+                    and token + "_" + tokens[t + 1] in self.verbs
                 ):
-                    joined = True
-
-                    if (
-                        t < len(tokens) - 1
-                        and token + "_" + tokens[t + 1] in self.verbs
-                    ):
-                        joined = False
-
-                elif token in self.suffixes and result[-1] in self.words:
-                    joined = True
+                    joined = False
 
             if joined:
-                result.pop()
-                result.append(token_pair)
+                result.append(result.pop() + "‌" + token)
             else:
                 result.append(token)
 
         return result
+
+    def _may_join(self: "Normalizer", tokens: List[str]) -> bool:
+        """مشخص می‌کند که آیا `token_spacing` ممکن است توکن‌ها را به هم بچسباند.
+
+        اولین چسباندن همیشه بین دو توکنِ مجاورِ ورودی است؛ پس اگر هیچ جفتِ
+        مجاوری در واژگان نباشد و هیچ توکنی پسوند نباشد، چیزی نمی‌چسبد. این
+        بررسی بدون حلقهٔ پایتونی انجام می‌شود.
+
+        """
+        if len(tokens) < 2:
+            return False
+        following = tokens[1:]
+        pairs = list(map("‌".join, zip(tokens, following)))
+        return (
+            not self.suffixes.isdisjoint(following)
+            or any(map(self.verbs.__contains__, pairs))
+            or any(map(self.words.__contains__, pairs))
+        )
+
+    def _join_tokens(self: "Normalizer", previous: str, token: str) -> str:
+        """دلیلِ چسباندن توکن به توکنِ قبلی را برمی‌گرداند.
+
+        خروجی `word` است اگر ترکیب این دو، فعل یا کلمه‌ای از واژگان باشد،
+        `suffix` اگر توکن پسوندِ کلمهٔ قبلی باشد و رشتهٔ خالی اگر نباید بچسبد.
+
+        """
+        token_pair = previous + "‌" + token
+        if (
+            token_pair in self.verbs
+            or token_pair in self.words
+            and self.words[token_pair][0] > 0
+        ):
+            return "word"
+
+        if token in self.suffixes and previous in self.words:
+            return "suffix"
+        return ""
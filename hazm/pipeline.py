@@ -0,0 +1,265 @@
+"""این ماژول شامل کلاسی برای پردازشِ زنجیره‌ایِ جریانی از متن‌هاست.
+
+[Pipeline][hazm.Pipeline] مراحلِ معمولِ پردازش یعنی نرمال‌سازی، استخراج
+جملات و کلمات، برچسب‌گذاری، ریشه‌یابی و تقطیع را پشتِ سرِ هم روی متن‌ها اجرا
+می‌کند؛ اجزا فقط یک بار ساخته می‌شوند و جملاتِ چند متن با هم به برچسب‌زن
+داده می‌شوند.
+
+"""
+
+import os
+import time
+from collections import Counter
+from collections import deque
+from multiprocessing import Pool
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from nltk.tree import Tree
+
+from hazm import Lemmatizer
+from hazm import Normalizer
+from hazm import SentenceTokenizer
+from hazm import WordTokenizer
+
+if TYPE_CHECKING:
+    from hazm import Chunker
+    from hazm import POSTagger
+
+_worker = {}
+
+
+def _init_worker(pipeline: "Pipeline") -> None:
+    _worker["pipeline"] = pipeline
+
+
+def _run_in_worker(texts: List[str]) -> Tuple[List["Document"], Counter]:
+    pipeline = _worker["pipeline"]
+    pipeline.timings.clear()
+    return list(pipeline._run(texts)), pipeline.timings  # noqa: SLF001
+
+
+def _batches(texts: Iterable[str], size: int) -> Iterator[List[str]]:
+    batch = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Document(NamedTuple):
+    """نتیجهٔ پردازشِ یک متن.
+
+    Attributes:
+        sentences: توکن‌های هر جمله.
+        tags: `(توکن، برچسب)`های هر جمله؛ بدون برچسب‌زن `None` است.
+        lemmas: ریشهٔ توکن‌های هر جمله؛ بدون ریشه‌یاب `None` است.
+        chunks: درختِ تقطیع‌شدهٔ هر جمله؛ بدون تقطیع‌گر `None` است.
+
+    """
+
+    sentences: List[List[str]]
+    tags: Optional[List[List[Tuple[str, str]]]] = None
+    lemmas: Optional[List[List[str]]] = None
+    chunks: Optional[List[Tree]] = None
+
+
+class Pipeline:
+    """این کلاس مراحلِ پردازش را روی جریانی از متن‌ها اجرا می‌کند.
+
+    هر متن نرمال‌سازی و به جمله‌ها و توکن‌ها شکسته می‌شود؛ توکن‌ها همان
+    خروجیِ `sent_tokenize` و `word_tokenize` روی متنِ نرمال‌شده هستند. اگر
+    `sentence_tokenizer` و `word_tokenizer` داده نشوند، توکن‌ها از
+    [normalize_tokens][hazm.Normalizer.normalize_tokens] گرفته می‌شوند و متنِ
+    نرمال‌شده دوباره توکن‌بندی نمی‌شود. سپس جملاتِ متن‌های پیاپی تا
+    `batch_size` جمله کنار هم گذاشته می‌شوند و هر دسته یک‌جا برچسب‌گذاری،
+    ریشه‌یابی و تقطیع می‌شود.
+
+    زمانِ صرف‌شده در هر مرحله (به ثانیه) در `timings` جمع می‌شود.
+
+    Examples:
+        >>> pipeline = Pipeline(lemmatizer=Lemmatizer())
+        >>> document = pipeline('کتاب‌ها را خوانده بودم. نمیدانم چرا!')
+        >>> document.sentences
+        [['کتاب‌ها', 'را', 'خوانده_بودم', '.'], ['نمی‌دانم', 'چرا', '!']]
+        >>> document.lemmas
+        [['کتاب', 'را', 'خواند#خوان', '.'], ['دانست#دان', 'چرا', '!']]
+        >>> sorted(pipeline.timings)
+        ['lemmatize', 'tokenize']
+
+    Args:
+        normalizer: نرمال‌ساز؛ به‌طور پیش‌فرض `Normalizer()`.
+        sentence_tokenizer: جمله‌یاب؛ اگر داده شود متنِ نرمال‌شده با آن به
+            جمله‌ها شکسته می‌شود.
+        word_tokenizer: توکن‌ساز؛ اگر داده شود هر جمله با آن توکن‌بندی می‌شود.
+        tagger: برچسب‌زنِ اجزای کلام، مثلاً [POSTagger][hazm.POSTagger].
+        lemmatizer: ریشه‌یاب؛ اگر برچسب‌زن هم باشد برچسبِ هر توکن به آن داده
+            می‌شود.
+        chunker: تقطیع‌گر، مثلاً [Chunker][hazm.Chunker]؛ به برچسب‌زن نیاز دارد.
+        batch_size: حداقل تعداد جملاتی که یک‌جا برچسب‌گذاری می‌شوند.
+        n_jobs: تعداد پردازه‌ها. با `1` همه‌چیز در همین پردازه انجام می‌شود و
+            با `-1` به تعداد هسته‌های پردازنده پردازه ساخته می‌شود.
+        chunksize: تعداد متن‌هایی که یک‌جا به هر پردازه فرستاده می‌شود.
+        queue_size: حداکثر تعداد دسته‌های در انتظارِ هر پردازه؛ بنابراین
+            حافظهٔ مصرفی به طولِ جریانِ ورودی بستگی ندارد.
+
+    Raises:
+        ValueError: اگر `chunker` بدون `tagger` داده شود یا `n_jobs` نه `-1`
+            باشد و نه عددی مثبت.
+
+    """
+
+    def __init__(
+        self: "Pipeline",
+        normalizer: Optional[Normalizer] = None,
+        sentence_tokenizer: Optional[SentenceTokenizer] = None,
+        word_tokenizer: Optional[WordTokenizer] = None,
+        tagger: Optional["POSTagger"] = None,
+        lemmatizer: Optional[Lemmatizer] = None,
+        chunker: Optional["Chunker"] = None,
+        batch_size: int = 128,
+        n_jobs: int = 1,
+        chunksize: int = 64,
+        queue_size: int = 2,
+    ) -> None:
+        if chunker is not None and tagger is None:
+            msg = "chunker needs the tags of a tagger."
+            raise ValueError(msg)
+        if n_jobs == 0 or n_jobs < -1:
+            msg = "n_jobs must be -1 or >= 1"
+            raise ValueError(msg)
+
+        self.normalizer = Normalizer() if normalizer is None else normalizer
+        # the tokens of normalize_tokens are reused unless a tokenizer is given
+        self._reuse_tokens = sentence_tokenizer is None and word_tokenizer is None
+        self.sentence_tokenizer = (
+            SentenceTokenizer() if sentence_tokenizer is None else sentence_tokenizer
+        )
+        self.word_tokenizer = WordTokenizer() if word_tokenizer is None else word_tokenizer
+        self.tagger = tagger
+        self.lemmatizer = lemmatizer
+        self.chunker = chunker
+        self.batch_size = batch_size
+        self.n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+        self.chunksize = chunksize
+        self.queue_size = queue_size
+        self.timings: Counter = Counter()
+
+    def __call__(self: "Pipeline", text: str) -> Document:
+        """یک متن را پردازش می‌کند.
+
+        Args:
+            text: متنی که باید پردازش شود.
+
+        Returns:
+            نتیجهٔ پردازشِ متن.
+
+        """
+        return next(self._run([text]))
+
+    def pipe(self: "Pipeline", texts: Iterable[str]) -> Iterator[Document]:
+        """متن‌ها را یکی‌یکی پردازش می‌کند و نتیجه را به همان ترتیب برمی‌گرداند.
+
+        ورودی می‌تواند جریانی طولانی از متن‌ها (مثلاً خط‌های یک فایل) باشد؛
+        متن‌ها به اندازهٔ یک دسته خوانده و نتیجه‌ها به محضِ آماده‌شدن
+        برگردانده می‌شوند. اگر `n_jobs` بیشتر از یک باشد، پایپ‌لاین فقط یک بار
+        به هر پردازه فرستاده می‌شود و دسته‌های `chunksize` متنی میان پردازه‌ها
+        تقسیم می‌شوند؛ در این حالت `timings` مجموعِ زمانِ پردازه‌هاست.
+
+        Examples:
+            >>> pipeline = Pipeline()
+            >>> [document.sentences for document in pipeline.pipe(['سلام   دنیا', 'ساعت 18'])]
+            [[['سلام', 'دنیا']], [['ساعت', '۱۸']]]
+
+        Args:
+            texts: متن‌هایی که باید پردازش شوند.
+
+        Yields:
+            نتیجهٔ پردازشِ هر متن.
+
+        """
+        if self.n_jobs == 1:
+            yield from self._run(texts)
+            return
+
+        with Pool(self.n_jobs, initializer=_init_worker, initargs=(self,)) as pool:
+            pending = deque()
+            for batch in _batches(texts, self.chunksize):
+                if len(pending) == self.queue_size * self.n_jobs:
+                    yield from self._collect(pending.popleft().get())
+                pending.append(pool.apply_async(_run_in_worker, (batch,)))
+            while pending:
+                yield from self._collect(pending.popleft().get())
+
+    def _collect(self: "Pipeline", result: Tuple[List[Document], Counter]) -> List[Document]:
+        documents, timings = result
+        self.timings.update(timings)
+        return documents
+
+    def _run(self: "Pipeline", texts: Iterable[str]) -> Iterator[Document]:
+        documents = []
+        sentences = 0
+        for text in texts:
+            start = time.perf_counter()
+            documents.append(self._tokenize(text))
+            self.timings["tokenize"] += time.perf_counter() - start
+            sentences += len(documents[-1])
+            if sentences >= self.batch_size:
+                yield from self._annotate(documents)
+                documents = []
+                sentences = 0
+        if documents:
+            yield from self._annotate(documents)
+
+    def _tokenize(self: "Pipeline", text: str) -> List[List[str]]:
+        if self._reuse_tokens:
+            join_verb_parts = self.word_tokenizer.join_verb_parts
+            return [join_verb_parts(tokens) for tokens in self.normalizer.normalize_tokens(text)]
+
+        sentences = self.sentence_tokenizer.tokenize(self.normalizer.normalize(text))
+        return [self.word_tokenizer.tokenize(sentence) for sentence in sentences]
+
+    def _annotate(self: "Pipeline", documents: List[List[List[str]]]) -> List[Document]:
+        sentences = [sentence for document in documents for sentence in document]
+        tags = lemmas = chunks = None
+
+        if self.tagger is not None:
+            start = time.perf_counter()
+            tags = self.tagger.tag_sents(sentences)
+            self.timings["tag"] += time.perf_counter() - start
+
+        if self.lemmatizer is not None:
+            start = time.perf_counter()
+            if tags is None:
+                lemmatize = self.lemmatizer.lemmatize
+                lemmas = [list(map(lemmatize, sentence)) for sentence in sentences]
+            else:
+                lemmas = self.lemmatizer.lemmatize_sents(tags)
+            self.timings["lemmatize"] += time.perf_counter() - start
+
+        if self.chunker is not None:
+            start = time.perf_counter()
+            chunks = list(self.chunker.parse_sents(tags))
+            self.timings["chunk"] += time.perf_counter() - start
+
+        results = []
+        end = 0
+        for document in documents:
+            start, end = end, end + len(document)
+            results.append(
+                Document(
+                    document,
+                    None if tags is None else tags[start:end],
+                    None if lemmas is None else lemmas[start:end],
+                    None if chunks is None else chunks[start:end],
+                ),
+            )
+        return results
@@ -0,0 +1,92 @@
+"""این ماژول شامل رجیستری سراسری منابع مشترک هضم است.
+
+کلاس‌هایی مثل [Normalizer][hazm.Normalizer]،
+[Lemmatizer][hazm.Lemmatizer] و [TokenSplitter][hazm.TokenSplitter] هر کدام
+به واژگان و جدول صورت‌های صرفی افعال نیاز دارند. این منابع بزرگ برای هر
+پیکربندی (مسیر فایل‌ها و پرچم‌ها) فقط یک بار در هر پردازه ساخته می‌شوند و
+نسخهٔ فقط‌خواندنیِ آن‌ها بین همهٔ اجزا به اشتراک گذاشته می‌شود.
+
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import NoReturn
+from typing import Tuple
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_lock = threading.RLock()
+_resources: Dict[Tuple[Hashable, ...], Any] = {}
+
+
+class FrozenDict(dict):
+    """دیکشنری فقط‌خواندنی برای منابع مشترک.
+
+    خواندن از این دیکشنری به سرعتِ دیکشنری معمولی است؛ اما هر تلاشی برای
+    تغییر آن خطای `TypeError` برمی‌گرداند. برای تغییر، ابتدا با `dict()` از آن
+    رونوشت بگیرید.
+
+    """
+
+    def _readonly(self: "FrozenDict", *_args: object, **_kwargs: object) -> NoReturn:
+        msg = "shared resources are read-only; copy them with dict() first."
+        raise TypeError(msg)
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self: "FrozenDict") -> Tuple[type, Tuple[dict]]:
+        return FrozenDict, (dict(self),)
+
+
+def _key_part(arg: Hashable) -> Hashable:
+    if isinstance(arg, (str, os.PathLike)):
+        return str(Path(arg).resolve())
+    return arg
+
+
+def shared_resource(name: str, factory: Callable[..., T], *args: Hashable) -> T:
+    """منبع مشترک `name` را برای پیکربندی `args` برمی‌گرداند.
+
+    بار اول منبع با فراخوانی `factory(*args)` ساخته می‌شود و در فراخوانی‌های
+    بعدی همان نمونه برگردانده می‌شود. مسیر فایل‌ها پیش از مقایسه به مسیر مطلق
+    تبدیل می‌شوند.
+
+    Examples:
+        >>> first = shared_resource("example", lambda n: tuple(range(n)), 3)
+        >>> first is shared_resource("example", lambda n: tuple(range(n)), 3)
+        True
+
+    Args:
+        name: نام منبع.
+        factory: تابعی که منبع را می‌سازد. منبعِ ساخته‌شده نباید تغییرپذیر باشد.
+        *args: پارامترهای پیکربندی منبع؛ مانند مسیر فایل‌ها و پرچم‌ها.
+
+    Returns:
+        نمونهٔ مشترکِ منبع.
+
+    """
+    key = (name, *map(_key_part, args))
+    resource = _resources.get(key)
+    if resource is None:
+        with _lock:
+            resource = _resources.get(key)
+            if resource is None:
+                resource = _resources[key] = factory(*args)
+    return resource
+
+
+def clear_resources() -> None:
+    """همهٔ منابع مشترک را از رجیستری حذف می‌کند.
+
+    اجزایی که پیش از این ساخته شده‌اند همچنان به منابع قبلی دسترسی دارند.
+
+    """
+    with _lock:
+        _resources.clear()
@@ -6,7 +6,11 @@
 
 
 import re
+from array import array
+from typing import Iterator
 from typing import List
+from typing import TextIO
+from typing import Tuple
 
 from nltk.tokenize.api import TokenizerI
 
@@ -16,6 +20,12 @@ class SentenceTokenizer(TokenizerI):
 
     def __init__(self: "SentenceTokenizer") -> None:
         self.pattern = re.compile(r"([!.?⸮؟]+)[ \n]+")
+        # a sentence without the whitespace around it
+        self._content_pattern = re.compile(r"\S(?:.*\S)?", re.DOTALL)
+        # the end of a run of whitespace that holds a sentence boundary; no
+        # separator crosses it, so the text before and after it can be
+        # tokenized apart
+        self._boundary_pattern = re.compile(r"(?<=[!.?⸮؟])[ \n]\s*(?=\S)|\n\n\s*(?=\S)")
 
     def tokenize(self: "SentenceTokenizer", text: str) -> List[str]:
         """متن ورودی را به جملات سازندهٔ آن می‌شِکند.
@@ -38,3 +48,103 @@ class SentenceTokenizer(TokenizerI):
             for sentence in text.split("\n\n")
             if sentence.strip()
         ]
+
+    def tokenize_stream(
+        self: "SentenceTokenizer", readable: TextIO, chunk_size: int = 2**16,
+    ) -> Iterator[str]:
+        """جملات یک فایل متنی را تکه‌تکه می‌خواند و یکی‌یکی برمی‌گرداند.
+
+        متن در تکه‌هایی به اندازهٔ `chunk_size` نویسه خوانده می‌شود و هر بار
+        جملاتی برگردانده می‌شوند که تا آخرین مرز جملهٔ خوانده‌شده تمام
+        شده‌اند؛ پس حافظهٔ مصرفی به اندازهٔ تکه‌ها و طولانی‌ترین جمله بستگی
+        دارد و نه به اندازهٔ کل متن. خروجی دقیقاً برابر با `tokenize` روی کل
+        متن است.
+
+        Examples:
+            >>> import io
+            >>> tokenizer = SentenceTokenizer()
+            >>> list(tokenizer.tokenize_stream(io.StringIO('جدا کردن ساده است. تقریبا البته!'), chunk_size=4))
+            ['جدا کردن ساده است.', 'تقریبا البته!']
+
+        Args:
+            readable: فایل یا هر شیئی با متد `read` که متن برمی‌گرداند.
+            chunk_size: تعداد نویسه‌هایی که در هر بار خواندن خوانده می‌شود.
+
+        Yields:
+            جملات متن به ترتیب.
+
+        """
+        buffer = ""
+        while True:
+            chunk = readable.read(chunk_size)
+            if not chunk:
+                break
+
+            # a boundary needs the whitespace after it, so one at the end of
+            # the previous buffer may be found now
+            start = len(buffer)
+            while start and buffer[start - 1].isspace():
+                start -= 1
+            buffer += chunk
+
+            cut = 0
+            for boundary in self._boundary_pattern.finditer(buffer, start):
+                cut = boundary.end()
+            if cut:
+                yield from self.tokenize(buffer[:cut])
+                buffer = buffer[cut:]
+
+        yield from self.tokenize(buffer)
+
+    def span_tokenize(self: "SentenceTokenizer", text: str) -> Iterator[Tuple[int, int]]:
+        r"""بازهٔ جملات متن را برمی‌گرداند.
+
+        `text[start:end]` همان جمله‌ای است که `tokenize` برمی‌گرداند؛ جز
+        اینکه `\n`های درون جمله به فاصله تبدیل نشده‌اند.
+
+        Examples:
+            >>> tokenizer = SentenceTokenizer()
+            >>> list(tokenizer.span_tokenize('جدا کردن ساده است. تقریبا البته!'))
+            [(0, 18), (19, 32)]
+
+        Args:
+            text: متنی که باید جملات آن استخراج شود.
+
+        Yields:
+            بازهٔ `(start, end)` هر جمله به ترتیب.
+
+        """
+        start = 0
+        for separator in [*self.pattern.finditer(text), None]:
+            end = separator.end(1) if separator else len(text)
+            # the text between two separators may still hold paragraphs
+            while True:
+                paragraph_end = text.find("\n\n", start, end)
+                content = self._content_pattern.search(
+                    text, start, end if paragraph_end < 0 else paragraph_end,
+                )
+                if content:
+                    yield content.span()
+                if paragraph_end < 0:
+                    break
+                start = paragraph_end + 2
+            if separator:
+                start = separator.end()
+
+    def span_tokenize_array(self: "SentenceTokenizer", text: str) -> Tuple[array, array]:
+        """بازهٔ جملات متن را در قالب دو آرایهٔ عدد صحیحِ ۳۲ بیتی برمی‌گرداند.
+
+        Examples:
+            >>> tokenizer = SentenceTokenizer()
+            >>> tokenizer.span_tokenize_array('جدا کردن ساده است. تقریبا البته!')
+            (array('i', [0, 19]), array('i', [18, 32]))
+
+        Args:
+            text: متنی که باید جملات آن استخراج شود.
+
+        Returns:
+            آرایهٔ ابتدا و آرایهٔ انتهای بازهٔ جملات.
+
+        """
+        spans = list(self.span_tokenize(text))
+        return array("i", [start for start, _ in spans]), array("i", [end for _, end in spans])
@@ -57,18 +57,34 @@ class SequenceTagger:
     """این کلاس شامل توابعی برای برچسب‌گذاری توکن‌ها است. این کلاس در نقش یک
     wrapper برای کتابخانهٔ [python-crfsuite](https://python-crfsuite.readthedocs.io/en/latest/) است.
 
+    نمونه‌های این کلاس را می‌توان pickle کرد (مثلاً برای فرستادن به
+    پردازه‌های دیگر)؛ مدلِ crfsuite خودش pickle نمی‌شود و پس از بازیابی دوباره
+    از همان فایل بارگذاری می‌شود.
+
     Args:
         model (str, optional): مسیر فایل tagger.
         data_maker (function, optional): تابعی که لیستی دو بعدی از کلمات توکنایز شده را گرفته و لیست دو بعدی از از دیکشنری‌هایی که تعیین‌کننده ویژگی‌ها هر کلمه هستند را برمی‌گرداند.
     """
 
     def __init__(self: "SequenceTagger", model=None, data_maker=data_maker) -> None:
+        self.model_file = None
         if model is not None:
             self.load_model(model)
         else:
             self.model = None
         self.data_maker = data_maker
 
+    def __getstate__(self: "SequenceTagger") -> dict:
+        # a crfsuite tagger cannot be pickled; it is opened again from its file
+        state = self.__dict__.copy()
+        state["model"] = None
+        return state
+
+    def __setstate__(self: "SequenceTagger", state: dict) -> None:
+        self.__dict__.update(state)
+        if state.get("model_file") is not None:
+            self.load_model(self.model_file)
+
     def __add_label(self: "SequenceTagger", sentence, tags):
         return [(word, tag) for word, tag in zip(sentence, tags)]
 
@@ -112,6 +128,7 @@ class SequenceTagger:
         tagger = Tagger()
         tagger.open(model)
         self.model = tagger
+        self.model_file = model
 
     def tag(self: "SequenceTagger", tokens):
         """یک جمله را در قالب لیستی از توکن‌ها دریافت می‌کند و در خروجی لیستی از
@@ -10,6 +10,10 @@
 
 """
 
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
 
 from nltk.stem.api import StemmerI
 
@@ -34,6 +38,17 @@ class Stemmer(StemmerI):
             "‌",
         ]
 
+        # the cascade strips ends in order, each at most once; from position
+        # i on, only ends[i:] can still be stripped and only those ending with
+        # the last character of the word are tried
+        self._candidates: List[Dict[str, Tuple[Tuple[int, str], ...]]] = []
+        for start in range(len(self.ends) + 1):
+            candidates = {}
+            for i in range(start, len(self.ends)):
+                end = self.ends[i]
+                candidates[end[-1]] = (*candidates.get(end[-1], ()), (i, end))
+            self._candidates.append(candidates)
+
     def stem(self: "Stemmer", word: str) -> str:
         """ریشهٔ کلمه را پیدا می‌کند.
 
@@ -59,11 +74,48 @@ class Stemmer(StemmerI):
             ریشهٔ کلمه.
 
         """
-        for end in self.ends:
-            if word.endswith(end):
-                word = word[:-len(end)]
+        ends = self._candidates[0].get(word[-1:])
+        if ends is not None:
+            stop = len(word)
+            while ends:
+                for i, end in ends:
+                    if word.endswith(end, 0, stop):
+                        stop -= len(end)
+                        # only the ends after ends[i] may still be stripped
+                        ends = self._candidates[i + 1].get(word[stop - 1:stop])
+                        break
+                else:
+                    break
+            word = word[:stop]
 
         if word.endswith("ۀ"):
             word = word[:-1] + "ه"
 
         return word
+
+    def stem_many(self: "Stemmer", words: Iterable[str]) -> List[str]:
+        """ریشهٔ کلمه‌ها را پیدا می‌کند.
+
+        ریشهٔ هر کلمهٔ تکراری فقط یک بار پیدا می‌شود؛ در متن‌های واقعی بیشترِ
+        کلمه‌ها تکراری‌اند.
+
+        Examples:
+            >>> stemmer = Stemmer()
+            >>> stemmer.stem_many(['کتاب‌ها', 'کتابی', 'کتاب‌ها'])
+            ['کتاب', 'کتاب', 'کتاب']
+
+        Args:
+            words: کلمه‌هایی که باید ریشهٔ آن‌ها پیدا شود.
+
+        Returns:
+            ریشهٔ کلمه‌ها به همان ترتیب.
+
+        """
+        memo = {}
+        stems = []
+        for word in words:
+            stem = memo.get(word)
+            if stem is None:
+                stem = memo[word] = self.stem(word)
+            stems.append(stem)
+        return stems
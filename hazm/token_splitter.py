@@ -1,19 +1,92 @@
-"""این ماژول شامل کلاس‌ها و توابعی برای تجزیه توکن به دو توکن کوچکتر است."""
+"""این ماژول شامل کلاس‌ها و توابعی برای تجزیه توکن به توکن‌های کوچکتر است."""
 
 
+import math
+from bisect import bisect_left
+from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 from hazm import Lemmatizer
 
 
 class TokenSplitter:
-    """این کلاس شامل توابعی برای تجزیه توکن به دو توکن کوچکتر است."""
+    """این کلاس شامل توابعی برای تجزیه توکن به توکن‌های کوچکتر است.
+
+    کلماتی که از هر نقطهٔ توکن شروع می‌شوند با پیمایشِ کلماتِ مرتب‌شدهٔ
+    واژگان (که مانند درختِ پیشوندی عمل می‌کند) پیدا می‌شوند و فقط کلماتی که
+    پس از یکی از آن‌ها ترکیبی از پسوندهای [Stemmer][hazm.Stemmer] آمده باشد
+    ریشه‌یابی می‌شوند.
+
+    """
 
     def __init__(self: "TokenSplitter") -> None:
         self.lemmatizer = Lemmatizer()
         self.lemmatize = self.lemmatizer.lemmatize
         self.words = self.lemmatizer.words
+        self._keys = tuple(self.words)
+        self._log_total = math.log(sum(self.words.counts))
+
+        # the strings the stemmer can strip: its ends in the order they are
+        # stripped, each at most once; with all their prefixes for the walk
+        self._endings = {""}
+        for end in self.lemmatizer.stemmer.ends:
+            self._endings |= {end + ending for ending in self._endings}
+        self._ending_prefixes = {
+            ending[:size] for ending in self._endings for size in range(len(ending) + 1)
+        }
+
+    def _parts(self: "TokenSplitter", token: str, start: int) -> Dict[int, str]:
+        """توکن‌های معتبری که از `start` شروع می‌شوند را برمی‌گرداند.
+
+        خروجی به شکل `{پایان: ریشه}` است؛ توکنی معتبر است که ریشه‌اش در واژگان
+        باشد.
+
+        """
+        keys, words, length = self._keys, self.words, len(token)
+        # the tokens from start that are words of the lexicon; the walk goes
+        # on while some word starts with the token
+        parts = {}
+        reach = start
+        index = 0
+        for end in range(start + 1, length + 1):
+            prefix = token[start:end]
+            if prefix in words:
+                parts[end] = prefix
+            else:
+                # the words with a longer prefix come after those with a shorter one
+                index = bisect_left(keys, prefix, index)
+                if index == len(keys) or not keys[index].startswith(prefix):
+                    break
+            reach = end
+        bases = list(parts)
+
+        # the stemmer turns a final «ۀ» into «ه»
+        if "ۀ" in token:
+            for end in range(start, reach + 1):
+                if token[end : end + 1] == "ۀ" and token[start:end] + "ه" in words:
+                    bases.append(end + 1)
+                    lemma = self._lemma(token[start : end + 1])
+                    if lemma is not None and end + 1 not in parts:
+                        parts[end + 1] = lemma
+
+        # the words followed by ends the stemmer strips
+        for base in bases:
+            for end in range(base + 1, length + 1):
+                ending = token[base:end]
+                if ending not in self._ending_prefixes:
+                    break
+                if end not in parts and ending in self._endings:
+                    lemma = self._lemma(token[start:end])
+                    if lemma is not None:
+                        parts[end] = lemma
+        return parts
+
+    def _lemma(self: "TokenSplitter", part: str) -> Optional[str]:
+        """ریشهٔ `part` اگر در واژگان باشد."""
+        lemma = part if part in self.words else self.lemmatize(part)
+        return lemma if lemma in self.words else None
 
     def split_token_words(self: "TokenSplitter", token: str) -> List[Tuple[str, str]]:
         """توکنِ ورودی را به دو توکن کوچکتر تجزیه می‌کند.
@@ -47,20 +120,87 @@ class TokenSplitter:
         if "‌" in token:
             candidates.append(tuple(token.split("‌")))
 
-        splits = [
-            (token[:s], token[s:])
-            for s in range(1, len(token))
-            if token[s - 1] != "‌" and token[s] != "‌"
-        ] + [(token,)]
+        if not token:
+            return candidates
+        heads = self._parts(token, 0)
         candidates.extend(
-            list(
-                filter(
-                    lambda tokens: set(map(self.lemmatize, tokens)).issubset(
-                        self.words,
-                    ),
-                    splits,
-                ),
-            ),
+            (token[:split], token[split:])
+            for split in sorted(heads)
+            if split < len(token)
+            and token[split - 1] != "‌"
+            and token[split] != "‌"
+            and self._lemma(token[split:]) is not None
         )
+        if len(token) in heads:
+            candidates.append((token,))
 
         return candidates
+
+    def split_token(
+        self: "TokenSplitter",
+        token: str,
+        max_parts: int = 3,
+    ) -> List[Tuple[str, ...]]:
+        """توکن را به همهٔ روش‌های ممکن به حداکثر `max_parts` توکن تجزیه می‌کند.
+
+        ریشهٔ هر توکن باید در واژگان باشد؛ توکن‌ها کنارِ نیم‌فاصله یا از جای آن
+        جدا می‌شوند. حالت‌ها به ترتیبِ احتمال، یعنی حاصل‌ضربِ فراوانیِ نسبیِ
+        ریشهٔ توکن‌ها در `words.dat`، مرتب می‌شوند؛ بنابراین تجزیه‌های کم‌بخش‌تر
+        و با کلماتِ رایج‌تر جلوتر می‌آیند.
+
+        Examples:
+            >>> splitter = TokenSplitter()
+            >>> splitter.split_token('صداوسیماجمهوری')[0]
+            ('صداوسیما', 'جمهوری')
+            >>> splitter.split_token('کتابخانه‌ملی')[0]
+            ('کتابخانه', 'ملی')
+            >>> splitter.split_token('کتابخانه‌ملی', max_parts=1)
+            []
+
+        Args:
+            token: توکنی که باید پردازش شود.
+            max_parts: حداکثر تعداد توکن‌های هر حالت.
+
+        Returns:
+            <dir-rtl>لیستی از `(توکن، …)`ها، محتمل‌ترین در ابتدا.</dir-rtl>
+
+        """
+        length = len(token)
+        # the segmentations of token[start:] by start and number of parts,
+        # each with its log probability
+        tails: Dict[Tuple[int, int], List[Tuple[float, Tuple[str, ...]]]] = {}
+        heads: Dict[int, Dict[int, str]] = {}
+
+        def segment(start: int, parts: int) -> List[Tuple[float, Tuple[str, ...]]]:
+            key = (start, parts)
+            if key not in tails:
+                tails[key] = []
+                if parts == 1:
+                    # only the rest of the token as a whole can be the last part
+                    lemma = self._lemma(token[start:])
+                    ends = {length: lemma} if lemma is not None else {}
+                elif start in heads:
+                    ends = heads[start]
+                else:
+                    ends = heads[start] = self._parts(token, start)
+                for end, lemma in ends.items():
+                    score = math.log(self.words[lemma][0] or 1) - self._log_total
+                    if end == length:
+                        tails[key].append((score, (token[start:],)))
+                        continue
+                    if token[end - 1] == "‌":
+                        continue
+                    # a zwnj between two parts is dropped
+                    following = end + 1 if token[end] == "‌" else end
+                    if following == length or token[following] == "‌":
+                        continue
+                    tails[key].extend(
+                        (score + rest, (token[start:end], *tail))
+                        for rest, tail in segment(following, parts - 1)
+                    )
+            return tails[key]
+
+        if not token or max_parts < 1:
+            return []
+        results = sorted(segment(0, max_parts), key=lambda result: -result[0])
+        return [tail for _, tail in results]
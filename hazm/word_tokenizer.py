@@ -6,17 +6,71 @@
 """
 
 import re
+from array import array
 from pathlib import Path
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
 
-from flashtext import KeywordProcessor
 from nltk.tokenize.api import TokenizerI
 
+from hazm import Lexicon
 from hazm import abbreviations
 from hazm import default_verbs
 from hazm import default_words
-from hazm import words_list
+from hazm import load_lexicon
+from hazm import shared_resource
+
+
+def _shared_lexicon(words_file: str, verbs_file: str) -> Tuple[Lexicon, Tuple[str]]:
+    words, verbs = load_lexicon(words_file, verbs_file)
+    return words, tuple(verbs)
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """الگویی می‌سازد که با هر یک از `words` منطبق می‌شود.
+
+    کلمه‌ها در قالب یک درخت پیشوندی کنار هم قرار می‌گیرند؛ پس موتور ریجکس
+    به‌جای آزمودنِ تک‌تکِ کلمه‌ها در هر موقعیت، برای هر نویسه فقط یک شاخه را
+    دنبال می‌کند. در هر موقعیت طولانی‌ترین کلمه ترجیح داده می‌شود.
+
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # a word that ends here is only matched if no longer one does
+        return "(?:" + pattern + ")?" if "" in node else pattern
+
+    return build(trie)
+
+
+def _follow(node: Dict[str, dict], token: str) -> Optional[Dict[str, dict]]:
+    # walks the parts of a (possibly joined) token from right to left
+    for part in reversed(token.split("_")) if "_" in token else (token,):
+        node = node.get(part)
+        if node is None:
+            return None
+    return node
+
+
+def _number_int_repl(m: re.Match) -> str:
+    return " NUM" + str(len(m.group(1))) + " "
+
+
+def _hashtag_repl(m: re.Match) -> str:
+    return "TAG " + m.group(1).replace("_", " ")
 
 
 class WordTokenizer(TokenizerI):
@@ -65,13 +119,22 @@ class WordTokenizer(TokenizerI):
         self.replace_hashtags = replace_hashtags
 
         self.pattern = re.compile(r'([؟!?]+|[\d.:]+|[:.،؛»\])}"«\[({/\\])')  # TODO \d
-        self.emoji_pattern = re.compile(
-            "["
+        # the matches of `pattern` and the runs of other characters between
+        # them and the separators; finding these is the same as padding the
+        # matches with spaces and splitting the text, without copying it
+        separated = self.pattern.pattern[1:-1]
+        others = r'[^ \n\t؟!?\d.:،؛»\])}"«\[({/\\'
+        self.token_pattern = re.compile(separated + "|" + others + "]+")
+        emojis = (
             "\U0001f600-\U0001f64f"  # emoticons
             "\U0001f300-\U0001f5ff"  # symbols & pictographs
             "\U0001f4cc\U0001f4cd"  # other emojis
-            "]",
-            flags=re.UNICODE,
+        )
+        self.emoji_pattern = re.compile("[" + emojis + "]", flags=re.UNICODE)
+        # like `token_pattern`, but a run also ends after an emoji
+        others += emojis + "]"
+        self._emoji_token_pattern = re.compile(
+            separated + "|" + others + "*[" + emojis + "]|" + others + "+",
         )
         self.emoji_repl = r"\g<0> "
         self.id_pattern = re.compile(r"(?<![\w._])(@[\w_]+)")
@@ -89,7 +152,7 @@ class WordTokenizer(TokenizerI):
         self.number_int_pattern = re.compile(
             r"\b(?<![\d۰-۹][.٫٬,])([\d۰-۹]+)(?![.٫٬,][\d۰-۹])\b",
         )
-        self.number_int_repl = lambda m: " NUM" + str(len(m.group(1))) + " "
+        self.number_int_repl = _number_int_repl
         self.number_float_pattern = re.compile(
             r"\b(?<!\.)([\d۰-۹,٬]+[.٫٬][\d۰-۹]+)\b(?!\.)",
         )
@@ -98,9 +161,11 @@ class WordTokenizer(TokenizerI):
         self.hashtag_pattern = re.compile(r"#(\S+)")
         # NOTE: python2.7 does not support unicodes with \w
 
-        self.hashtag_repl = lambda m: "TAG " + m.group(1).replace("_", " ")
+        self.hashtag_repl = _hashtag_repl
 
-        self.words = {item[0]: (item[1], item[2]) for item in words_list(words_file)}
+        self.words, verbs = shared_resource(
+            "lexicon", _shared_lexicon, words_file, verbs_file,
+        )
 
         if join_verb_parts:
             self.after_verbs = {
@@ -235,15 +300,22 @@ class WordTokenizer(TokenizerI):
                 "نخواهند",
             }
 
-            with Path.open(verbs_file, encoding="utf8") as verbs_file:
-                self.verbs = list(
-                    reversed([verb.strip() for verb in verbs_file if verb]),
-                )
-                self.bons = {verb.split("#")[0] for verb in self.verbs}
-                self.verbe = set(
-                    [bon + "ه" for bon in self.bons]
-                    + ["ن" + bon + "ه" for bon in self.bons],
-                )
+            self.verbs = list(reversed(verbs))
+            self.bons = {verb.split("#")[0] for verb in self.verbs}
+            self.verbe = set(
+                [bon + "ه" for bon in self.bons]
+                + ["ن" + bon + "ه" for bon in self.bons],
+            )
+
+            # after_verbs as a tree of their parts read from right to left;
+            # a part never contains "_", so "_" marks where an entry ends
+            self._after_verbs_tree: Dict[str, dict] = {}
+            for after_verb in self.after_verbs:
+                node = self._after_verbs_tree
+                for part in reversed(after_verb.split("_")):
+                    node = node.setdefault(part, {})
+                node["_"] = {}
+            self._verb_part_candidates = self.before_verbs | self.verbe
 
         if (join_abbreviations):
             abbreviations_file = Path(abbreviations)
@@ -252,6 +324,12 @@ class WordTokenizer(TokenizerI):
                 abbrs = [line.strip() for line in f]
                 self.abbreviations = abbrs
 
+            # an abbreviation is kept when it has a space on each side
+            self.abbreviation_pattern = re.compile(
+                "(?<= )(" + _trie_pattern(filter(None, abbrs)) + ")(?= )",
+            )
+            self._abbreviation_starts = {abbr.split(" ")[0] for abbr in abbrs}
+
 
 
     def tokenize(self: "WordTokenizer", text: str) -> List[str]:
@@ -289,51 +367,132 @@ class WordTokenizer(TokenizerI):
         # >>> print(' '.join(tokenizer.tokenize('📍عرضه بلوک 17 درصدی #های_وب به قیمت')))
         # 📍 عرضه بلوک NUM2 درصدی TAG های وب به قیمت
 
-
-        if self._join_abbreviation:
-
-            rnd = 313 # random number that is less likely to appear within the text
-
-            while str(rnd) in text:
-                rnd=rnd+1 # if rnd is found within the text, increment it by 1 until it no longer appears in the text.
-
-            rnd = str (rnd)
-
-            keyword_processor = KeywordProcessor()
-            text = text.replace(" "," " * 3)
-
-            for (i, abbr) in enumerate(self.abbreviations):
-                keyword_processor.add_keyword(" "+abbr+" ", rnd+str(i))
-
-            text = keyword_processor.replace_keywords(text)
-
+        if self._join_abbreviation and not self._abbreviation_starts.isdisjoint(
+            text.split(" "),
+        ):
+            # the abbreviations are single tokens and the text between them
+            # is tokenized as usual
+            parts = self.abbreviation_pattern.split(text)
+            tokens = self._split(parts[0])
+            for abbreviation, part in zip(parts[1::2], parts[2::2]):
+                tokens.append(abbreviation)
+                tokens += self._split(part)
+        else:
+            tokens = self._split(text)
+
+        return self.join_verb_parts(tokens) if self._join_verb_parts else tokens
+
+    def _split(self: "WordTokenizer", text: str) -> List[str]:
+        # each replacement only runs if the text has a character all its
+        # matches have; they still run in order, as one may match the
+        # output of another
         if self.separate_emoji:
             text = self.emoji_pattern.sub(self.emoji_repl, text)
-        if self.replace_emails:
+        if self.replace_emails and "@" in text:
             text = self.email_pattern.sub(self.email_repl, text)
-        if self.replace_links:
+        if self.replace_links and "." in text:
             text = self.link_pattern.sub(self.link_repl, text)
-        if self.replace_ids:
+        if self.replace_ids and "@" in text:
             text = self.id_pattern.sub(self.id_repl, text)
-        if self.replace_hashtags:
+        if self.replace_hashtags and "#" in text:
             text = self.hashtag_pattern.sub(self.hashtag_repl, text)
         if self.replace_numbers:
             text = self.number_int_pattern.sub(self.number_int_repl, text)
             text = self.number_float_pattern.sub(self.number_float_repl, text)
 
-        text = self.pattern.sub(r" \1 ", text.replace("\n", " ").replace("\t", " "))
+        return self.token_pattern.findall(text)
 
-        tokens = [word for word in text.split(" ") if word]
+    def span_tokenize(self: "WordTokenizer", text: str) -> Iterator[Tuple[int, int]]:
+        """بازهٔ توکن‌های متن را برمی‌گرداند.
 
-        tokens = self.join_verb_parts(tokens) if self._join_verb_parts else tokens
+        بازه‌ها در همان پیمایشِ توکن‌بندی پیدا می‌شوند و `text[start:end]`
+        همان توکنی است که `tokenize` برمی‌گرداند؛ جز برای افعال چندبخشی که
+        بازه‌شان از ابتدای بخش اول تا انتهای بخش آخر است و بخش‌هایش در
+        `tokenize` با `_` به هم چسبانده می‌شوند.
 
-        if self._join_abbreviation:
-            reversed_dict = {value: key for key, value in keyword_processor.get_all_keywords().items()}
-            for i, token in enumerate(tokens):
-                if token in reversed_dict:
-                    tokens[i] = reversed_dict[token].strip()
+        Examples:
+            >>> tokenizer = WordTokenizer()
+            >>> list(tokenizer.span_tokenize('این کتاب خوانده شده است.'))
+            [(0, 3), (4, 8), (9, 23), (23, 24)]
 
-        return tokens
+        Args:
+            text: متنی که باید توکن‌های آن استخراج شود.
+
+        Yields:
+            بازهٔ `(start, end)` هر توکن به ترتیب.
+
+        Raises:
+            ValueError: اگر یکی از گزینه‌های `replace_*` فعال باشد؛ توکن‌هایی
+                مثل `LINK` در متن وجود ندارند.
+
+        """
+        starts, ends = self._spans(text)
+        yield from zip(starts, ends)
+
+    def span_tokenize_array(self: "WordTokenizer", text: str) -> Tuple[array, array]:
+        """بازهٔ توکن‌های متن را در قالب دو آرایهٔ عدد صحیحِ ۳۲ بیتی برمی‌گرداند.
+
+        برای پردازشِ حجیم مناسب‌تر از `span_tokenize` است؛ آرایه‌ها را
+        می‌توان بدون کپی به `numpy.frombuffer` داد.
+
+        Examples:
+            >>> tokenizer = WordTokenizer()
+            >>> tokenizer.span_tokenize_array('سلام دنیا!')
+            (array('i', [0, 5, 9]), array('i', [4, 9, 10]))
+
+        Args:
+            text: متنی که باید توکن‌های آن استخراج شود.
+
+        Returns:
+            آرایهٔ ابتدا و آرایهٔ انتهای بازهٔ توکن‌ها.
+
+        Raises:
+            ValueError: اگر یکی از گزینه‌های `replace_*` فعال باشد.
+
+        """
+        starts, ends = self._spans(text)
+        return array("i", starts), array("i", ends)
+
+    def _spans(self: "WordTokenizer", text: str) -> Tuple[List[int], List[int]]:
+        if (
+            self.replace_links
+            or self.replace_ids
+            or self.replace_emails
+            or self.replace_numbers
+            or self.replace_hashtags
+        ):
+            msg = "span_tokenize does not support the replace_* options."
+            raise ValueError(msg)
+
+        pattern = self._emoji_token_pattern if self.separate_emoji else self.token_pattern
+        matches = []
+        start = 0
+        if self._join_abbreviation and not self._abbreviation_starts.isdisjoint(
+            text.split(" "),
+        ):
+            for abbreviation in self.abbreviation_pattern.finditer(text):
+                matches += pattern.finditer(text, start, abbreviation.start())
+                matches.append(abbreviation)
+                start = abbreviation.end()
+        matches += pattern.finditer(text, start)
+
+        starts = [match.start() for match in matches]
+        ends = [match.end() for match in matches]
+        if not self._join_verb_parts or len(matches) < 2:
+            return starts, ends
+
+        ranges = self.verb_part_ranges([match.group() for match in matches])
+        # a verb spans from the start of its first part to the end of its last
+        joined_starts, joined_ends = [], []
+        done = 0
+        for start, end in ranges:
+            joined_starts += starts[done:start + 1]
+            joined_ends += ends[done:start]
+            joined_ends.append(ends[end - 1])
+            done = end
+        joined_starts += starts[done:]
+        joined_ends += ends[done:]
+        return joined_starts, joined_ends
 
 
 
@@ -361,18 +520,68 @@ class WordTokenizer(TokenizerI):
             لیست از افعال چندبخشی که در صورت لزوم بخش‌های آن با کاراکتر خط زیر به هم چسبانده_شده_است.
 
         """
-        if len(tokens) == 1:
-            return tokens
+        result = []
+        done = 0
+        for start, end in self.verb_part_ranges(tokens):
+            result += tokens[done:start]
+            result.append("_".join(tokens[start:end]))
+            done = end
+        result += tokens[done:]
+        return result
+
+    def verb_part_ranges(self: "WordTokenizer", tokens: List[str]) -> List[Tuple[int, int]]:
+        """بازهٔ اندیسِ افعال چندبخشیِ لیستی از توکن‌ها را برمی‌گرداند.
+
+        توکن‌ها یک بار از راست به چپ پیمایش می‌شوند و بخش‌های هر فعل در
+        درختی از `after_verbs` دنبال می‌شوند؛ پس در میانهٔ کار هیچ رشته‌ای
+        ساخته نمی‌شود و `join_verb_parts` هر فعل را فقط یک بار می‌چسباند.
 
-        result = [""]
-        for token in reversed(tokens):
-            if token in self.before_verbs or (
-                result[-1] in self.after_verbs and token in self.verbe
+        Examples:
+            >>> tokenizer = WordTokenizer()
+            >>> tokenizer.verb_part_ranges(['او', 'گفته', 'خواهد', 'شد', '.'])
+            [(1, 4)]
+
+        Args:
+            tokens: لیست توکن‌ها.
+
+        Returns:
+            لیست بازه‌های `(start, end)` به ترتیب؛ `tokens[start:end]` بخش‌های
+                یک فعل چندبخشی است.
+
+        """
+        tree, before_verbs, verbe = self._after_verbs_tree, self.before_verbs, self.verbe
+        ranges = []
+        # the verb being read is tokens[start:end] and node is where its
+        # parts lead in the tree; only tokens that may join it are visited
+        start = end = len(tokens)
+        node = None
+        candidates = self._verb_part_candidates
+        for i in reversed([i for i, token in enumerate(tokens) if token in candidates]):
+            if i + 1 == len(tokens):
+                start, end = i, i + 1
+                node = _follow(tree, tokens[i])
+                continue
+            if i + 1 != start:
+                if end - start > 1:
+                    ranges.append((start, end))
+                start, end = i + 1, i + 2
+                node = _follow(tree, tokens[start])
+            token = tokens[i]
+            if token in before_verbs or (
+                node is not None and "_" in node and token in verbe
             ):
-                result[-1] = token + "_" + result[-1]
+                start = i
+                if node is not None:
+                    node = _follow(node, token)
             else:
-                result.append(token)
-        return list(reversed(result[1:]))
+                if end - start > 1:
+                    ranges.append((start, end))
+                start, end = i, i + 1
+                node = _follow(tree, token)
+        if end - start > 1:
+            ranges.append((start, end))
+        ranges.reverse()
+        return ranges
 
 
 
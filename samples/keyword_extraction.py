@@ -10,9 +10,7 @@ from sklearn.metrics.pairwise import cosine_similarity
 from hazm import SentEmbedding
 from hazm import POSTagger
 from hazm.corpus_readers import PersicaReader
-from hazm import Normalizer
-from hazm import word_tokenize
-from hazm import sent_tokenize
+from hazm import Pipeline
 
 
 grammers = [
@@ -27,15 +25,11 @@ NP:
 
 """,
 ]
-normalizer = Normalizer()
+pipeline = Pipeline()
 
 
 def tokenize(text):
-    normalizer = Normalizer()
-    return [
-        word_tokenize(sent)
-        for sent in sent_tokenize(normalizer.normalize(text))
-    ]
+    return pipeline(text).sentences
 
 
 def posTagger(text, pos_model_path="pos_tagger.model", posTaggerModel=None):
@@ -3,6 +3,7 @@ import pytest
 from hazm import Chunker
 from hazm import Conjugation
 from hazm import DependencyParser
+from hazm import InformalNormalizer
 from hazm import Lemmatizer
 from hazm import Normalizer
 from hazm import POSTagger
@@ -51,6 +52,10 @@ def universal_pos_tagger():
 def token_splitter():
     return TokenSplitter()
 
+@pytest.fixture(scope="session")
+def informal_normalizer():
+    return InformalNormalizer(seperation_flag=True)
+
 @pytest.fixture(scope="session")
 def dependency_parser(pos_tagger, lemmatizer):
     return DependencyParser(tagger=pos_tagger, lemmatizer=lemmatizer, working_dir="tests/files/dependency_parser")
@@ -1,4 +1,5 @@
 from hazm import PeykareReader
+from hazm.corpus_readers.peykare_reader import join_verb_parts
 
 
 def test_sents():
@@ -6,3 +7,9 @@ def test_sents():
     actual = next(peykare.sents())
     expected = [("دیرزمانی", "N"), ("از", "P"), ("راه\u200cاندازی", "N,EZ"), ("شبکه\u200cی", "N,EZ"), ("خبر", "N,EZ"), ("الجزیره", "N"), ("نمی\u200cگذرد", "V"), ("،", "PUNC"), ("اما", "CONJ"), ("این", "DET"), ("شبکه\u200cی", "N,EZ"), ("خبری", "AJ,EZ"), ("عربی", "N"), ("بسیار", "ADV"), ("سریع", "ADV"), ("توانسته", "V"), ("در", "P"), ("میان", "N,EZ"), ("شبکه\u200cهای", "N,EZ"), ("عظیم", "AJ,EZ"), ("خبری", "AJ"), ("و", "CONJ"), ("بنگاه\u200cهای", "N,EZ"), ("چندرسانه\u200cای", "AJ,EZ"), ("دنیا", "N"), ("خودی", "N"), ("نشان", "N"), ("دهد", "V"), (".", "PUNC")]
     assert actual == expected
+
+
+def test_join_verb_parts():
+    sentence = [("او", "PRO"), ("گفته", "V"), ("خواهد", "V"), ("شد", "V"), (".", "PUNC"), ("خواهد", "V")]
+    expected = [("او", "PRO"), ("گفته_خواهد_شد", "V"), (".", "PUNC"), ("خواهد", "V")]
+    assert join_verb_parts(sentence) == expected
@@ -0,0 +1,80 @@
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hazm import CacheInfo
+from hazm import DocumentCache
+from hazm import Memo
+from hazm import Normalizer
+from hazm.cache import cache_sizes
+
+
+def test_memo():
+    memo = Memo(str.upper, maxsize=2)
+    assert [memo("a"), memo("a"), memo("b"), memo("c"), memo("a")] == ["A", "A", "B", "C", "A"]
+    assert memo.info() == CacheInfo(hits=1, misses=4, evictions=2, size=2, maxsize=2)
+    memo.clear()
+    assert memo.info() == CacheInfo(hits=0, misses=0, evictions=0, size=0, maxsize=2)
+
+def test_memo_pickles_without_its_results():
+    memo = Memo(str.upper, maxsize=2)
+    memo("a")
+    copy = pickle.loads(pickle.dumps(memo))
+    assert copy("a") == "A"
+    assert copy.info().misses == 1
+
+def test_cache_sizes():
+    assert cache_sizes(0, ("a", "b")) == {}
+    assert cache_sizes(10, ("a", "b")) == {"a": 10, "b": 10}
+    assert cache_sizes({"a": 10, "b": 0}, ("a", "b")) == {"a": 10}
+    with pytest.raises(ValueError, match="unknown caches"):
+        cache_sizes({"c": 10}, ("a", "b"))
+
+def test_document_cache():
+    cache = DocumentCache(max_bytes=400)
+    for text in ["a" * 50, "b" * 50, "a" * 50, "c" * 50]:
+        assert cache.lookup(text, str.upper) == text.upper()
+    hits, misses, evictions, size, maxsize = cache.info()
+    assert (hits, misses, evictions, maxsize) == (1, 3, 1, 400)
+    assert 0 < size <= maxsize
+    assert cache.lookup("a" * 50, str.lower, namespace=b"other") == "a" * 50
+    assert cache.lookup("x" * 500, str.upper) == "X" * 500
+    assert cache.info().size <= 400
+
+def test_document_cache_on_disk(tmp_path):
+    path = str(tmp_path / "documents.sqlite")
+    with DocumentCache(path=path) as cache:
+        cache.lookup("hazm", str.upper)
+    with DocumentCache(path=path) as cache:
+        copy = pickle.loads(pickle.dumps(cache))
+        assert copy.lookup("hazm", str.lower) == "HAZM"
+        assert copy.info().hits == 1
+        copy.close()
+
+def test_document_cache_shared_by_threads(tmp_path):
+    texts = ["سلام   دنیا", "ساعت 18", "نميدانم چه ميگفت"] * 20
+    normalizer = Normalizer(document_cache=DocumentCache(path=str(tmp_path / "documents.sqlite")))
+    with ThreadPoolExecutor(4) as pool:
+        actual = list(pool.map(normalizer.normalize, texts))
+    assert actual == list(map(Normalizer().normalize, texts))
+    hits, misses, *_ = normalizer.document_cache.info()
+    assert hits + misses == len(texts)
+    normalizer.document_cache.close()
+
+
+def test_document_cache_size_after_concurrent_misses():
+    cache = DocumentCache()
+    barrier = threading.Barrier(8)
+
+    def compute(text):
+        barrier.wait()
+        return text.upper()
+
+    with ThreadPoolExecutor(8) as pool:
+        assert set(pool.map(lambda _i: cache.lookup("hazm", compute), range(8))) == {"HAZM"}
+    assert cache.info().misses == 8
+    alone = DocumentCache()
+    alone.lookup("hazm", str.upper)
+    assert cache.info().size == alone.info().size
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+import hazm
+
+
+def imported_modules(statement: str) -> str:
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True,
+    )
+    return result.stdout.split()
+
+@pytest.mark.parametrize("statement", [
+    "import hazm",
+    "from hazm import Normalizer, Lemmatizer, word_tokenize, sent_tokenize",
+])
+def test_import_budget(statement):
+    modules = imported_modules(statement)
+    for heavy in ["gensim", "fasttext", "smart_open", "hazm.embedding", "hazm.corpus_readers", "hazm.dependency_parser", "hazm.pos_tagger"]:
+        assert heavy not in modules
+
+def test_import_hazm_is_light():
+    assert "nltk" not in imported_modules("import hazm")
+
+@pytest.mark.parametrize("name", hazm.__all__)
+def test_public_names(name):
+    assert getattr(hazm, name) is not None
+
+@pytest.mark.parametrize("name", sorted(set(dir(hazm)) - set(hazm.__all__)))
+def test_listed_names(name):
+    # ner needs spacy, so dir(hazm) does not list it
+    assert getattr(hazm, name) is not None
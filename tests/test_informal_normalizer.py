@@ -0,0 +1,21 @@
+import pytest
+
+
+class TestInformalNormalizer:
+
+    @pytest.mark.parametrize(("token", "expected"), [
+
+        ("تورادوستدارم", "تورا دوستدارم"),
+        ("سلاممممم", "سلام"),
+        ("دیروزبامادرمبهبازاررفتیم", "دیروزبامادرمبهبازاررفتیم"),
+        ("", ""),
+    ])
+
+    def test_split_token_words(self: "TestInformalNormalizer", informal_normalizer, token, expected):
+        assert informal_normalizer.split_token_words(token) == expected
+
+    def test_split_long_token_words(self: "TestInformalNormalizer", informal_normalizer):
+        # a token of 81 pieces; enumerating its 2^80 groupings would never finish
+        token = "تورادوستدارم" * 10
+        words = informal_normalizer.split_token_words(token).split(" ")
+        assert "".join(words) == token
@@ -1,5 +1,12 @@
 import pytest
 
+from hazm import Lemmatizer
+from hazm import VerbAnalyzer
+from hazm import default_verbs
+from hazm.lemmatizer import _IRREGULAR_FORMS
+from hazm.lemmatizer import _conjugate_verbs
+from hazm.lemmatizer import _conjugation_fingerprint
+
 
 class TestLemmatizer:
 
@@ -27,6 +34,58 @@ class TestLemmatizer:
     def test_lemmatize_with_pos(self: "TestLemmatizer", lemmatizer, word, pos, expected):
         assert lemmatizer.lemmatize(word, pos) == expected
 
+    def test_verbs_are_loaded_lazily(self: "TestLemmatizer"):
+        lemmatizer = Lemmatizer()
+        assert lemmatizer.lemmatize("کتاب‌ها", "N") == "کتاب"
+        assert lemmatizer._verbs is None # noqa: SLF001
+        assert lemmatizer.lemmatize("می‌روم") == "رفت#رو"
+        assert lemmatizer._verbs is not None # noqa: SLF001
+
+    def test_cache_size(self: "TestLemmatizer", lemmatizer):
+        cached = Lemmatizer(cache_size=2)
+        for word in ["کتاب‌ها", "می‌روم", "کتاب‌ها", "آتشفشان"]:
+            assert cached.lemmatize(word) == lemmatizer.lemmatize(word)
+        assert cached.cache.info() == (1, 3, 1, 2, 2)
+        assert lemmatizer.cache is None
+
+    @pytest.mark.parametrize("cache_size", [0, 2, 2**16])
+    def test_lemmatize_sents(self: "TestLemmatizer", lemmatizer, cache_size):
+        tagged_sents = [
+            [("کتاب‌ها", "NOUN"), ("می‌روم", "VERB"), ("اجتماعی", "ADJ,EZ"), ("مردم", "N")],
+            [],
+            [("کتاب‌ها", "NOUN,EZ"), ("می‌روم", "VERB"), ("او", "PRON"), ("می‌روم", "")],
+        ]
+        expected = [[lemmatizer.lemmatize(word, tag) for word, tag in sentence] for sentence in tagged_sents]
+        assert lemmatizer.lemmatize_sents(iter(tagged_sents), cache_size=cache_size) == expected
+
+    def test_conjugation_fingerprint(self: "TestLemmatizer", monkeypatch):
+        fingerprint = _conjugation_fingerprint()
+        assert _conjugation_fingerprint() == fingerprint
+        monkeypatch.delitem(_IRREGULAR_FORMS, "grammatical_perfective_present")
+        assert _conjugation_fingerprint() != fingerprint
+
+    @pytest.mark.parametrize("joined_verb_parts", [True, False])
+    def test_verb_analyzer(self: "TestLemmatizer", joined_verb_parts):
+        table = _conjugate_verbs(default_verbs, joined_verb_parts)
+        analyzer = VerbAnalyzer(default_verbs, joined_verb_parts)
+        assert all(analyzer.get(form) == verb for form, verb in table.items())
+        for word in ["کتاب", "می‌", "ببینی_است", "", "_", "است"]:
+            assert (word in analyzer) == (word in table)
+            assert analyzer.get(word) == table.get(word)
+        with pytest.raises(KeyError, match="کتاب"):
+            analyzer["کتاب"]
+        lemmatizer = Lemmatizer(joined_verb_parts=joined_verb_parts, verb_analyzer=True)
+        assert isinstance(lemmatizer.verbs, VerbAnalyzer)
+        assert lemmatizer.lemmatize("می‌روم") == "رفت#رو"
+
+    def test_verb_analyzer_mapping(self: "TestLemmatizer", tmp_path):
+        verbs_file = tmp_path / "verbs.dat"
+        verbs_file.write_text("دید#بین\nرفت#رو\n#هست\n", encoding="utf8")
+        analyzer = VerbAnalyzer(str(verbs_file))
+        assert dict(analyzer) == _conjugate_verbs(str(verbs_file), True)
+        assert len(analyzer) == len(dict(analyzer))
+        assert analyzer["ببین"] == "دید#بین"
+
 
 class TestConjugation:
     # ri: بن ماضی
@@ -1157,3 +1216,26 @@ class TestConjugation:
             "دیده نمی‌شده خواهند بود",
         ]
         assert actual == expected
+
+    def test_get_all(self: "TestConjugation", conjugation):
+        actual = conjugation.get_all("دید#بین")
+        assert len(actual) == 609
+        assert actual[:7] == ["دیدن", "دیدم", "دیدی", "دید", "دیدیم", "دیدید", "دیدند"]
+        assert "ببین" in actual
+        assert "نبین" in actual
+        # ببینی is still the 2sg subjunctive, but not the imperative
+        assert "ببینی" not in conjugation.grammatical_perfective_present("بین")
+        assert "نبینی" not in conjugation.negative_grammatical_perfective_present("بین")
+
+    def test_get(self: "TestConjugation", conjugation):
+        actual = conjugation.get("دید#بین", negative=True, passive=True)
+        expected = ["دیدن"]
+        expected += conjugation.negative_passive_perfective_past("دید")
+        assert actual[:7] == expected
+        assert actual[-6:] == conjugation.negative_passive_future_precedent_imperfective("دید")
+
+    def test_get_returns_a_new_list(self: "TestConjugation", conjugation):
+        conjugation.get_all("دید#بین").clear()
+        conjugation.get("دید#بین").clear()
+        assert conjugation.get_all("دید#بین")[0] == "دیدن"
+        assert conjugation.get("دید#بین")[0] == "دیدن"
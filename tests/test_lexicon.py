@@ -0,0 +1,72 @@
+import pickle
+from collections.abc import KeysView
+from collections.abc import Mapping
+
+import pytest
+
+from hazm import Lexicon
+from hazm import build_lexicon
+from hazm import default_verbs
+from hazm import load_lexicon
+from hazm import load_verb_forms
+from hazm import words_list
+from hazm.lexicon import lexicon_path
+from hazm.lexicon import read_lexicon
+
+
+def test_load_lexicon(tmp_path, monkeypatch):
+    monkeypatch.setenv("HAZM_CACHE_DIR", str(tmp_path))
+    words, verbs = load_lexicon()
+    assert dict(words) == {item[0]: (item[1], item[2]) for item in words_list()}
+    assert verbs[:2] == ["#هست", "آجید#آجین"]
+    assert lexicon_path()[0].exists()
+
+def test_lexicon():
+    words = Lexicon.from_words(
+        [("نان", 5, ("N",)), ("آب", 10, ("N", "AJ")), ("آب", 12, ("N", "AJ"))],
+    )
+    assert "آب" in words
+    assert "شیر" not in words
+    assert words["آب"] == (12, ("N", "AJ"))
+    assert words.get("شیر") is None
+    assert {"آب", "نان"}.issubset(words)
+    assert list(words.items()) == [("آب", (12, ("N", "AJ"))), ("نان", (5, ("N",)))]
+    assert isinstance(words, Mapping)
+    assert isinstance(words.keys(), KeysView)
+    assert words == dict(words.items())
+    assert list(words) == ["آب", "نان"]
+    assert dict(pickle.loads(pickle.dumps(words))) == dict(words)
+
+    with pytest.raises(KeyError):
+        words["شیر"]
+
+def test_load_lexicon_rebuilds_stale_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("HAZM_CACHE_DIR", str(tmp_path))
+    words_file = tmp_path / "words.dat"
+    words_file.write_text("آب\t10\tN,AJ\nنان\t5\tN\n", encoding="utf8")
+    lexicon_file, digest = lexicon_path(words_file, default_verbs)
+    build_lexicon(lexicon_file, words_file, default_verbs)
+
+    words_file.write_text("آب\t10\tN,AJ\n", encoding="utf8")
+    words, _ = load_lexicon(words_file, default_verbs)
+    assert dict(words) == {"آب": (10, ("N", "AJ"))}
+    assert read_lexicon(lexicon_file, digest)[0] == ["آب", "نان"]
+
+def test_load_verb_forms(tmp_path, monkeypatch):
+    monkeypatch.setenv("HAZM_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def conjugate(_verbs_file, joined_verb_parts):
+        calls.append(joined_verb_parts)
+        return {"است": "#است", "دیدم": "دید#بین", "می‌بینم": "دید#بین"}
+
+    built = load_verb_forms(default_verbs, False, conjugate)
+    loaded = load_verb_forms(default_verbs, False, conjugate)
+    assert list(loaded.items()) == list(built.items())
+    assert calls == [False]
+
+    load_verb_forms(default_verbs, True, conjugate)
+    assert calls == [False, True]
+
+    load_verb_forms(default_verbs, True, conjugate, b"changed conjugator")
+    assert calls == [False, True, True]
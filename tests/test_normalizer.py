@@ -1,5 +1,14 @@
+import io
+import random
+
 import pytest
 
+from hazm import DocumentCache
+from hazm import Normalizer
+from hazm import SentenceTokenizer
+from hazm import WordTokenizer
+from hazm import maketrans
+
 
 class TestNormazlier:
 
@@ -73,6 +82,15 @@ class TestNormazlier:
     def test_decrease_repeated_chars(self: "TestNormazlier", normalizer, text, expected):
         assert normalizer.decrease_repeated_chars(text) == expected
 
+    def test_decrease_repeated_chars_in_long_text(self: "TestNormazlier", normalizer):
+        text = "سلاممم دوستان، سلااام " * 1000 + "آ" * 10000
+        expected = "سلام دوستان، سلام " * 1000 + "آآ"
+        assert normalizer.decrease_repeated_chars(text) == expected
+
+    def test_decrease_repeated_chars_per_word(self: "TestNormazlier", normalizer):
+        # each word is decided on its own: «خوب» is not copied into «خوببببی»
+        assert normalizer.decrease_repeated_chars("خوببب خوببببی") == "خوب خوبی"
+
     @pytest.mark.parametrize(("text", "expected"), [
 
         ('"نقل‌قول"', "«نقل‌قول»"),
@@ -136,3 +154,113 @@ class TestNormazlier:
 
     def test_token_spacing(self: "TestNormazlier", normalizer, text, expected):
         assert normalizer.token_spacing(text) == expected
+
+    @pytest.mark.parametrize("text", [
+        "اِعلاممممم كَرد : « زمين لرزه ای به بُزرگیِ 6.5 دهم ريشتر ...» ﷽ پیامبر ﷺ",
+        'او گفت: "نميدانم چه ميگفت" 10.450%',
+        "",
+    ])
+
+    def test_normalize_runs_the_steps_in_order(self: "TestNormazlier", normalizer, text):
+        expected = text.translate(maketrans(normalizer.translation_src, normalizer.translation_dst))
+        for step in [
+            normalizer.persian_style,
+            normalizer.persian_number,
+            normalizer.remove_diacritics,
+            normalizer.correct_spacing,
+            normalizer.unicodes_replacement,
+            normalizer.remove_specials_chars,
+            normalizer.decrease_repeated_chars,
+            normalizer.seperate_mi,
+        ]:
+            expected = step(expected)
+        assert normalizer.normalize(text) == expected
+
+    def test_normalize_skips_steps_that_cannot_change_the_text(self: "TestNormazlier"):
+        normalizer = Normalizer()
+        text = "اعلام کرد: «زمین‌لرزه‌ای به بزرگی ۶ دهم ریشتر …»"
+        assert normalizer.normalize(text) == text
+        assert set(normalizer.skipped_steps) == {
+            "translations",
+            "persian_style",
+            "persian_numbers+remove_diacritics",
+            "unicodes_replacement+remove_specials_chars",
+        }
+        assert not normalizer._may_join(["زمین‌لرزه‌ای", "به", "بزرگی"]) # noqa: SLF001
+        assert normalizer._may_join(["زمین", "لرزه", "ای"]) # noqa: SLF001
+
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_normalize_many(self: "TestNormazlier", normalizer, n_jobs):
+        texts = ["سلام   دنیا", "ساعت 18", "", "نميدانم چه ميگفت"] * 10
+        actual = normalizer.normalize_many(iter(texts), n_jobs=n_jobs, chunksize=3)
+        assert list(actual) == [normalizer.normalize(text) for text in texts]
+
+    @pytest.mark.parametrize("n_jobs", [0, -2])
+    def test_normalize_many_invalid_n_jobs(self: "TestNormazlier", normalizer, n_jobs):
+        with pytest.raises(ValueError, match="n_jobs"):
+            list(normalizer.normalize_many(["سلام"], n_jobs=n_jobs))
+
+    @pytest.mark.parametrize("chunk_size", [0, 10, 2**16])
+    def test_normalize_stream(self: "TestNormazlier", normalizer, chunk_size):
+        text = "اِعلاممممم کَرد : « زمین لرزه ای ...»\n\n\nً\n\n«نميدانم» چه ميگفت\nمی رود   \n" * 5
+        actual = normalizer.normalize_stream(io.StringIO(text), chunk_size=chunk_size)
+        assert "".join(actual) == normalizer.normalize(text)
+
+    def test_normalize_stream_cuts_lines_without_letters(self: "TestNormazlier", normalizer):
+        lines = ["«نقل قول»\n", "- مورد اول\n", "• مورد دوم\n", "   تورفته\n", "\u200cنیم‌فاصله\n", "ً\n", "\n"]
+        text = "".join(lines) * 50
+        chunks = list(normalizer.normalize_stream(io.StringIO(text), chunk_size=100))
+        assert "".join(chunks) == normalizer.normalize(text)
+        assert max(map(len, chunks)) < 200
+
+    @pytest.mark.parametrize(("text", "expected"), [
+        ("زمین لرزه ای آمد. نمیدانم چرا!", [["زمین‌لرزه‌ای", "آمد", "."], ["نمی‌دانم", "چرا", "!"]]),
+        ("او گفت : « نمی دانم . » و رفت\nفردا\n\n﷽", [["او", "گفت", ":", "«", "نمی‌دانم", ".", "»", "و", "رفت", "فردا"], ["بسم", "الله", "الرحمن", "الرحیم"]]),
+        ("ﷺ", []),
+        ("", []),
+    ])
+    def test_normalize_tokens(self: "TestNormazlier", normalizer, text, expected):
+        assert normalizer.normalize_tokens(text) == expected
+        assert "".join(sum(expected, [])) == "".join(normalizer.normalize(text).split())
+        assert Normalizer(correct_spacing=False).normalize_tokens("سلام. دنیا") == [["سلام", "."], ["دنیا"]]
+        assert Normalizer(correct_spacing=False).normalize_tokens("سلام\r") == [["سلام"]]
+
+    @pytest.mark.parametrize("correct_spacing", [True, False])
+    def test_normalize_tokens_match_word_tokenize(self: "TestNormazlier", correct_spacing):
+        pieces = [
+            "سلام", "می رود", "نميدانم", "کتاب ها", "خوانده شده است", "ﷺ", "ً", "\u200c", "ـ", "ك",
+            "6", "۱۲۳", "3.5", "٫", ".", "...", ":", "!", "؟", "?", "،", "؛", "«", "»", "(", ")", '"', "/",
+            " ", "  ", "\n", "\n\n", "\t", "\r", "\x0b", "\x0c", "\u2009",
+        ]
+        normalizer = Normalizer(correct_spacing=correct_spacing)
+        sentence_tokenizer = SentenceTokenizer()
+        word_tokenizer = WordTokenizer(join_verb_parts=False)
+        generator = random.Random(0)
+        for _ in range(500):
+            separator = generator.choice(["", " "])
+            text = separator.join(generator.choices(pieces, k=generator.randint(1, 30)))
+            sentences = sentence_tokenizer.tokenize(normalizer.normalize(text))
+            expected = [tokens for tokens in map(word_tokenizer.tokenize, sentences) if tokens]
+            assert normalizer.normalize_tokens(text) == expected, text
+
+    def test_normalize_tokens_without_a_tokenizer(self: "TestNormazlier"):
+        normalizer = Normalizer(correct_spacing=False, decrease_repeated_chars=False)
+        assert normalizer.normalize_tokens("سلام. دنیا") == [["سلام", "."], ["دنیا"]]
+
+    def test_cache_size(self: "TestNormazlier", normalizer):
+        text = "اِعلاممممم کَرد : « زمین لرزه ای به بُزرگیِ 6 دهم ریشتر ...» نمیدانم چه میگفت"
+        cached = Normalizer(cache_size={"seperate_mi": 100, "token_spacing": 100})
+        assert cached.normalize(text) == cached.normalize(text) == normalizer.normalize(text)
+        assert set(cached.caches) == {"seperate_mi", "token_spacing"}
+        assert cached.caches["seperate_mi"].info().hits == 2
+        assert cached.caches["token_spacing"].info().hits > 0
+        assert normalizer.caches == {}
+
+    def test_document_cache(self: "TestNormazlier", normalizer):
+        text = "اِعلاممممم کَرد : « زمین لرزه ای به بُزرگیِ 6 دهم ریشتر ...»"
+        cache = DocumentCache()
+        cached = Normalizer(document_cache=cache)
+        other = Normalizer(persian_numbers=False, document_cache=cache)
+        assert cached.normalize(text) == cached.normalize(text) == normalizer.normalize(text)
+        assert other.normalize(text) == Normalizer(persian_numbers=False).normalize(text)
+        assert cache.info()[:2] == (1, 2)
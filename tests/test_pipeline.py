@@ -0,0 +1,84 @@
+import pytest
+from nltk.chunk import conlltags2tree
+
+from hazm import Chunker
+from hazm import Lemmatizer
+from hazm import Normalizer
+from hazm import Pipeline
+from hazm import POSTagger
+from hazm import SentenceTokenizer
+from hazm import WordTokenizer
+from hazm import sent_tokenize
+from hazm import word_tokenize
+
+TEXTS = ["کتاب‌ها را خوانده بودم. نمیدانم چرا!", "", "او فردا به مدرسه خواهد رفت", "ساعت 18"] * 5
+
+TAGGED = [
+    [("او", "PRON"), ("کتاب", "NOUN"), ("را", "ADP"), ("خوانده_بودم", "VERB"), (".", "PUNCT")],
+    [("من", "PRON"), ("به", "ADP"), ("مدرسه", "NOUN"), ("خواهد_رفت", "VERB"), ("!", "PUNCT")],
+]
+
+CHUNKS = [
+    ["B-NP", "B-NP", "B-POSTP", "B-VP", "O"],
+    ["B-NP", "B-PP", "B-NP", "B-VP", "O"],
+]
+
+
+@pytest.fixture(scope="module")
+def models(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("models")
+    tagger = POSTagger()
+    tagger.train(TAGGED, max_iteration=10, verbose=False, file_name=str(directory / "tagger.model"), report_duration=False)
+    chunker = Chunker()
+    trees = [
+        conlltags2tree([(word, tag, chunk) for (word, tag), chunk in zip(sentence, chunks)])
+        for sentence, chunks in zip(TAGGED, CHUNKS)
+    ]
+    chunker.train(trees, max_iteration=10, verbose=False, file_name=str(directory / "chunker.model"), report_duration=False)
+    return tagger, chunker
+
+
+class TestPipeline:
+
+    def test_tokens(self: "TestPipeline", normalizer):
+        expected = [
+            [word_tokenize(sentence) for sentence in sent_tokenize(normalizer.normalize(text))]
+            for text in TEXTS
+        ]
+        assert [document.sentences for document in Pipeline().pipe(TEXTS)] == expected
+        custom = Pipeline(sentence_tokenizer=SentenceTokenizer(), word_tokenizer=WordTokenizer())
+        assert [document.sentences for document in custom.pipe(TEXTS)] == expected
+
+    def test_tokens_of_normalized_text(self: "TestPipeline"):
+        assert Pipeline()("ساعت 6 .").sentences == [["ساعت", "۶."]]
+
+    @pytest.mark.parametrize("text", ["کتاب\x0c", "سلام\r\nدنیا. کتاب\x0c خواندم\u2009"])
+    def test_tokens_around_other_whitespace(self: "TestPipeline", text):
+        sentences = sent_tokenize(Normalizer().normalize(text))
+        assert Pipeline()(text).sentences == [word_tokenize(sentence) for sentence in sentences]
+
+    def test_annotations(self: "TestPipeline", models, lemmatizer):
+        tagger, chunker = models
+        pipeline = Pipeline(tagger=tagger, lemmatizer=lemmatizer, chunker=chunker, batch_size=3)
+        documents = list(pipeline.pipe(TEXTS))
+        for text, document in zip(TEXTS, documents):
+            assert document == pipeline(text)
+            assert document.tags == tagger.tag_sents(document.sentences)
+            assert document.lemmas == [[lemmatizer.lemmatize(word, tag) for word, tag in sentence] for sentence in document.tags]
+            assert document.chunks == list(chunker.parse_sents(document.tags))
+        assert set(pipeline.timings) == {"tokenize", "tag", "lemmatize", "chunk"}
+
+    def test_workers(self: "TestPipeline", models):
+        tagger, chunker = models
+        pipeline = Pipeline(tagger=tagger, lemmatizer=Lemmatizer(), chunker=chunker, n_jobs=2, chunksize=3, queue_size=1)
+        actual = list(pipeline.pipe(iter(TEXTS)))
+        assert actual == list(Pipeline(tagger=tagger, lemmatizer=Lemmatizer(), chunker=chunker).pipe(TEXTS))
+        assert pipeline.timings["tag"] > 0
+
+    def test_chunker_without_tagger(self: "TestPipeline", models):
+        with pytest.raises(ValueError, match="tagger"):
+            Pipeline(chunker=models[1])
+
+    def test_invalid_n_jobs(self: "TestPipeline"):
+        with pytest.raises(ValueError, match="n_jobs"):
+            Pipeline(n_jobs=0)
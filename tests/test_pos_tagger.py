@@ -1,3 +1,13 @@
+import pickle
+
+from hazm import POSTagger
+
+TAGGED = [
+    [("او", "PRON"), ("کتاب", "NOUN"), ("را", "ADP"), ("خواند", "VERB"), (".", "PUNCT")],
+    [("من", "PRON"), ("به", "ADP"), ("مدرسه", "NOUN"), ("رفتم", "VERB"), ("!", "PUNCT")],
+]
+
+
 class TestPOSTagger:
 
     def test_data_maker(self:"TestPOSTagger", pos_tagger):
@@ -19,3 +29,12 @@ class TestPOSTagger:
         actual = universal_pos_tagger.tag_sents([["من", "به", "مدرسه", "ایران", "رفته_بودم", "."]])
         expected = [[("من", "PRON"), ("به", "ADP"), ("مدرسه", "NOUN"), ("ایران", "NOUN"), ("رفته_بودم", "VERB"), (".", "PUNCT")]]
         assert actual == expected
+
+    def test_pickle(self: "TestPOSTagger", tmp_path):
+        assert pickle.loads(pickle.dumps(POSTagger())).model is None
+        tagger = POSTagger()
+        model_file = str(tmp_path / "tagger.model")
+        tagger.train(TAGGED, max_iteration=10, verbose=False, file_name=model_file, report_duration=False)
+        restored = pickle.loads(pickle.dumps(tagger))
+        assert restored.model_file == model_file
+        assert restored.tag(["او", "به", "مدرسه", "رفتم"]) == tagger.tag(["او", "به", "مدرسه", "رفتم"])
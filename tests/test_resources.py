@@ -0,0 +1,37 @@
+import pickle
+
+import pytest
+
+from hazm import FrozenDict
+from hazm import InformalLemmatizer
+from hazm import Lemmatizer
+from hazm import WordTokenizer
+from hazm import shared_resource
+
+
+def test_shared_resource():
+    first = shared_resource("test", lambda n: tuple(range(n)), 3)
+    assert shared_resource("test", lambda _n: (), 3) is first
+    assert shared_resource("test", lambda _n: (), 4) == ()
+
+def test_components_share_resources(lemmatizer, normalizer):
+    assert WordTokenizer().words is lemmatizer.words
+    assert normalizer.words is lemmatizer.words
+    assert Lemmatizer().verbs is lemmatizer.verbs
+
+def test_informal_lexicon_is_shared(tmp_path):
+    words_file = tmp_path / "words.dat"
+    words_file.write_text("", encoding="utf8")
+    informal = InformalLemmatizer()
+    # the words of words_file are not used, so the lexicon is still shared
+    assert InformalLemmatizer(words_file=str(words_file)).words is informal.words
+    assert InformalLemmatizer(joined_verb_parts=False).verbs is not informal.verbs
+
+def test_frozen_dict():
+    frozen = FrozenDict({"a": 1})
+    with pytest.raises(TypeError):
+        frozen["b"] = 2
+    with pytest.raises(TypeError):
+        frozen.update({"b": 2})
+    assert pickle.loads(pickle.dumps(frozen)) == {"a": 1}
+    assert dict(frozen) == {"a": 1}
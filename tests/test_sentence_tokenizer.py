@@ -1,6 +1,25 @@
+import io
+
+import pytest
+
+
 class TestSentenceTokenizer:
 
     def test_sentence_tokenizer(self: "TestSentenceTokenizer", sentence_tokenizer):
         actual = sentence_tokenizer.tokenize("جدا کردن ساده است. تقریبا البته!")
         expected = ["جدا کردن ساده است.", "تقریبا البته!"]
         assert actual == expected
+
+    def test_span_tokenize(self: "TestSentenceTokenizer", sentence_tokenizer):
+        text = "جدا کردن ساده است.  تقریبا\nالبته!\n\nپاراگراف دوم؟!"
+        spans = list(sentence_tokenizer.span_tokenize(text))
+        actual = [text[start:end].replace("\n", " ") for start, end in spans]
+        assert actual == sentence_tokenizer.tokenize(text)
+        assert spans == [(0, 18), (20, 33), (35, 49)]
+        assert list(zip(*sentence_tokenizer.span_tokenize_array(text))) == spans
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 2**16])
+    def test_tokenize_stream(self: "TestSentenceTokenizer", sentence_tokenizer, chunk_size):
+        text = "جدا کردن ساده است.  تقریبا\nالبته!\n\nپاراگراف دوم\n\n\nو سوم؟! " * 5
+        actual = sentence_tokenizer.tokenize_stream(io.StringIO(text), chunk_size=chunk_size)
+        assert list(actual) == sentence_tokenizer.tokenize(text)
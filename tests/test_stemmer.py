@@ -19,3 +19,7 @@ class TestStemmer:
 
     def test_stem(self: "TestStemmer", stemmer, word, expected):
         assert stemmer.stem(word) == expected
+
+    def test_stem_many(self: "TestStemmer", stemmer):
+        words = ["کتاب‌هایی", "قدمش", "", "کتاب‌هایی", "خانهٔ", "بزرگ‌ترین"]
+        assert stemmer.stem_many(iter(words)) == [stemmer.stem(word) for word in words]
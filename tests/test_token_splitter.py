@@ -14,3 +14,18 @@ class TestTokenSplitter:
 
     def test_split_token_words(self: "TestTokenSplitter", token_splitter, token, expected):
         assert token_splitter.split_token_words(token) == expected
+
+    @pytest.mark.parametrize(("token", "max_parts", "expected"), [
+
+        ("صداوسیماجمهوری", 2, ("صداوسیما", "جمهوری")),
+        ("کتابخانه‌ملی", 3, ("کتابخانه", "ملی")),
+        ("کتابخانهملیایران", 3, ("کتابخانه", "ملی", "ایران")),
+    ])
+
+    def test_split_token(self: "TestTokenSplitter", token_splitter, token, max_parts, expected):
+        splits = token_splitter.split_token(token, max_parts=max_parts)
+        assert splits[0] == expected
+        assert all(1 <= len(split) <= max_parts for split in splits)
+        assert len(set(splits)) == len(splits)
+        assert token_splitter.split_token(token, max_parts=0) == []
+        assert token_splitter.split_token("") == []
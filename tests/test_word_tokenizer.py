@@ -2,6 +2,8 @@ from typing import Callable
 
 import pytest
 
+from hazm import WordTokenizer
+
 
 class TestWordTokenizer:
 
@@ -48,6 +50,33 @@ class TestWordTokenizer:
         expected = "دیگه میخوام ترک تحصیل کنم 😂 😂 😂"
         assert actual==expected
 
+    @pytest.mark.parametrize(("text", "expected"), [
+        ("امام علی (ع) فرمود", ["امام", "علی", "(ع)", "فرمود"]),
+        ("(ع) و (ص) (س) گفتند", ["(", "ع", ")", "و", "(ص)", "(س)", "گفتند"]),
+        ("سال ه.ش. و ق.م آمد.", ["سال", "ه.ش.", "و", "ق.م", "آمد", "."]),
+        ("ماده م. ق.ر.ر.ک است", ["ماده", "م. ق.ر.ر.ک", "است"]),
+    ])
+    def test_tokenize_when_join_abbreviations_is_true(self: "TestWordTokenizer", text, expected):
+        tokenizer = WordTokenizer(join_verb_parts=False, join_abbreviations=True, replace_numbers=True)
+        assert tokenizer.tokenize(text) == expected
+
+    @pytest.mark.parametrize("options", [
+        {},
+        {"join_verb_parts": False},
+        {"join_abbreviations": True, "separate_emoji": True},
+    ])
+    def test_span_tokenize(self: "TestWordTokenizer", options):
+        tokenizer = WordTokenizer(**options)
+        text = "امام (ع) گفته بود: «این کتاب‌ها  خوانده شده است.»\n📍خبر😂😂 ۱۲.۵"
+        spans = list(tokenizer.span_tokenize(text))
+        tokens = [text[start:end] for start, end in spans]
+        assert [token.replace(" ", "_") for token in tokens] == tokenizer.tokenize(text)
+        assert list(zip(*tokenizer.span_tokenize_array(text))) == spans
+
+    def test_span_tokenize_when_replace_links_is_true(self: "TestWordTokenizer"):
+        with pytest.raises(ValueError, match="replace_"):
+            list(WordTokenizer(replace_links=True).span_tokenize("hazm.ir"))
+
     @pytest.mark.parametrize(("words", "expected"), [
 
         (["خواهد", "رفت"], ["خواهد_رفت"]),
@@ -55,10 +84,15 @@ class TestWordTokenizer:
         (["گفته", "شده", "است"], ["گفته_شده_است"]),
         (["گفته", "خواهد", "شد"], ["گفته_خواهد_شد"]),
         (["خسته", "شدید"], ["خسته_شدید"]),
+        (["او", "فردا", "خواهد"], ["او", "فردا", "خواهد"]),
+        (["دیده", "شده_است", "."], ["دیده_شده_است", "."]),
         ([], []),
     ])
 
     def test_join_verb_parts(self: "TestWordTokenizer", word_tokenizer, words, expected):
         assert word_tokenizer.join_verb_parts(words) == expected
 
-
+    def test_verb_part_ranges(self: "TestWordTokenizer", word_tokenizer):
+        tokens = ["او", "گفته", "خواهد", "شد", "و", "رفته", "است"]
+        assert word_tokenizer.verb_part_ranges(tokens) == [(1, 4), (5, 7)]
+        assert word_tokenizer.verb_part_ranges(["خواهد"]) == []